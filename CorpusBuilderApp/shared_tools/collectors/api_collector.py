@@ -1,5 +1,6 @@
 # sources/api_collector.py
 from ..collectors.base_collector import BaseCollector
+from ..collectors.download_engine import url_host
 from ..project_config import ProjectConfig
 import json
 import requests
@@ -26,7 +27,7 @@ class ApiCollector(BaseCollector):
         self.delay_range = delay_range
         self.api_key = None  # Ensure attribute exists
         self.last_request_time: Dict[str, float] = {}
-        self.rate_limits: Dict[str, Dict[str, int]] = {}  # Format: {'domain': {'requests': 10, 'period': 60}}
+        self.rate_limits: Dict[str, Dict[str, int]] = {}  # Format: {'domain': {'requests': 10, 'period': 60, 'burst': 1}}
     
     def api_request(self, 
                    endpoint: str,
@@ -46,14 +47,8 @@ class ApiCollector(BaseCollector):
         Returns:
             API response as JSON dict or text, or None if request failed
         """
-        if not domain and self.api_base_url:
-            domain = self.api_base_url
-        
-        # Apply rate limiting if configured for this domain
-        if domain in self.rate_limits:
-            self._apply_rate_limit(domain)
-        
         url = f"{self.api_base_url}/{endpoint}" if self.api_base_url else endpoint
+        domain = url_host(domain or url)
         
         # Add API key to parameters if provided
         if self.api_key:
@@ -71,10 +66,12 @@ class ApiCollector(BaseCollector):
         try:
             self.last_request_time[domain] = time.time()
             
+            # Apply rate limiting (unconfigured domains only wait out a Retry-After)
+            wait_for_budget = lambda: self._apply_rate_limit(domain)
             if method.upper() == 'GET':
-                response = self.session.get(url, params=params, headers=headers)
+                response = self._cached_get(url, domain, wait_for_budget, params=params, headers=headers)
             elif method.upper() == 'POST':
-                response = self.session.post(url, json=params, headers=headers)
+                response = self._throttled_request('POST', url, domain, wait_for_budget, json=params, headers=headers)
             else:
                 raise ValueError(f"Unsupported method: {method}")
             
@@ -93,22 +90,23 @@ class ApiCollector(BaseCollector):
     def _apply_rate_limit(self, domain: str) -> None:
         """Apply domain-specific rate limiting.
         
+        Waits on the domain's token bucket, so concurrent requests to other
+        domains are not delayed. Domains without a configured limit only wait
+        while a Retry-After back-off is in force.
+        
         Args:
             domain: Domain to apply rate limiting for
         """
-        current_time = time.time()
-        rate_config = self.rate_limits.get(domain, {})
-        requests_allowed = rate_config.get('requests', 10)
-        period = rate_config.get('period', 60)  # in seconds
-        
-        if domain in self.last_request_time:
-            elapsed = current_time - self.last_request_time[domain]
-            min_interval = period / requests_allowed
-            
-            if elapsed < min_interval:
-                wait_time = min_interval - elapsed
-                self.logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
-                time.sleep(wait_time)
+        rate_config = self._get_rate_limit(domain)
+        if rate_config is None:
+            self.rate_limiter.acquire(domain, None, 0)
+            return
+        self.rate_limiter.acquire(
+            domain,
+            rate_config.get('requests', 10),
+            rate_config.get('period', 60),  # in seconds
+            int(rate_config.get('burst', 1))
+        )
 
 if __name__ == "__main__":
     import argparse
@@ -43,7 +43,10 @@ class ArxivCollector(ApiCollector):
         super().__init__(config, api_base_url='http://export.arxiv.org/api/query', delay_range=delay_range)
         
         self.categories = ['q-fin.CP', 'q-fin.PM', 'q-fin.RM', 'q-fin.ST', 'q-fin.TR']
-        self.rate_limits = {'export.arxiv.org': {'requests': 1, 'period': 3}}  # Max 1 request per 3 seconds
+        self.rate_limits = {
+            'export.arxiv.org': {'requests': 1, 'period': 3},  # Max 1 request per 3 seconds
+            'arxiv.org': {'requests': 1, 'period': 1, 'burst': 2}  # PDF downloads
+        }
         self.logger.setLevel(logging.DEBUG)
         
         if clear_output_dir:
@@ -52,20 +55,8 @@ class ArxivCollector(ApiCollector):
                 shutil.rmtree(self.output_dir)
             Path(self.output_dir).mkdir(parents=True, exist_ok=True)
             
-        # Deduplication: load existing titles cache
-        self.titles_cache = set()
-        if existing_titles and os.path.exists(existing_titles):
-            with open(existing_titles, 'r', encoding='utf-8') as f:
-                self.titles_cache = {line.strip() for line in f}
-        self.logger.info(f"Cache size: {len(self.titles_cache)}")
-        self.logger.info(f"First 5 cache entries: {[ascii_safe(x) for x in list(self.titles_cache)[:5]]}")
-        
-        log_dir = Path(config.log_dir)
-        log_dir.mkdir(parents=True, exist_ok=True)
-        with open(log_dir / 'dedup_debug.log', 'a', encoding='utf-8') as dbg:
-            dbg.write(f"Collector: arxiv, Cache entries: {list(self.titles_cache)[:5]}\n\n")
-            
-        self._normalize_title = lambda t: re.sub(r'[^\w\s]', '', str(t).lower()).strip()
+        # Deduplication: legacy title-cache files are folded into the shared download index
+        self.import_existing_titles(existing_titles)
         
         # Category to domain mapping
         self.category_domain_map = {
@@ -76,10 +67,16 @@ class ArxivCollector(ApiCollector):
             'q-fin.TR': 'high_frequency_trading'  # Trading and Market Microstructure
         }
     
-    def _get_output_path(self, filename, content_type='papers'):
-        """Get the correct output path for arXiv content."""
+    def _get_output_path(self, filename, content_type='papers', category=None):
+        """Get the correct output path for arXiv content.
+        
+        Args:
+            filename: Output file name
+            content_type: Content type directory
+            category: arXiv category deciding the domain (defaults to ``self.current_category``)
+        """
         # Determine domain based on paper category
-        domain = self._determine_domain()
+        domain = self._determine_domain(category)
         return super()._get_output_path(domain, content_type, filename)
     
     def _determine_domain(self, category=None):
@@ -106,18 +103,15 @@ class ArxivCollector(ApiCollector):
                 self.current_category = category
                 results = self._search_by_category(category, max_results, start_index)
                 all_results.extend(results)
-                time.sleep(5)
         else:
             for term in search_terms:
                 results = self._search_by_term(term, max_results, start_index)
                 all_results.extend(results)
-                time.sleep(5)
-        # Deduplication: filter out papers whose normalized title is in the cache
-        if self.titles_cache:
-            before_count = len(all_results)
-            all_results = [p for p in all_results if self._should_skip(p.get('title', ''))]
-            skipped = before_count - len(all_results)
-            self.logger.info(f"Deduplication: Skipped {skipped} results already in the existing titles cache.")
+        # Deduplication: filter out papers that are already in the download index
+        before_count = len(all_results)
+        all_results = [p for p in all_results if not self._should_skip(p)]
+        skipped = before_count - len(all_results)
+        self.logger.info(f"Deduplication: Skipped {skipped} results already in the download index.")
         downloaded_papers = self._download_papers(all_results)
         # Detailed results analysis (match notebook)
         valid_papers = 0
@@ -228,77 +222,77 @@ class ArxivCollector(ApiCollector):
             return []
     
     def _download_papers(self, papers):
-        """Download PDF files for papers"""
-        downloaded = []
+        """Download PDF files for papers (concurrently, rate limited per host)"""
+        papers = [paper for paper in papers if paper.get('pdf_link')]
+        results = self.download_engine.run(self._download_paper, papers)
+        return [paper for paper in results if paper]
+    
+    def _download_paper(self, paper):
+        """Download one paper's PDF and write its .meta file
         
-        for paper in papers:
-            pdf_link = paper.get('pdf_link')
-            if not pdf_link:
-                continue
-                
-            # Create filename from ID
-            arxiv_id = paper.get('arxiv_id', '')
-            if arxiv_id:
-                arxiv_id = re.sub(r'[^\w\.]', '_', arxiv_id)
-                filename = f"{arxiv_id}.pdf"
-            else:
-                # Clean title for filename
-                title = paper.get('title', 'unknown')
-                filename = re.sub(r'[^\w\s-]', '', title).strip().lower()
-                filename = re.sub(r'[-\s]+', '-', filename)
-                filename = f"{filename}.pdf"
+        Runs on a download worker thread, so the domain comes from the paper
+        itself rather than ``self.current_category``.
+        
+        Returns:
+            The paper dict with 'filepath'/'metadata_path' set, or None on failure
+        """
+        pdf_link = paper.get('pdf_link')
+        
+        # Create filename from ID
+        arxiv_id = paper.get('arxiv_id', '')
+        if arxiv_id:
+            arxiv_id = re.sub(r'[^\w\.]', '_', arxiv_id)
+            filename = f"{arxiv_id}.pdf"
+        else:
+            # Clean title for filename
+            title = paper.get('title', 'unknown')
+            filename = re.sub(r'[^\w\s-]', '', title).strip().lower()
+            filename = re.sub(r'[-\s]+', '-', filename)
+            filename = f"{filename}.pdf"
+        
+        # Get output path using domain-based structure
+        domain = self._determine_domain(paper.get('primary_category'))
+        output_path = self._get_output_path(filename, 'papers', category=paper.get('primary_category'))
+        
+        # Download the PDF
+        try:
+            self._download_to(pdf_link, output_path, timeout=60)
             
-            # Set current category for domain determination
-            self.current_category = paper.get('primary_category')
+            # Save metadata
+            meta_path = output_path.with_suffix(output_path.suffix + ".meta")
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'title': paper.get('title'),
+                    'authors': paper.get('authors'),
+                    'published': paper.get('published'),
+                    'summary': paper.get('summary'),
+                    'arxiv_id': paper.get('arxiv_id'),
+                    'primary_category': paper.get('primary_category'),
+                    'pdf_link': pdf_link,
+                    'source': 'arxiv',
+                    'domain': domain,
+                    'download_date': time.strftime('%Y-%m-%d %H:%M:%S')
+                }, f, indent=2)
             
-            # Get output path using domain-based structure
-            output_path = self._get_output_path(filename, 'papers')
+            paper['filepath'] = str(output_path)
+            paper['metadata_path'] = str(meta_path)
+            self._record_download(output_path, arxiv_id=paper.get('arxiv_id'),
+                                  title=paper.get('title'), url=pdf_link)
             
-            # Download the PDF
-            try:
-                response = self.session.get(pdf_link, stream=True)
-                response.raise_for_status()
-                
-                with open(output_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                
-                # Save metadata
-                meta_path = output_path.with_suffix(output_path.suffix + ".meta")
-                with open(meta_path, 'w', encoding='utf-8') as f:
-                    json.dump({
-                        'title': paper.get('title'),
-                        'authors': paper.get('authors'),
-                        'published': paper.get('published'),
-                        'summary': paper.get('summary'),
-                        'arxiv_id': paper.get('arxiv_id'),
-                        'primary_category': paper.get('primary_category'),
-                        'pdf_link': pdf_link,
-                        'source': 'arxiv',
-                        'domain': self._determine_domain(),
-                        'download_date': time.strftime('%Y-%m-%d %H:%M:%S')
-                    }, f, indent=2)
-                
-                paper['filepath'] = str(output_path)
-                paper['metadata_path'] = str(meta_path)
-                downloaded.append(paper)
-                
-                self.logger.info(f"Downloaded: {output_path}")
-                
-            except Exception as e:
-                self.logger.error(f"Error downloading {pdf_link}: {e}")
-                continue
-        
-        return downloaded
+            self.logger.info(f"Downloaded: {output_path}")
+            return paper
+            
+        except Exception as e:
+            self.logger.error(f"Error downloading {pdf_link}: {e}")
+            return None
 
-    def _should_skip(self, title):
-        """Check if a paper should be skipped based on title cache."""
-        norm_title = normalize_title(title)
-        self.logger.debug(f"Normalized title: {ascii_safe(norm_title)}")
-        with open('dedup_debug.log', 'a', encoding='utf-8') as dbg:
-            dbg.write(f"Collector: arxiv, Title: {norm_title}\n")
-        return norm_title in self.titles_cache
+    def _should_skip(self, paper):
+        """Check if a paper was already collected (by arXiv id, title or PDF link)."""
+        return self._already_collected(
+            arxiv_id=paper.get('arxiv_id'),
+            title=paper.get('title'),
+            url=paper.get('pdf_link')
+        )
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Collect papers from arXiv")
@@ -4,9 +4,15 @@ import logging
 import random
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from .download_engine import DownloadEngine, DEFAULT_MAX_WORKERS, url_host
+from .rate_limiter import create_rate_limiter, retry_after_seconds
+from .http_cache import HttpCache, CACHE_RELATIVE_PATH, DEFAULT_TTL
+from .resumable_download import download_resumable
+from ..utils.download_index import DownloadIndex, INDEX_RELATIVE_PATH
 
 class BaseCollector:
     """Base class for all data collectors"""
@@ -56,7 +62,65 @@ class BaseCollector:
         # Create directory structure
         self._setup_domain_directories()
         self.output_dir = self.raw_data_dir
+        
+        # Per-host request budgets: {'host': {'requests': 1, 'period': 3, 'burst': 1}}.
+        # Subclasses set their defaults; collectors.rate_limits in the project config overrides them.
+        # Budgets are shared with every other collector and process using the same limiter database.
+        self.rate_limits: Dict[str, Dict[str, float]] = {}
+        self.rate_limiter = create_rate_limiter(
+            shared=bool(self._get_collector_setting('shared_rate_limits', True)),
+            db_path=self._get_collector_setting('rate_limit_db')
+        )
+        self.max_throttle_retries = int(self._get_collector_setting('max_throttle_retries', 2))
+        
+        # Conditional-GET cache for API responses and pages (collectors.<name>.http_cache_ttl in seconds)
+        self.http_cache_ttl = float(self._get_collector_setting('http_cache_ttl', DEFAULT_TTL))
+        self.http_cache = None
+        if self._get_collector_setting('http_cache', True):
+            try:
+                self.http_cache = HttpCache(self.raw_data_dir / CACHE_RELATIVE_PATH)
+            except Exception as e:
+                self.logger.warning(f"HTTP cache disabled: {e}")
+        
+        # Identifiers of everything already collected into raw_data_dir, checked before each download
+        self.download_index = None
+        if self._get_collector_setting('download_index', True):
+            try:
+                self.download_index = DownloadIndex(self.raw_data_dir / INDEX_RELATIVE_PATH)
+            except Exception as e:
+                self.logger.warning(f"Download index disabled: {e}")
+        self.max_concurrent_downloads = int(self._get_collector_setting('max_concurrent_downloads', DEFAULT_MAX_WORKERS))
+        self.max_in_flight = self._get_collector_setting('max_in_flight')
+        self.download_engine = DownloadEngine(self.max_concurrent_downloads, self.max_in_flight)
+        
         self.session = requests.Session()
+        # One pooled connection per concurrent download
+        adapter = HTTPAdapter(pool_connections=self.max_concurrent_downloads, pool_maxsize=self.max_concurrent_downloads)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    @property
+    def collector_name(self) -> str:
+        """Short name used for per-collector settings (ArxivCollector -> 'arxiv')"""
+        name = self.__class__.__name__.lower()
+        return name[:-len('collector')] if name.endswith('collector') else name
+    
+    def _get_collector_setting(self, key: str, default: Any = None) -> Any:
+        """Read a setting from the project config's ``collectors`` section.
+        
+        ``collectors.<collector_name>.<key>`` takes precedence over ``collectors.<key>``.
+        """
+        getter = getattr(self.config, 'get', None)
+        if not callable(getter):
+            return default
+        for key_path in (f"collectors.{self.collector_name}.{key}", f"collectors.{key}"):
+            try:
+                value = getter(key_path)
+            except Exception:
+                value = None
+            if value is not None:
+                return value
+        return default
     
     def _setup_domain_directories(self):
         """Create domain-based directory structure based on config."""
@@ -113,11 +177,60 @@ class BaseCollector:
         """Main collection method to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement the collect method")
     
+    def _already_collected(self, **identifiers) -> bool:
+        """Check the download index before downloading a document.
+        
+        Args:
+            **identifiers: Any of title, doi, arxiv_id, url, md5
+            
+        Returns:
+            True if any identifier matches a document that was already collected
+        """
+        if self.download_index is None:
+            return False
+        try:
+            match = self.download_index.find(**identifiers)
+        except Exception as e:
+            self.logger.warning(f"Download index lookup failed: {e}")
+            return False
+        if match:
+            self.logger.info(f"Skipping already collected document ({match['kind']}: {match['value']}) -> {match['file_path']}")
+            return True
+        return False
+    
+    def _record_download(self, filepath: Optional[Union[str, Path]], **identifiers) -> None:
+        """Add a successfully downloaded document to the download index (never raises)."""
+        if self.download_index is None:
+            return
+        try:
+            self.download_index.record(filepath, source=self.collector_name, **identifiers)
+        except Exception as e:
+            self.logger.warning(f"Could not record {filepath} in the download index: {e}")
+    
+    def import_existing_titles(self, titles_path: Optional[Union[str, Path]]) -> int:
+        """Load a legacy title-cache text file (one title per line) into the download index."""
+        if not titles_path or not os.path.exists(titles_path) or self.download_index is None:
+            return 0
+        with open(titles_path, 'r', encoding='utf-8') as f:
+            added = self.download_index.import_values('title', (line.strip() for line in f), source='title_cache')
+        self.logger.info(f"Imported {added} new titles from {titles_path} into the download index")
+        return added
+    
+    def download_files(self, downloads: Iterable[Tuple[str, Optional[str], Optional[str]]]) -> List[Optional[Path]]:
+        """Download several files concurrently.
+        
+        Requests to different hosts run in parallel; each host is still held to its rate limit.
+        
+        Args:
+            downloads: (url, filename, subfolder) tuples, as accepted by download_file
+            
+        Returns:
+            Downloaded paths in input order (None for failed downloads)
+        """
+        return self.download_engine.run(lambda job: self.download_file(*job), downloads)
+    
     def download_file(self, url: str, filename: Optional[str] = None, subfolder: Optional[str] = None) -> Optional[Path]:
         """Download a file with rate limiting and random user agent"""
-        # Apply rate limiting
-        self._respect_rate_limits(url)
-        
         # Set destination path
         target_dir = self.output_dir
         if subfolder:
@@ -133,32 +246,121 @@ class BaseCollector:
         
         filepath = target_dir / filename
         
+        if self._already_collected(url=url):
+            return None
+        
         # Download the file
         headers = {'User-Agent': self._get_random_user_agent()}
         
         try:
             self.logger.info(f"Downloading {url} to {filepath}")
-            response = requests.get(url, headers=headers, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            self._download_to(url, filepath, headers=headers)
             
             self.logger.info(f"Successfully downloaded {filepath}")
+            self._record_download(filepath, url=url)
             return filepath
         except Exception as e:
             self.logger.error(f"Error downloading {url}: {e}")
             return None
     
+    def _download_to(self, url: str, filepath: Union[str, Path], headers: Optional[Dict[str, str]] = None,
+                     accept: Optional[Callable[[requests.Response], bool]] = None, timeout: int = 30) -> Path:
+        """Stream ``url`` to ``filepath`` resumably (``.part`` file, Range retries, atomic rename).
+        
+        Every (re)connection is rate limited and honours Retry-After.
+        
+        Args:
+            url: File URL
+            filepath: Final path
+            headers: Extra request headers
+            accept: Optional check of the response before the body is written
+            timeout: Connect/read timeout in seconds
+            
+        Returns:
+            The final path (raises on failure, see ``download_resumable``)
+        """
+        def fetch(range_headers):
+            return self._throttled_request(
+                'GET', url, url_host(url), lambda: self._respect_rate_limits(url),
+                headers={**(headers or {}), **range_headers}, stream=True, timeout=timeout
+            )
+        
+        return download_resumable(fetch, filepath, accept=accept)
+    
+    def _throttled_request(self, method: str, url: str, host: str, wait_for_budget: Callable[[], Any],
+                           **kwargs) -> requests.Response:
+        """Send a request once the host's budget allows it, retrying when the host throttles us.
+        
+        A 429/503 blocks the host in the (shared) rate limiter for its Retry-After
+        interval, so every collector backs off, and the request is retried up to
+        ``max_throttle_retries`` times.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            host: Rate-limit key of the URL
+            wait_for_budget: Called before every attempt; blocks until the request may be sent
+            **kwargs: Passed to ``requests.Session.request``
+            
+        Returns:
+            The last response (callers still check its status)
+        """
+        for attempt in range(self.max_throttle_retries + 1):
+            wait_for_budget()
+            response = self.session.request(method, url, **kwargs)
+            retry_after = retry_after_seconds(response)
+            if retry_after is None:
+                return response
+            self.rate_limiter.penalize(host, retry_after)
+            if attempt == self.max_throttle_retries:
+                return response
+            self.logger.warning(f"{host} throttled {url} ({response.status_code}); retrying after {retry_after:.0f}s")
+            response.close()
+        return response
+    
+    def _cached_get(self, url: str, host: str, wait_for_budget: Callable[[], Any],
+                    params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+                    **kwargs) -> requests.Response:
+        """GET through the HTTP cache.
+        
+        Fresh cached responses cost nothing (not even rate-limit budget); stale
+        ones are revalidated and a 304 reuses the stored body.
+        
+        Args:
+            url: Request URL
+            host: Rate-limit key of the URL
+            wait_for_budget: Called before every network attempt
+            params: Query parameters
+            headers: Request headers
+            **kwargs: Passed to ``requests.Session.request``
+            
+        Returns:
+            Network or cached response
+        """
+        def send(request_headers):
+            return self._throttled_request('GET', url, host, wait_for_budget,
+                                           params=params, headers=request_headers, **kwargs)
+        
+        if self.http_cache is None:
+            return send(headers)
+        return self.http_cache.request(send, url, params=params, headers=headers, ttl=self.http_cache_ttl)
+    
     def _get_random_user_agent(self) -> str:
         """Return a random user agent string"""
         return random.choice(self.USER_AGENTS)
     
+    def _get_rate_limit(self, host: str) -> Optional[Dict[str, float]]:
+        """Configured budget for a host (project config first, then the collector's defaults)"""
+        configured = self._get_collector_setting('rate_limits') or {}
+        return configured.get(host) or self.rate_limits.get(host)
+    
     def _respect_rate_limits(self, url: str) -> None:
-        """Implement rate limiting based on domain"""
-        domain = urlparse(url).netloc
-        delay = random.uniform(*self.delay_range)
-        self.logger.debug(f"Waiting {delay:.2f}s before requesting from {domain}")
-        time.sleep(delay)
\ No newline at end of file
+        """Wait until the URL's host has request budget left.
+        
+        Hosts without a configured limit get one request per mean ``delay_range`` interval.
+        """
+        host = url_host(url)
+        limit = self._get_rate_limit(host)
+        if limit is None:
+            limit = {'requests': 1, 'period': sum(self.delay_range) / 2}
+        self.rate_limiter.acquire(host, limit.get('requests', 1), limit.get('period', 1), int(limit.get('burst', 1)))
\ No newline at end of file
@@ -52,6 +52,8 @@ def normalize_title(title):
     return re.sub(r'[^\w\s]', '', title.lower()).strip()
 
 def load_existing_titles(existing_titles_path):
+    """Read a legacy title-cache file (collectors now consult the shared download index;
+    use ``BaseCollector.import_existing_titles`` to fold such a file into it)."""
     existing_titles = set()
     if existing_titles_path and os.path.exists(existing_titles_path):
         with open(existing_titles_path, 'r', encoding='utf-8') as f:
@@ -148,6 +150,9 @@ class AnnasMainLibraryCollector(BaseCollector):
         # Download top results
         downloaded_files = []
         for result in results[:max_attempts]:
+            # Skip books we already have (same MD5 or title), before paying for the download
+            if self._already_collected(md5=result.get('md5'), title=result.get('title')):
+                continue
             try:
                 filepath = self.client.download_file(result["md5"])
                 if not filepath:
@@ -159,7 +164,7 @@ class AnnasMainLibraryCollector(BaseCollector):
                     logger.error(f"Downloaded file not found at {filepath}")
                     continue
                 output_filename = f"Unknown_{result.get('year', 'Unknown')}_{safe_filename(result['title'], 128)}_{result['md5']}.pdf"
-                domain = get_domain_for_file(str(filepath), text=result['title'], debug=True)
+                domain = get_domain_for_file(str(filepath), text=result['title'], debug=logger.isEnabledFor(logging.DEBUG))
                 logger.info(f"Classified '{result['title']}' into domain: {domain}")
                 if domain != 'unknown':
                     target_dir = self.raw_data_dir / domain / 'papers'
@@ -198,6 +203,7 @@ class AnnasMainLibraryCollector(BaseCollector):
                             logger.error(f"Error deleting duplicate meta file: {e}")
                 else:
                     logger.warning(f"Meta file not found for {filepath}")
+                self._record_download(target_pdf, md5=result['md5'], title=result['title'])
                 downloaded_files.append({
                     'title': result['title'],
                     'filepath': str(target_pdf),
@@ -37,8 +37,6 @@ class UpdatedBitMEXCollector(BaseCollector):
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5"
         })
-        self.titles_cache = set()  # Will be set externally if needed
-        self._normalize_title = lambda title: re.sub(r'[^\w\s]', '', str(title).lower()).strip()
 
     def _get_output_path(self, filename, content_type='articles'):
         """Get the correct output path for BitMEX content."""
@@ -51,15 +49,13 @@ class UpdatedBitMEXCollector(BaseCollector):
 
     def _download_file(self, url, filename):
         filepath = self.bitmex_dir / filename
+        if self._already_collected(url=url):
+            return None
         try:
             self.logger.info(f"Downloading {url} to {filepath}")
-            response = self.session.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            self._download_to(url, filepath)
             self.logger.info(f"Successfully downloaded to {filepath}")
+            self._record_download(filepath, url=url)
             return filepath
         except Exception as e:
             self.logger.error(f"Error downloading {url}: {e}")
@@ -180,12 +176,11 @@ class UpdatedBitMEXCollector(BaseCollector):
                     all_posts.append(post)
                     self.logger.info(f"Found post (fallback): {title}")
             
-            # Deduplication: filter out posts whose normalized title is in the cache
-            if self.titles_cache:
-                before_count = len(all_posts)
-                all_posts = [p for p in all_posts if self._normalize_title(p.get('title', '')) not in self.titles_cache]
-                skipped = before_count - len(all_posts)
-                print(f"Deduplication: Skipped {skipped} results already in the existing titles cache.")
+            # Deduplication: filter out posts that are already in the download index
+            before_count = len(all_posts)
+            all_posts = [p for p in all_posts if not self._already_collected(title=p.get('title'), url=p.get('url'))]
+            skipped = before_count - len(all_posts)
+            print(f"Deduplication: Skipped {skipped} results already in the download index.")
             
             self._save_metadata(all_posts)
             processed_posts = self._process_posts(all_posts, keywords=keywords)
@@ -246,6 +241,7 @@ class UpdatedBitMEXCollector(BaseCollector):
                     html_path = self._save_post_html(post)
                     if html_path:
                         post['saved_html_path'] = str(html_path)
+                        self._record_download(html_path, title=post.get('title'), url=url)
                 processed_posts.append(post)
             except Exception as e:
                 self.logger.error(f"Error processing post {url}: {e}")
@@ -263,19 +259,11 @@ def run_bitmex_collector(args, source_config, base_dir):
     bitmex_keywords = getattr(args, 'bitmex_keywords', None)
     if bitmex_keywords:
         print(f"BitMEX keyword filter enabled: {bitmex_keywords}")
-    # Deduplication: load existing titles cache
-    titles_cache = set()
-    existing_titles_path = getattr(args, 'existing_titles', None)
-    if existing_titles_path and os.path.exists(existing_titles_path):
-        def normalize_title(title):
-            return re.sub(r'[^\w\s]', '', str(title).lower()).strip()
-        with open(existing_titles_path, 'r', encoding='utf-8') as f:
-            titles_cache = {normalize_title(line.strip()) for line in f}
-    def normalize_title(title):
-        return re.sub(r'[^\w\s]', '', str(title).lower()).strip()
     try:
         print("\nStarting updated BitMEX collector test...")
         collector = UpdatedBitMEXCollector(source_dir)
+        # Deduplication: legacy title-cache files are folded into the shared download index
+        collector.import_existing_titles(getattr(args, 'existing_titles', None))
         results = collector.collect(max_pages=getattr(args, 'bitmex_max_pages', 1), keywords=bitmex_keywords)
         print(f"\n===== Updated BitMEXCollector Results =====")
         print(f"Collected {len(results)} research posts")
@@ -332,6 +320,7 @@ if __name__ == "__main__":
     os.makedirs(args.output_dir, exist_ok=True)
     keywords = args.bitmex_keywords if args.bitmex_keywords else None
     collector = UpdatedBitMEXCollector(args.output_dir)
+    collector.import_existing_titles(args.existing_titles)
     results = collector.collect(max_pages=args.bitmex_max_pages, keywords=keywords)
     print(f"\nCollected {len(results)} BitMEX research posts. Output dir: {args.output_dir}")
     if results:
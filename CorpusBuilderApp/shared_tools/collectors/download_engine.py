@@ -0,0 +1,163 @@
+# sources/download_engine.py
+"""
+Concurrent download engine and per-host rate limiting for the collectors.
+
+Collectors used to sleep a random ``delay_range`` interval before every request,
+even when consecutive requests went to different hosts. ``HostRateLimiter``
+instead keeps one token bucket per host: a request only waits for its own
+host's budget, so downloads from different hosts never delay each other and a
+request whose budget is already available does not wait at all.
+
+``DownloadEngine`` runs download jobs on a thread pool (the collectors are built
+on blocking ``requests`` calls, whose socket I/O releases the GIL). The pool size
+is the global concurrency cap and at most ``max_in_flight`` jobs are submitted
+at once, so a 500-paper pull never holds more than a handful of pending jobs or
+response bodies in memory.
+"""
+
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def url_host(url_or_host: str) -> str:
+    """Host used as the rate-limit key for a URL (or a bare host name)."""
+    if not url_or_host:
+        return ''
+    if '://' in url_or_host:
+        url_or_host = urlparse(url_or_host).netloc
+    return url_or_host.split('/')[0].lower()
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second holding at most ``burst`` tokens."""
+
+    def __init__(self, rate: float, burst: int = 1, now: Optional[float] = None):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic() if now is None else now
+
+    def reserve(self, now: Optional[float] = None, blocked_until: float = 0.0) -> float:
+        """Take one token and return how long the caller must wait before using it
+
+        Tokens may go negative: each concurrent caller reserves the next free slot,
+        so waiting callers are spaced ``1 / rate`` seconds apart.
+
+        Args:
+            now: Current time on the clock ``updated`` is measured with (monotonic by default)
+            blocked_until: The host asked us to back off until this time; tokens are
+                reserved from then on
+        """
+        now = time.monotonic() if now is None else now
+        start = max(now, blocked_until)
+        self.tokens = min(self.burst, self.tokens + max(0.0, start - self.updated) * self.rate)
+        self.updated = max(self.updated, start)
+        self.tokens -= 1
+        return (start - now) + max(0.0, -self.tokens / self.rate)
+
+
+class HostRateLimiter:
+    """Thread-safe per-host token buckets."""
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[Tuple[float, int], TokenBucket]] = {}
+        self._blocked_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str, requests: Optional[float], period: float, burst: int = 1) -> float:
+        """Block until a request to ``host`` is allowed
+
+        Args:
+            host: Rate-limit key (see ``url_host``)
+            requests: Requests allowed per ``period`` (None: unlimited, only honour ``penalize``)
+            period: Period in seconds
+            burst: Requests that may be issued back to back after an idle spell
+
+        Returns:
+            float: Seconds waited
+        """
+        with self._lock:
+            now = time.monotonic()
+            blocked_until = self._blocked_until.get(host, 0.0)
+            if not requests or period <= 0:
+                delay = max(0.0, blocked_until - now)
+            else:
+                rate = requests / period
+                entry = self._buckets.get(host)
+                if entry is None or entry[0] != (rate, burst):
+                    entry = ((rate, burst), TokenBucket(rate, burst, now))
+                    self._buckets[host] = entry
+                delay = entry[1].reserve(now, blocked_until)
+        if delay > 0:
+            logger.debug(f"Rate limiting: waiting {delay:.2f}s for {host}")
+            time.sleep(delay)
+        return delay
+
+    def penalize(self, host: str, seconds: float):
+        """Hold all requests to ``host`` for ``seconds`` (e.g. from a Retry-After header)."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._blocked_until[host] = max(self._blocked_until.get(host, 0.0), until)
+
+
+class DownloadEngine:
+    """Run download jobs concurrently with a bounded number of jobs in flight."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, max_in_flight: Optional[int] = None):
+        """Initialize the engine
+
+        Args:
+            max_workers: Concurrent downloads across all hosts
+            max_in_flight: Jobs submitted but not yet collected (defaults to 2 x max_workers)
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.max_in_flight = max(self.max_workers, int(max_in_flight or 2 * self.max_workers))
+
+    def imap(self, func: Callable[[Any], Any], jobs: Iterable[Any]) -> Iterator[Tuple[int, Any, Any, Optional[BaseException]]]:
+        """Run ``func`` on every job, yielding results as they complete
+
+        ``jobs`` is consumed lazily, so it may be a generator.
+
+        Yields:
+            tuple: (job index, job, result, exception) where exactly one of result/exception is set
+        """
+        jobs = iter(enumerate(jobs))
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='download') as executor:
+            pending = {}
+
+            def _fill():
+                while len(pending) < self.max_in_flight:
+                    try:
+                        index, job = next(jobs)
+                    except StopIteration:
+                        return
+                    pending[executor.submit(func, job)] = (index, job)
+
+            _fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, job = pending.pop(future)
+                    try:
+                        result, error = future.result(), None
+                    except Exception as e:
+                        result, error = None, e
+                    yield index, job, result, error
+                _fill()
+
+    def run(self, func: Callable[[Any], Any], jobs: Iterable[Any]) -> List[Any]:
+        """Run ``func`` on every job and return the results in job order (None for jobs that raised)."""
+        results = {}
+        for index, job, result, error in self.imap(func, jobs):
+            if error is not None:
+                logger.error(f"Download job {job!r} failed: {error}")
+            results[index] = result
+        return [results[i] for i in range(len(results))]
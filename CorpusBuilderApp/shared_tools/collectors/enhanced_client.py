@@ -14,6 +14,7 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import NoSuchElementException
 import shutil
 from CryptoFinanceCorpusBuilder.utils.extractor_utils import safe_filename  # type: ignore
+from .resumable_download import download_resumable, DownloadRejected
 
 # Replace load_dotenv("/workspace/notebooks/.env") with project root .env
 load_dotenv(os.path.join(os.path.dirname(__file__), '../../.env'))
@@ -374,36 +375,29 @@ class CookieAuthClient:
                 # Try each download link with detailed debugging
                 for i, download_url in enumerate(all_links_to_try):
                     try:
-                        pdf_response = self.session.get(
-                            download_url,
-                            headers={"Referer": no_redirect_url},
-                            timeout=30
+                        # Stream to disk (resuming on dropped connections) only if we got a PDF
+                        download_resumable(
+                            lambda range_headers: self.session.get(
+                                download_url,
+                                headers={"Referer": no_redirect_url, **range_headers},
+                                stream=True,
+                                timeout=30
+                            ),
+                            output_path,
+                            accept=lambda r: "application/pdf" in r.headers.get("Content-Type", "") or download_url.endswith(".pdf")
                         )
                         
-                        # Check response details
-                        content_type = pdf_response.headers.get("Content-Type", "")
-                        content_length = pdf_response.headers.get("Content-Length", "unknown")
-                        
-                        # Check if we got a PDF
-                        if "application/pdf" in content_type or download_url.endswith(".pdf"):
-                            with open(output_path, "wb") as f:
-                                f.write(pdf_response.content)
-                            
-                            # Verify PDF
-                            if self._verify_pdf(output_path):
-                                return output_path
-                            else:
-                                if os.path.exists(output_path):
-                                    os.remove(output_path)
-                                continue
+                        # Verify PDF
+                        if self._verify_pdf(output_path):
+                            return output_path
                         else:
-                            # Debug: Show first part of response
-                            if pdf_response.text:
-                                preview = pdf_response.text[:300]
-                                if "<html" in preview.lower():
-                                    continue
+                            if os.path.exists(output_path):
+                                os.remove(output_path)
                             continue
                         
+                    except DownloadRejected as e:
+                        e.response.close()
+                        continue
                     except Exception as e:
                         continue
                 
@@ -417,23 +411,26 @@ class CookieAuthClient:
         """Try standard fast_download method"""
         try:
             standard_url = f"https://annas-archive.org/fast_download/{md5}/0/0"
-            standard_response = self.session.get(
-                standard_url,
-                headers={"Referer": detail_url},
-                allow_redirects=True
+            download_resumable(
+                lambda range_headers: self.session.get(
+                    standard_url,
+                    headers={"Referer": detail_url, **range_headers},
+                    allow_redirects=True,
+                    stream=True
+                ),
+                output_path,
+                accept=lambda r: "application/pdf" in r.headers.get("Content-Type", "")
             )
             
-            content_type = standard_response.headers.get("Content-Type", "")
-            if "application/pdf" in content_type:
-                with open(output_path, "wb") as f:
-                    f.write(standard_response.content)
-                
-                if self._verify_pdf(output_path):
-                    return output_path
-                else:
-                    if os.path.exists(output_path):
-                        os.remove(output_path)
+            if self._verify_pdf(output_path):
+                return output_path
+            else:
+                if os.path.exists(output_path):
+                    os.remove(output_path)
             
+            return None
+        except DownloadRejected as e:
+            e.response.close()
             return None
         except Exception:
             return None
@@ -792,15 +789,21 @@ class CookieAuthClient:
             # 3. If found, try to download
             if pdf_url:
                 print(f"[Requests] Found PDF link: {pdf_url}")
-                pdf_response = self.session.get(pdf_url, headers={"Referer": direct_url}, stream=True, timeout=60)
-                content_type = pdf_response.headers.get("Content-Type", "").lower()
-                if "application/pdf" in content_type or "application/octet-stream" in content_type:
-                    # Save to temp file
-                    temp_pdf_path = os.path.join(download_dir, f"temp_{doi.replace('/', '_')}.pdf")
-                    with open(temp_pdf_path, 'wb') as f:
-                        for chunk in pdf_response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
+                temp_pdf_path = os.path.join(download_dir, f"temp_{doi.replace('/', '_')}.pdf")
+                try:
+                    download_resumable(
+                        lambda range_headers: self.session.get(
+                            pdf_url, headers={"Referer": direct_url, **range_headers}, stream=True, timeout=60
+                        ),
+                        temp_pdf_path,
+                        accept=lambda r: any(t in r.headers.get("Content-Type", "").lower()
+                                             for t in ("application/pdf", "application/octet-stream"))
+                    )
+                    content_type = None
+                except DownloadRejected as e:
+                    content_type = e.response.headers.get("Content-Type", "").lower()
+                    e.response.close()
+                if content_type is None:
                     # Check validity
                     if os.path.getsize(temp_pdf_path) > 10000:
                         with open(temp_pdf_path, 'rb') as f:
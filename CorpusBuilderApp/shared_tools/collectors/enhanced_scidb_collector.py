@@ -22,6 +22,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')
 
 from .base_collector import BaseCollector
 from .enhanced_client import CookieAuthClient
+from .resumable_download import download_resumable, DownloadRejected
 
 class SciDBCollector(BaseCollector):
     """Collector for SciDB academic papers with focus on finance and crypto"""
@@ -150,6 +151,9 @@ class SciDBCollector(BaseCollector):
             
             self.logger.info(f"Collecting paper {i+1}/{len(doi_list)}: DOI {doi}")
             
+            if self._already_collected(doi=doi):
+                continue
+            
             try:
                 # First get paper info
                 paper_info = self._search_by_doi(doi)
@@ -199,6 +203,8 @@ class SciDBCollector(BaseCollector):
                         }
                     
                     collected_papers.append(final_paper_info)
+                    self._record_download(final_paper_info['filepath'], doi=doi, title=paper_info.get('title'),
+                                          md5=paper_info.get('md5'))
                     self.logger.info(f"Successfully downloaded paper: {doi}")
                 
                 # Clean up temp directory
@@ -304,21 +310,9 @@ class SciDBCollector(BaseCollector):
             download_url = f"https://annas-archive.org/fast_download/{md5}/0/0"
             self.logger.info(f"Downloading PDF from: {download_url}")
             
-            download_response = self.session.get(
-                download_url,
-                headers={"Referer": detail_url},
-                allow_redirects=True,
-                timeout=60  # Increase timeout for large files
-            )
-            
-            # Check if it's a PDF
-            content_type = download_response.headers.get("Content-Type", "").lower()
+            rejected = self._stream_pdf(download_url, detail_url, filepath)
             
-            if "application/pdf" in content_type:
-                self.logger.info(f"Received PDF content. Saving to file...")
-                with open(filepath, "wb") as f:
-                    f.write(download_response.content)
-                
+            if rejected is None:
                 self.logger.info(f"PDF saved to: {filepath}")
                 
                 # Check if the PDF is valid
@@ -348,7 +342,7 @@ class SciDBCollector(BaseCollector):
                         pass
             else:
                 # If we got HTML instead of PDF, check if it has membership wall
-                if "Become a member" in download_response.text:
+                if "Become a member" in rejected.text:
                     self.logger.error(f"Hit membership wall - authentication may have failed")
                     return None
             
@@ -356,20 +350,8 @@ class SciDBCollector(BaseCollector):
             alt_download_url = f"https://annas-archive.org/fast_download/{md5}/0/1"
             self.logger.info(f"Trying alternative server: {alt_download_url}")
             
-            alt_response = self.session.get(
-                alt_download_url,
-                headers={"Referer": detail_url},
-                allow_redirects=True,
-                timeout=60
-            )
-            
-            # Check if it's a PDF
-            alt_content_type = alt_response.headers.get("Content-Type", "").lower()
-            
-            if "application/pdf" in alt_content_type:
-                self.logger.info(f"Received PDF from alternative server. Saving to file...")
-                with open(filepath, "wb") as f:
-                    f.write(alt_response.content)
+            if self._stream_pdf(alt_download_url, detail_url, filepath) is None:
+                self.logger.info(f"Received PDF from alternative server.")
                 
                 # Check if the PDF is valid
                 if self._check_file_validity(filepath):
@@ -406,6 +388,28 @@ class SciDBCollector(BaseCollector):
             self.logger.error(f"Error downloading file: {e}")
             return None
     
+    def _stream_pdf(self, url, referer, filepath):
+        """Stream a PDF to filepath, resuming if the connection drops
+        
+        Returns:
+            None if the PDF was saved, otherwise the (non-PDF) response that was received
+        """
+        try:
+            download_resumable(
+                lambda range_headers: self.session.get(
+                    url,
+                    headers={"Referer": referer, **range_headers},
+                    allow_redirects=True,
+                    stream=True,
+                    timeout=60  # Increase timeout for large files
+                ),
+                filepath,
+                accept=lambda r: "application/pdf" in r.headers.get("Content-Type", "").lower()
+            )
+            return None
+        except DownloadRejected as e:
+            return e.response
+    
     def _check_file_validity(self, filepath):
         """Check if a file is valid PDF and meets size requirements"""
         try:
@@ -7,7 +7,9 @@ import time
 import pandas as pd
 from pathlib import Path
 from typing import List, Dict, Optional, Union, Any
-from CryptoFinanceCorpusBuilder.shared_tools.collectors.base_collector import BaseCollector
+from .base_collector import BaseCollector
+from .download_engine import url_host
+from ..utils.fred_store import SERIES_INDEX_FILENAME, SERIES_INDEX_COLUMNS, load_series_index
 from dotenv import load_dotenv
 import requests
 
@@ -63,11 +65,9 @@ class FREDCollector(BaseCollector):
         url = f"{self.api_base_url}/{endpoint}"
         
         try:
-            # Apply rate limiting
-            self._respect_rate_limits(url)
-            
-            # Make request
-            response = self.session.get(url, params=params, timeout=30)
+            # Make request (rate limited, served from the HTTP cache while fresh)
+            response = self._cached_get(url, url_host(url), lambda: self._respect_rate_limits(url),
+                                        params=params, timeout=30)
             response.raise_for_status()
             
             # Parse response
@@ -102,43 +102,32 @@ class FREDCollector(BaseCollector):
         """
         self.logger.info("FREDCollector.collect called with series_ids: %s, search_terms: %s, categories: %s, max_results: %d", 
                         series_ids, search_terms, categories, max_results)
-        collected_data = []
+        # Series to fetch, with the metadata already returned by a search/category listing
+        candidates: Dict[str, Optional[Dict[str, Any]]] = {}
         
         # Get series by IDs if provided
-        if series_ids:
-            for series_id in series_ids:
-                series_data = self._get_series(series_id)
-                if series_data:
-                    collected_data.append(series_data)
+        for series_id in series_ids or []:
+            candidates.setdefault(series_id, None)
         
         # Search for series by terms
-        if search_terms:
-            for term in search_terms:
-                search_results = self._search_series(term, max_results=max_results)
-                
-                # Get data for each series
-                for series in search_results[:min(len(search_results), max_results)]:
-                    series_id = series.get('id')
-                    if series_id:
-                        series_data = self._get_series(series_id)
-                        if series_data:
-                            collected_data.append(series_data)
+        for term in search_terms or []:
+            for series in self._search_series(term, max_results=max_results)[:max_results]:
+                if series.get('id'):
+                    candidates[series['id']] = series
         
         # Search by category
-        if categories:
-            for category_id in categories:
-                category_series = self._get_category_series(category_id, max_results=max_results)
-                
-                # Get data for each series
-                for series in category_series[:min(len(category_series), max_results)]:
-                    series_id = series.get('id')
-                    if series_id:
-                        series_data = self._get_series(series_id)
-                        if series_data:
-                            collected_data.append(series_data)
+        for category_id in categories or []:
+            for series in self._get_category_series(category_id, max_results=max_results)[:max_results]:
+                if series.get('id'):
+                    candidates[series['id']] = series
+        
+        # Series are fetched concurrently within the FRED rate limit
+        index = self._load_series_index()
+        jobs = [(series_id, info, index.get(series_id)) for series_id, info in candidates.items()]
+        collected_data = [data for data in self.download_engine.run(lambda job: self._update_series(*job), jobs) if data]
         
         # Write collected data to files
-        saved_files = self._save_series_data(collected_data)
+        saved_files = self._save_series_data(collected_data, index)
         
         return saved_files
     
@@ -173,11 +162,14 @@ class FREDCollector(BaseCollector):
         
         return response['seriess']
     
-    def _get_series(self, series_id: str) -> Optional[Dict[str, Any]]:
+    def _get_series(self, series_id: str, series_info: Optional[Dict[str, Any]] = None,
+                    observation_start: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get detailed information and observations for a series.
         
         Args:
             series_id: FRED series ID to get data for
+            series_info: Series metadata if already known (e.g. from a search listing)
+            observation_start: First observation date to fetch (YYYY-MM-DD); all data if None
             
         Returns:
             Dictionary containing series information and observations, or None if failed
@@ -186,20 +178,10 @@ class FREDCollector(BaseCollector):
             self.logger.error("API key is required for FRED API")
             return None
         
-        # Get series info
-        info_endpoint = f"series"
-        info_params = {
-            'series_id': series_id,
-            'api_key': self.api_key,
-            'file_type': 'json'
-        }
-        
-        info_response = self.api_request(info_endpoint, params=info_params)
-        
-        if not info_response or 'seriess' not in info_response or not info_response['seriess']:
-            return None
-        
-        series_info = info_response['seriess'][0]
+        if series_info is None:
+            series_info = self._get_series_info(series_id)
+            if series_info is None:
+                return None
         
         # Get observations
         obs_endpoint = f"series/observations"
@@ -207,7 +189,7 @@ class FREDCollector(BaseCollector):
             'series_id': series_id,
             'api_key': self.api_key,
             'file_type': 'json',
-            'observation_start': '1900-01-01'  # Get all available data
+            'observation_start': observation_start or '1900-01-01'  # Get all available data
         }
         
         obs_response = self.api_request(obs_endpoint, params=obs_params)
@@ -224,6 +206,64 @@ class FREDCollector(BaseCollector):
             'observations': observations
         }
     
+    def _update_series(self, series_id: str, series_info: Optional[Dict[str, Any]],
+                       stored: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Fetch what is new for a series since it was last stored.
+        
+        Unchanged series (same ``last_updated``) cost no observation request;
+        changed ones only fetch observations after the last stored date.
+        
+        Args:
+            series_id: FRED series ID
+            series_info: Series metadata if already known
+            stored: The series' row in the series index, if it was collected before
+            
+        Returns:
+            Series data dictionary, or None if unchanged or failed
+        """
+        if series_info is None:
+            series_info = self._get_series_info(series_id)
+            if series_info is None:
+                return None
+        if stored is None:
+            return self._get_series(series_id, series_info)
+        
+        if series_info.get('last_updated') == stored.get('last_updated'):
+            self.logger.info(f"Series {series_id} unchanged since last collection; skipping")
+            return None
+        start = None
+        if stored.get('observation_end'):
+            start = (pd.Timestamp(stored['observation_end']) + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+        series_data = self._get_series(series_id, series_info, observation_start=start)
+        if series_data:
+            # Keep the series in the file that holds its earlier observations
+            series_data['domain'] = stored.get('domain')
+        return series_data
+    
+    def _get_series_info(self, series_id: str) -> Optional[Dict[str, Any]]:
+        """Get the metadata of a series.
+        
+        Args:
+            series_id: FRED series ID
+            
+        Returns:
+            Series information dictionary, or None if failed
+        """
+        # Get series info
+        info_endpoint = f"series"
+        info_params = {
+            'series_id': series_id,
+            'api_key': self.api_key,
+            'file_type': 'json'
+        }
+        
+        info_response = self.api_request(info_endpoint, params=info_params)
+        
+        if not info_response or 'seriess' not in info_response or not info_response['seriess']:
+            return None
+        
+        return info_response['seriess'][0]
+    
     def _get_category_series(self, category_id: str, max_results: int = 100) -> List[Dict[str, Any]]:
         """Get series for a specific category.
         
@@ -255,78 +295,97 @@ class FREDCollector(BaseCollector):
         
         return response['seriess']
     
-    def _save_series_data(self, series_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Save series data to CSV and JSON files.
+    def _load_series_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the series metadata index.
+        
+        Returns:
+            Index rows keyed by series ID
+        """
+        # An unreadable index is logged and treated as empty, so every series is refetched
+        return load_series_index(self.fred_dir)
+    
+    def _write_parquet(self, df: pd.DataFrame, path: Path) -> None:
+        """Write a DataFrame to Parquet via a temporary file so readers never see a partial file"""
+        tmp_path = path.with_name(path.name + '.tmp')
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    
+    def _save_series_data(self, series_data_list: List[Dict[str, Any]],
+                          index: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Save series observations to one Parquet file per domain and update the series index.
+        
+        New observations are merged into the domain file (a re-fetched date replaces
+        the stored value), so incremental runs only append. The non-PDF extractor
+        reads each domain file back as one document per series (utils/fred_store.py).
         
         Args:
             series_data_list: List of series data dictionaries
+            index: Series index as returned by ``_load_series_index`` (loaded if None)
             
         Returns:
             List of dictionaries containing metadata about saved files
         """
+        if index is None:
+            index = self._load_series_index()
         saved_files = []
         
+        by_domain: Dict[str, List[Dict[str, Any]]] = {}
         for series_data in series_data_list:
-            series_id = series_data.get('series_id')
-            if not series_id:
+            if series_data.get('series_id'):
+                domain = series_data.get('domain') or self._determine_domain(series_data)
+                by_domain.setdefault(domain, []).append(series_data)
+        
+        for domain, group in by_domain.items():
+            data_path = self.fred_dir / f"{domain}.parquet"
+            frames = [pd.read_parquet(data_path)] if data_path.exists() else []
+            for series_data in group:
+                observations = series_data.get('observations', [])
+                if observations:
+                    df = pd.DataFrame(observations, columns=['date', 'value'])
+                    df.insert(0, 'series_id', series_data['series_id'])
+                    frames.append(df)
+            if not frames:
                 continue
-                
-            # Create clean title for files
-            title = series_data.get('info', {}).get('title', series_id)
-            clean_title = ''.join(c if c.isalnum() or c in ['-', '_', ' '] else '_' for c in title)
-            clean_title = clean_title[:50]  # Limit length
-            domain = 'valuation_models'  # Default domain for FRED data
             
-            # Save JSON with all data
-            json_filename = f"{series_id}_{clean_title}.json"
-            json_path = self.fred_dir / json_filename
-            with open(json_path, 'w') as f:
-                json.dump(series_data, f, indent=2)
-            # Save .meta file for JSON
-            meta_json_path = json_path.with_suffix('.meta')
-            meta_json = {
-                'series_id': series_id,
-                'title': title,
-                'domain': domain,
-                'filetype': 'json',
-                'datafile': str(json_path)
-            }
-            with open(meta_json_path, 'w') as f:
-                json.dump(meta_json, f, indent=2)
-            saved_files.append({
-                'series_id': series_id,
-                'title': title,
-                'filepath': str(json_path),
-                'domain': domain
-            })
+            data = pd.concat(frames, ignore_index=True)
+            data['date'] = pd.to_datetime(data['date'])
+            # FRED reports missing values as '.'
+            data['value'] = pd.to_numeric(data['value'], errors='coerce')
+            data = data.drop_duplicates(['series_id', 'date'], keep='last').sort_values(['series_id', 'date'])
+            self._write_parquet(data, data_path)
             
-            # Save observations as CSV
-            observations = series_data.get('observations', [])
-            if observations:
-                # Convert to pandas DataFrame
-                df = pd.DataFrame(observations)
-                # Save as CSV
-                csv_filename = f"{series_id}_{clean_title}.csv"
-                csv_path = self.fred_dir / csv_filename
-                df.to_csv(csv_path, index=False)
-                # Save .meta file for CSV
-                meta_csv_path = csv_path.with_suffix('.meta')
-                meta_csv = {
+            stats = data.groupby('series_id')['date'].agg(['min', 'max', 'count'])
+            for series_data in group:
+                series_id = series_data['series_id']
+                info = series_data.get('info', {})
+                title = info.get('title', series_id)
+                if series_id in stats.index:
+                    first, last, count = stats.loc[series_id]
+                    first, last, count = first.strftime('%Y-%m-%d'), last.strftime('%Y-%m-%d'), int(count)
+                else:
+                    first, last, count = None, None, 0
+                index[series_id] = {
                     'series_id': series_id,
                     'title': title,
                     'domain': domain,
-                    'filetype': 'csv',
-                    'datafile': str(csv_path)
+                    'datafile': str(data_path),
+                    'frequency': info.get('frequency'),
+                    'units': info.get('units'),
+                    'last_updated': info.get('last_updated'),
+                    'observation_start': first,
+                    'observation_end': last,
+                    'observation_count': count,
                 }
-                with open(meta_csv_path, 'w') as f:
-                    json.dump(meta_csv, f, indent=2)
                 saved_files.append({
                     'series_id': series_id,
                     'title': title,
-                    'filepath': str(csv_path),
+                    'filepath': str(data_path),
                     'domain': domain
                 })
-                
+        
+        if saved_files:
+            self._write_parquet(pd.DataFrame(list(index.values()), columns=SERIES_INDEX_COLUMNS),
+                                self.fred_dir / SERIES_INDEX_FILENAME)
         return saved_files
     
     def _determine_domain(self, series_data: Dict[str, Any]) -> str:
@@ -402,6 +461,8 @@ class FREDCollector(BaseCollector):
                     json.load(f)
             elif path.suffix == '.csv':
                 pd.read_csv(path)
+            elif path.suffix == '.parquet':
+                pd.read_parquet(path)
                 
             return True
         except Exception as e:
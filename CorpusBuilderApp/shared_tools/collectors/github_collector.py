@@ -8,6 +8,9 @@ from pathlib import Path
 from urllib.parse import quote
 from typing import List, Optional, Union, Dict, Any
 from .api_collector import ApiCollector
+from .download_engine import url_host
+from .repo_archive import repo_tarball_url, fetch_repo_files, DEFAULT_MAX_FILE_BYTES, DEFAULT_MAX_TOTAL_BYTES
+from ..utils.extractor_utils import NONPDF_SUPPORTED_EXTENSIONS
 import re
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -39,32 +42,24 @@ class GitHubCollector(ApiCollector):
         """
         super().__init__(config, api_base_url='https://api.github.com', delay_range=delay_range)
         self.api_key: Optional[str] = api_key  # Store for future use if needed
-        self.rate_limits = {'api.github.com': {'requests': 5, 'period': 60}}  # Conservative rate limiting
+        # Unauthenticated search API budget (10/min); short runs can burst
+        self.rate_limits = {
+            'api.github.com': {'requests': 10, 'period': 60, 'burst': 5},
+            'github.com': {'requests': 2, 'period': 1, 'burst': 4},
+        }
+        
+        # 'clone' (git clone --depth 1) or 'tarball' (concurrent filtered archive downloads)
+        self.repo_mode = self._get_collector_setting('repo_mode', 'clone')
+        self.repo_max_file_bytes = int(self._get_collector_setting('repo_max_file_bytes', DEFAULT_MAX_FILE_BYTES))
+        self.repo_max_total_bytes = int(self._get_collector_setting('repo_max_total_bytes', DEFAULT_MAX_TOTAL_BYTES))
         
         # Set up GitHub-specific directory based on environment
         self.github_dir = self.config.raw_data_dir / 'Github'
         self.github_dir.mkdir(parents=True, exist_ok=True)
         self.logger.info(f"GitHub directory set to: {self.github_dir}")
         
-        # Deduplication: load existing titles cache
-        self.titles_cache = set()
-        if existing_titles and os.path.exists(existing_titles):
-            with open(existing_titles, 'r', encoding='utf-8') as f:
-                self.titles_cache = {line.strip() for line in f}
-        self.logger.info(f"Cache size: {len(self.titles_cache)}")
-        self.logger.info(f"First 5 cache entries: {[ascii_safe(x) for x in list(self.titles_cache)[:5]]}")
-        
-        # Ensure config is a ProjectConfig before using .log_dir
-        log_dir = None
-        if hasattr(config, 'log_dir'):
-            log_dir = Path(config.log_dir)
-        else:
-            log_dir = Path.cwd() / 'logs'
-        log_dir.mkdir(parents=True, exist_ok=True)
-        with open(log_dir / 'dedup_debug.log', 'a', encoding='utf-8') as dbg:
-            dbg.write(f"Collector: github, Cache entries: {list(self.titles_cache)[:5]}\n\n")
-            
-        self._normalize_title = lambda t: re.sub(r'[^\w\s]', '', str(t).lower()).strip()
+        # Deduplication: legacy title-cache files are folded into the shared download index
+        self.import_existing_titles(existing_titles)
     
     def _get_output_path(self, filename: str, content_type: str = 'code') -> Path:
         """Get the correct output path for GitHub content.
@@ -117,13 +112,15 @@ class GitHubCollector(ApiCollector):
     def collect(self, 
                 search_terms: Optional[List[str]] = None,
                 topic: Optional[str] = None,
-                max_repos: int = 10) -> List[Dict[str, Any]]:
+                max_repos: int = 10,
+                mode: Optional[str] = None) -> List[Dict[str, Any]]:
         """Collect repositories based on search terms or topics.
         
         Args:
             search_terms: List of search terms to find repositories
             topic: GitHub topic to search for
             max_repos: Maximum number of repositories to collect
+            mode: 'clone' or 'tarball' (defaults to the ``repo_mode`` setting)
             
         Returns:
             List of collected repository information
@@ -142,36 +139,89 @@ class GitHubCollector(ApiCollector):
                 results = self._search_by_term(term, max_repos // len(search_terms))
                 repos.extend(results)
         
-        # Deduplication: filter out repos whose normalized name is in the cache
-        if self.titles_cache:
-            before_count = len(repos)
-            repos = [r for r in repos if not self._should_skip(r.get('name', ''))]
-            skipped = before_count - len(repos)
-            self.logger.info(f"Deduplication: Skipped {skipped} results already in the existing titles cache.")
+        # Deduplication: filter out repos that are already in the download index
+        before_count = len(repos)
+        repos = [r for r in repos if not self._should_skip(r.get('name', ''), r.get('html_url'))]
+        skipped = before_count - len(repos)
+        self.logger.info(f"Deduplication: Skipped {skipped} results already in the download index.")
         
-        # Clone repositories
-        cloned_repos = []
-        for repo in repos:
-            clone_url = repo.get('clone_url')
-            if clone_url:
-                # Clone to a directory named after the repo
-                repo_name = repo.get('name', 'unknown')
-                owner = repo.get('owner', {}).get('login', 'unknown')
-                
-                # Use the domain-based directory structure
-                filename = f"{owner}_{repo_name}"
-                target_dir = self._get_output_path(filename, 'code')
-                
-                # Clone the repository
-                result = self._clone_repo(clone_url, target_dir)
-                
-                if result:
-                    repo['local_path'] = str(target_dir)
-                    repo['domain'] = self._determine_domain(repo)
-                    cloned_repos.append(repo)
+        return self._acquire_repos(repos, mode)
+    
+    def _repo_target_dir(self, repo: Dict[str, Any]) -> Path:
+        """Directory a repository is saved to (``<owner>_<name>`` in the GitHub directory)"""
+        repo_name = repo.get('name', 'unknown')
+        owner = repo.get('owner', {}).get('login', 'unknown')
+        return self._get_output_path(f"{owner}_{repo_name}", 'code')
+    
+    def _acquire_repos(self, repos: List[Dict[str, Any]], mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Clone or fetch repositories and record the ones that were saved.
+        
+        Args:
+            repos: Repository information dictionaries (GitHub API format)
+            mode: 'clone' or 'tarball' (defaults to the ``repo_mode`` setting)
+            
+        Returns:
+            The repositories that were saved, with local_path and domain set
+        """
+        mode = mode or self.repo_mode
+        if mode == 'tarball':
+            # Archives from different repos download concurrently within the github.com budget
+            paths = self.download_engine.run(self._fetch_repo_tarball, repos)
+        else:
+            paths = [
+                self._clone_repo(repo['clone_url'], self._repo_target_dir(repo)) if repo.get('clone_url') else None
+                for repo in repos
+            ]
+        
+        collected = []
+        for repo, path in zip(repos, paths):
+            if path:
+                repo['local_path'] = str(path)
+                repo['domain'] = self._determine_domain(repo)
+                collected.append(repo)
+                self._record_download(path, title=repo.get('name'), url=repo.get('html_url'))
+        
+        self.logger.info(f"Collected {len(collected)} repositories ({mode})")
+        return collected
+    
+    def _fetch_repo_tarball(self, repo: Dict[str, Any]) -> Optional[Path]:
+        """Fetch a repository's archive, keeping only files the non-PDF extractor supports.
+        
+        The tarball is filtered while it streams in, so the full working tree is
+        never written to disk.
+        
+        Args:
+            repo: Repository information dictionary (GitHub API format)
+            
+        Returns:
+            Path to the repository directory, or None if the download failed
+        """
+        target_dir = self._repo_target_dir(repo)
+        if target_dir.exists():
+            self.logger.info(f"Repository already exists at {target_dir}")
+            return target_dir
+        
+        url = repo_tarball_url(repo.get('owner', {}).get('login', ''), repo.get('name', ''), repo.get('default_branch'))
+        self.logger.info(f"Fetching repository archive: {url}")
+        try:
+            stats = fetch_repo_files(
+                lambda: self._throttled_request(
+                    'GET', url, url_host(url), lambda: self._respect_rate_limits(url), stream=True, timeout=60
+                ),
+                target_dir,
+                NONPDF_SUPPORTED_EXTENSIONS,
+                max_file_bytes=self.repo_max_file_bytes,
+                max_total_bytes=self.repo_max_total_bytes
+            )
+        except Exception as e:
+            self.logger.error(f"Error fetching repository archive {url}: {e}")
+            return None
         
-        self.logger.info(f"Cloned {len(cloned_repos)} repositories")
-        return cloned_repos
+        self.logger.info(
+            f"Saved {stats['kept']} files ({stats['bytes']} bytes) to {target_dir}; "
+            f"skipped {stats['skipped']} unsupported and {stats['oversized']} oversized files"
+        )
+        return target_dir
     
     def _search_by_topic(self, topic: str, max_repos: int = 10) -> List[Dict[str, Any]]:
         """Search GitHub repositories by topic.
@@ -239,23 +289,17 @@ class GitHubCollector(ApiCollector):
             self.logger.error(f"STDERR: {e.stderr}")
             return None
 
-    def _should_skip(self, repo_name: str) -> bool:
-        """Check if a repository should be skipped based on its name.
+    def _should_skip(self, repo_name: str, repo_url: Optional[str] = None) -> bool:
+        """Check if a repository should be skipped based on its name or URL.
         
         Args:
             repo_name: Name of the repository
+            repo_url: Repository web URL
             
         Returns:
             True if the repository should be skipped, False otherwise
         """
-        norm_title = normalize_title(repo_name)
-        self.logger.debug(f"Normalized title: {ascii_safe(norm_title)}")
-        
-        log_dir = Path(self.config.log_dir)
-        with open(log_dir / 'dedup_debug.log', 'a', encoding='utf-8') as dbg:
-            dbg.write(f"Collector: github, Title: {norm_title}\n")
-            
-        return norm_title in self.titles_cache
+        return self._already_collected(title=repo_name, url=repo_url)
 
     def _download_repo(self, 
                       repo_url: str,
@@ -281,23 +325,21 @@ class GitHubCollector(ApiCollector):
         zip_url = f"{repo_url}/archive/refs/heads/master.zip"
         self.logger.info(f"Downloading {zip_url} to {target_path}")
         try:
-            response = self.session.get(zip_url, stream=True)
-            response.raise_for_status()
-            with open(target_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            self._download_to(zip_url, target_path, timeout=60)
             self.logger.info(f"Successfully downloaded {target_path}")
+            self._record_download(target_path, title=repo_name, url=repo_url)
             return target_path
         except Exception as e:
             self.logger.error(f"Error downloading {zip_url}: {e}")
             return None
 
-    def collect_by_repo(self, repo_info: Union[Dict[str, str], List[Dict[str, str]]]) -> List[Dict[str, Any]]:
+    def collect_by_repo(self, repo_info: Union[Dict[str, str], List[Dict[str, str]]],
+                        mode: Optional[str] = None) -> List[Dict[str, Any]]:
         """Collect specific repositories by owner and repo name.
         
         Args:
             repo_info: Dictionary with 'owner' and 'repo' keys, or list of such dictionaries
+            mode: 'clone' or 'tarball' (defaults to the ``repo_mode`` setting)
             
         Returns:
             List of collected repository information
@@ -307,7 +349,7 @@ class GitHubCollector(ApiCollector):
         else:
             repos = [repo_info]
             
-        cloned_repos = []
+        repo_data_list = []
         for repo in repos:
             owner = repo.get('owner')
             repo_name = repo.get('repo')
@@ -324,21 +366,9 @@ class GitHubCollector(ApiCollector):
                 self.logger.error(f"Failed to get repository data for {owner}/{repo_name}")
                 continue
                 
-            # Clone repository
-            clone_url = repo_data.get('clone_url')
-            if clone_url:
-                filename = f"{owner}_{repo_name}"
-                target_dir = self._get_output_path(filename, 'code')
-                
-                result = self._clone_repo(clone_url, target_dir)
-                
-                if result:
-                    repo_data['local_path'] = str(target_dir)
-                    repo_data['domain'] = self._determine_domain(repo_data)
-                    cloned_repos.append(repo_data)
+            repo_data_list.append(repo_data)
         
-        self.logger.info(f"Cloned {len(cloned_repos)} repositories")
-        return cloned_repos
+        return self._acquire_repos(repo_data_list, mode)
 
 if __name__ == "__main__":
     import argparse
@@ -351,6 +381,7 @@ if __name__ == "__main__":
     parser.add_argument("--topic", type=str, help="GitHub topic to search for")
     parser.add_argument("--max-repos", type=int, default=10, help="Maximum number of repositories to collect")
     parser.add_argument("--existing-titles", type=str, help="Path to file with existing repo titles for deduplication")
+    parser.add_argument("--mode", choices=["clone", "tarball"], help="Clone repositories or fetch filtered archives concurrently")
     
     args = parser.parse_args()
     
@@ -361,7 +392,8 @@ if __name__ == "__main__":
     results = collector.collect(
         search_terms=args.search_terms,
         topic=args.topic,
-        max_repos=args.max_repos
+        max_repos=args.max_repos,
+        mode=args.mode
     )
     
     print(f"Collected {len(results)} GitHub records. Output dir: {collector.output_dir}")
\ No newline at end of file
@@ -0,0 +1,146 @@
+# sources/http_cache.py
+"""
+Local HTTP response cache with conditional-GET revalidation.
+
+Collector GET responses (API search results, series metadata, HTML pages) are
+stored in ``<raw_data_dir>/.cache/http_cache.sqlite`` with their ETag and
+Last-Modified validators. Within the collector's TTL a cached response is served
+without touching the network; after it, the request is revalidated with
+``If-None-Match``/``If-Modified-Since`` and a ``304 Not Modified`` answer reuses
+the stored body. File downloads (streamed) are not cached here.
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+CACHE_RELATIVE_PATH = Path('.cache') / 'http_cache.sqlite'
+DEFAULT_TTL = 24 * 3600
+# Larger bodies are files, not pages; they are not worth keeping twice
+MAX_BODY_BYTES = 20 * 1024 * 1024
+# Query parameters that identify the caller, not the resource; never part of the key or stored URL
+SECRET_PARAMS = ('api_key', 'apikey', 'access_token', 'token', 'key')
+_KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+def cache_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Stable key of a request (secret parameters excluded)."""
+    public = sorted((str(k), str(v)) for k, v in (params or {}).items() if k.lower() not in SECRET_PARAMS)
+    return hashlib.sha256(json.dumps([method.upper(), url, public]).encode('utf-8')).hexdigest()
+
+
+def _cached_response(url: str, headers: Dict[str, str], body: bytes) -> requests.Response:
+    """Rebuild a ``requests.Response`` from a cache entry."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = body
+    response.from_cache = True
+    return response
+
+
+class HttpCache:
+    """SQLite store of GET responses and their validators."""
+
+    def __init__(self, path: Union[str, Path]):
+        """Open (creating if needed) the cache database
+
+        Args:
+            path: SQLite file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self.stats = {'fresh': 0, 'revalidated': 0, 'fetched': 0}
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, url TEXT, headers TEXT, body BLOB, fetched_at REAL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections must stay on the thread that opened them
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            "SELECT url, headers, body, fetched_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {'url': row[0], 'headers': json.loads(row[1]), 'body': row[2], 'fetched_at': row[3]}
+
+    def put(self, key: str, url: str, response: requests.Response):
+        """Store a 200 response (unless it is too large or marked no-store)."""
+        if 'no-store' in response.headers.get('Cache-Control', ''):
+            return
+        body = response.content
+        if len(body) > MAX_BODY_BYTES:
+            return
+        headers = {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers}
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, url, headers, body, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (key, url, json.dumps(headers), sqlite3.Binary(body), time.time())
+            )
+
+    def touch(self, key: str):
+        """Mark a revalidated entry as fresh again."""
+        with self._connect() as conn:
+            conn.execute("UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key))
+
+    def request(self, send, url: str, params: Optional[Dict[str, Any]] = None,
+                headers: Optional[Dict[str, str]] = None, ttl: float = DEFAULT_TTL) -> requests.Response:
+        """GET through the cache
+
+        Args:
+            send: ``send(headers)`` performs the real GET with the given headers and returns the response
+            url: Request URL (without query string)
+            params: Query parameters
+            headers: Request headers
+            ttl: Seconds a stored response is served without revalidation (0: always revalidate)
+
+        Returns:
+            The network response, or a response rebuilt from the cache (``from_cache`` set)
+        """
+        key = cache_key('GET', url, params)
+        entry = self.get(key)
+        headers = dict(headers or {})
+        if entry is not None:
+            if time.time() - entry['fetched_at'] < ttl:
+                self.stats['fresh'] += 1
+                return _cached_response(entry['url'], entry['headers'], entry['body'])
+            if 'ETag' in entry['headers']:
+                headers['If-None-Match'] = entry['headers']['ETag']
+            if 'Last-Modified' in entry['headers']:
+                headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+
+        response = send(headers)
+        if response.status_code == 304 and entry is not None:
+            self.touch(key)
+            self.stats['revalidated'] += 1
+            return _cached_response(entry['url'], entry['headers'], entry['body'])
+        self.stats['fetched'] += 1
+        if response.status_code == 200:
+            try:
+                self.put(key, url, response)
+            except sqlite3.Error as e:
+                logger.debug(f"Could not cache response for {url}: {e}")
+        return response
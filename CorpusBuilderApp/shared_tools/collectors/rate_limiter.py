@@ -0,0 +1,148 @@
+# sources/rate_limiter.py
+"""
+Token-bucket rate limiter shared by all collectors in all processes.
+
+``HostRateLimiter`` only coordinates threads of one collector instance. When the
+UI runs several collector wrappers, or CLI collectors run side by side, each
+would otherwise spend the full per-host budget on its own and the hosts answer
+with 429s. ``SharedRateLimiter`` keeps the buckets in a small SQLite database
+(one row per host) and reserves tokens inside ``BEGIN IMMEDIATE`` transactions,
+so every process sees and updates the same budget. A ``Retry-After`` from any
+collector blocks the host for all of them.
+"""
+
+import time
+import sqlite3
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Optional, Union
+
+from .download_engine import HostRateLimiter, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path.home() / '.cache' / 'corpus_builder' / 'rate_limits.sqlite'
+THROTTLE_STATUS_CODES = (429, 503)
+# Back-off when a 429/503 comes without a usable Retry-After header
+DEFAULT_RETRY_AFTER = 30.0
+MAX_RETRY_AFTER = 3600.0
+
+
+def retry_after_seconds(response, default: Optional[float] = DEFAULT_RETRY_AFTER) -> Optional[float]:
+    """Seconds a throttled response asks us to wait
+
+    Args:
+        response: ``requests`` response
+        default: Returned for a throttled response without a parseable Retry-After
+
+    Returns:
+        Seconds to back off (capped at an hour), or None if the response is not throttled
+    """
+    if response is None or response.status_code not in THROTTLE_STATUS_CODES:
+        return None
+    value = response.headers.get('Retry-After')
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return default
+    return min(max(0.0, seconds), MAX_RETRY_AFTER)
+
+
+class SharedRateLimiter:
+    """Per-host token buckets stored in SQLite and shared across processes."""
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_DB_PATH):
+        """Open (creating if needed) the shared bucket database
+
+        Args:
+            db_path: SQLite file; every process using the same file shares its budgets
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "host TEXT PRIMARY KEY, tokens REAL, updated REAL, blocked_until REAL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections must stay on the thread that opened them
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def acquire(self, host: str, requests: Optional[float], period: float, burst: int = 1) -> float:
+        """Block until a request to ``host`` is allowed (same contract as ``HostRateLimiter.acquire``)."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Wall-clock time: the only clock all processes agree on
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated, blocked_until FROM buckets WHERE host = ?", (host,)
+            ).fetchone()
+            blocked_until = row[2] if row else 0.0
+            if not requests or period <= 0:
+                delay = max(0.0, blocked_until - now)
+            else:
+                bucket = TokenBucket(requests / period, burst, now)
+                if row:
+                    bucket.tokens, bucket.updated = row[0], row[1]
+                delay = bucket.reserve(now, blocked_until)
+                conn.execute(
+                    "INSERT OR REPLACE INTO buckets (host, tokens, updated, blocked_until) VALUES (?, ?, ?, ?)",
+                    (host, bucket.tokens, bucket.updated, blocked_until)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if delay > 0:
+            logger.debug(f"Rate limiting: waiting {delay:.2f}s for {host}")
+            time.sleep(delay)
+        return delay
+
+    def penalize(self, host: str, seconds: float):
+        """Hold all requests to ``host`` from every process for ``seconds``."""
+        until = time.time() + seconds
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO buckets (host, tokens, updated, blocked_until) VALUES (?, 0, ?, ?) "
+                "ON CONFLICT(host) DO UPDATE SET blocked_until = MAX(blocked_until, excluded.blocked_until)",
+                (host, until, until)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        logger.info(f"{host} asked to back off; holding requests for {seconds:.0f}s")
+
+
+def create_rate_limiter(shared: bool = True, db_path: Optional[Union[str, Path]] = None):
+    """Shared limiter if requested and its database is usable, otherwise a per-instance one
+
+    Args:
+        shared: Coordinate with other collectors and processes
+        db_path: Shared database file (defaults to ``DEFAULT_DB_PATH``)
+
+    Returns:
+        SharedRateLimiter or HostRateLimiter
+    """
+    if shared:
+        try:
+            return SharedRateLimiter(db_path or DEFAULT_DB_PATH)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Shared rate limiter unavailable ({e}); limiting per collector instance")
+    return HostRateLimiter()
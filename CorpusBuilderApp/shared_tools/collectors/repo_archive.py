@@ -0,0 +1,121 @@
+# sources/repo_archive.py
+"""
+Filtered repository acquisition from archive tarballs.
+
+A ``git clone`` writes the whole working tree (and a packfile) to disk although
+the non-PDF extractor only reads a handful of file types. Here the repository's
+``.tar.gz`` archive is streamed straight from the HTTP response through
+``tarfile`` in stream mode: only regular files whose extension is wanted and
+whose size is within the caps are written, everything else is read past and
+dropped. Files land in ``<target>.part`` and the directory is renamed onto the
+target once the archive has been read completely.
+"""
+
+import os
+import shutil
+import tarfile
+import logging
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, Iterable, Optional, Union
+
+import requests
+
+from .resumable_download import PART_SUFFIX, DEFAULT_READ_SIZE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_FILE_BYTES = 5 * 1024 * 1024
+DEFAULT_MAX_TOTAL_BYTES = 200 * 1024 * 1024
+
+
+def repo_tarball_url(owner: str, repo: str, ref: Optional[str] = None) -> str:
+    """Archive URL of a GitHub repository (default branch when ``ref`` is not given)."""
+    return f"https://github.com/{owner}/{repo}/archive/{ref or 'HEAD'}.tar.gz"
+
+
+def _member_path(name: str) -> Optional[Path]:
+    """Archive member path relative to the repository root, or None if unsafe."""
+    parts = PurePosixPath(name).parts[1:]  # drop the '<repo>-<sha>/' top-level directory
+    if not parts or any(part in ('', '.', '..') for part in parts) or PurePosixPath(name).is_absolute():
+        return None
+    return Path(*parts)
+
+
+def extract_filtered(fileobj, target_dir: Union[str, Path], extensions: Iterable[str],
+                     max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+                     max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES) -> Dict[str, int]:
+    """Extract the wanted files of a (compressed) tar stream
+
+    Args:
+        fileobj: Readable binary stream of the archive (read once, front to back)
+        target_dir: Directory the repository files are written to
+        extensions: File extensions to keep (e.g. ``{'.py', '.md'}``)
+        max_file_bytes: Larger files are skipped
+        max_total_bytes: Extraction stops once this many bytes were written
+
+    Returns:
+        dict: Counts of kept, skipped and oversized files and bytes written
+    """
+    target_dir = Path(target_dir)
+    extensions = {ext.lower() for ext in extensions}
+    stats = {'kept': 0, 'skipped': 0, 'oversized': 0, 'bytes': 0}
+    with tarfile.open(fileobj=fileobj, mode='r|*') as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            rel_path = _member_path(member.name)
+            if rel_path is None or rel_path.suffix.lower() not in extensions:
+                stats['skipped'] += 1
+                continue
+            if member.size > max_file_bytes:
+                stats['oversized'] += 1
+                continue
+            if stats['bytes'] + member.size > max_total_bytes:
+                logger.warning(f"Size cap of {max_total_bytes} bytes reached; remaining files skipped")
+                break
+            dest = target_dir / rel_path
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            with tar.extractfile(member) as src, open(dest, 'wb') as f:
+                shutil.copyfileobj(src, f, DEFAULT_READ_SIZE)
+            stats['kept'] += 1
+            stats['bytes'] += member.size
+    return stats
+
+
+def fetch_repo_files(send: Callable[[], requests.Response], target_dir: Union[str, Path], extensions: Iterable[str],
+                     max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+                     max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES) -> Dict[str, int]:
+    """Stream a repository tarball into ``target_dir``, keeping only wanted files
+
+    Args:
+        send: ``send()`` issues the archive GET with ``stream=True``
+        target_dir: Final repository directory (must not exist yet)
+        extensions: File extensions to keep
+        max_file_bytes: Larger files are skipped
+        max_total_bytes: Cap on the bytes written for the repository
+
+    Returns:
+        dict: Extraction counts (see ``extract_filtered``)
+
+    Raises:
+        requests.RequestException: HTTP error status or connection failure
+        tarfile.TarError: The response is not a readable tar archive
+    """
+    target_dir = Path(target_dir)
+    staging = target_dir.with_name(target_dir.name + PART_SUFFIX)
+    if staging.exists():
+        shutil.rmtree(staging)
+    response = send()
+    try:
+        response.raise_for_status()
+        # A gzip Content-Encoding is undone here; the tar.gz itself is decompressed by tarfile
+        response.raw.decode_content = True
+        staging.mkdir(parents=True)
+        stats = extract_filtered(response.raw, staging, extensions, max_file_bytes, max_total_bytes)
+        os.replace(staging, target_dir)
+        return stats
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    finally:
+        response.close()
@@ -1,5 +1,8 @@
 # sources/repo_collector.py
 from CryptoFinanceCorpusBuilder.shared_tools.collectors.base_collector import BaseCollector
+from CryptoFinanceCorpusBuilder.shared_tools.collectors.download_engine import url_host
+from CryptoFinanceCorpusBuilder.shared_tools.collectors.repo_archive import fetch_repo_files, repo_tarball_url
+from CryptoFinanceCorpusBuilder.shared_tools.utils.extractor_utils import NONPDF_SUPPORTED_EXTENSIONS
 import subprocess
 import os
 import shutil
@@ -50,6 +53,38 @@ class RepoCollector(BaseCollector):
             self.logger.error(f"STDERR: {e.stderr}")
             return None
     
+    def fetch_repo_files(self, repo_url, target_dir=None, branch=None, extensions=None):
+        """Fetch only the supported files of a GitHub repository from its tarball (no clone, no full tree)"""
+        parts = repo_url.rstrip('/').split('/')
+        if 'github.com' not in repo_url or len(parts) < 5:
+            self.logger.error(f"Unsupported repository URL format: {repo_url}")
+            return None
+        owner, repo = parts[-2], parts[-1]
+        if repo.endswith('.git'):
+            repo = repo[:-4]
+        target_dir = Path(target_dir) if target_dir else self.output_dir / repo
+        
+        # Skip if already exists
+        if target_dir.exists():
+            self.logger.info(f"Repository already exists at {target_dir}")
+            return target_dir
+        
+        url = repo_tarball_url(owner, repo, branch)
+        try:
+            self.logger.info(f"Fetching repository archive: {url}")
+            stats = fetch_repo_files(
+                lambda: self._throttled_request(
+                    'GET', url, url_host(url), lambda: self._respect_rate_limits(url), stream=True, timeout=60
+                ),
+                target_dir,
+                extensions or NONPDF_SUPPORTED_EXTENSIONS
+            )
+            self.logger.info(f"Saved {stats['kept']} of {stats['kept'] + stats['skipped'] + stats['oversized']} files to {target_dir}")
+            return target_dir
+        except Exception as e:
+            self.logger.error(f"Error fetching repository archive {url}: {e}")
+            return None
+    
     def download_repo_archive(self, repo_url, archive_format='zip'):
         """Download repository as an archive instead of cloning"""
         if 'github.com' in repo_url:
@@ -133,13 +168,18 @@ if __name__ == "__main__":
     parser.add_argument("--branch", type=str, help="Branch to clone (default: main/master)")
     parser.add_argument("--archive", action="store_true", help="Download as archive instead of cloning")
     parser.add_argument("--extract", action="store_true", help="Extract the downloaded archive (only with --archive)")
+    parser.add_argument("--filtered", action="store_true", help="Fetch only supported file types from the repository tarball")
     args = parser.parse_args()
     from pathlib import Path
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     collector = RepoCollector(output_dir, clone_depth=args.clone_depth)
     results = []
-    if args.archive:
+    if args.filtered:
+        repo_path = collector.fetch_repo_files(args.query, branch=args.branch)
+        if repo_path:
+            results.append(str(repo_path))
+    elif args.archive:
         archive_path = collector.download_repo_archive(args.query)
         if args.extract and archive_path:
             extracted = collector.extract_archive(archive_path)
@@ -0,0 +1,146 @@
+# sources/resumable_download.py
+"""
+Resumable streamed downloads.
+
+The body is written to ``<dest>.part`` through a large write buffer. If the
+connection drops, the retry asks for the remaining bytes with a ``Range``
+header and appends them, so a multi-hundred-MB book does not restart from zero
+(a later run resumes a ``.part`` left behind the same way). The finished file is
+checked against the advertised length and only then renamed onto ``dest``,
+so ``dest`` never holds a truncated file.
+"""
+
+import os
+import re
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+PART_SUFFIX = '.part'
+DEFAULT_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer
+# Reads stay small: a read interrupted by a dropped connection loses its partial bytes
+DEFAULT_READ_SIZE = 64 * 1024
+DEFAULT_MAX_RETRIES = 3
+_CONTENT_RANGE = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+|\*)')
+_UNSATISFIED_RANGE = re.compile(r'bytes\s+\*/(\d+)')
+_RETRYABLE = (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError,
+              requests.exceptions.Timeout)
+
+
+class IncompleteDownload(IOError):
+    """The body ended before the advertised length."""
+
+
+class DownloadRejected(Exception):
+    """The response is not the expected file (e.g. an HTML page instead of a PDF)."""
+
+    def __init__(self, response: requests.Response):
+        super().__init__(f"Rejected response from {response.url} ({response.headers.get('Content-Type', '')})")
+        self.response = response
+
+
+def part_path(dest: Union[str, Path]) -> Path:
+    dest = Path(dest)
+    return dest.with_name(dest.name + PART_SUFFIX)
+
+
+def _expected_size(response: requests.Response, offset: int) -> Optional[int]:
+    """Final file size the response promises, if it can be known."""
+    if response.headers.get('Content-Encoding', 'identity') not in ('identity', ''):
+        # iter_content decodes, so the bytes written differ from Content-Length
+        return None
+    if response.status_code == 206:
+        match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+        if match and match.group(3) != '*':
+            return int(match.group(3))
+    length = response.headers.get('Content-Length')
+    if length is None or not length.isdigit():
+        return None
+    return offset + int(length) if response.status_code == 206 else int(length)
+
+
+def download_resumable(fetch: Callable[[Dict[str, str]], requests.Response], dest: Union[str, Path],
+                       accept: Optional[Callable[[requests.Response], bool]] = None,
+                       buffer_size: int = DEFAULT_BUFFER_SIZE, max_retries: int = DEFAULT_MAX_RETRIES) -> Path:
+    """Stream a download to ``dest`` via a ``.part`` file, resuming with Range requests
+
+    Args:
+        fetch: ``fetch(headers)`` sends the GET (with ``stream=True``) adding the given headers
+        dest: Final path
+        accept: Optional check of a response before its body is written
+        buffer_size: Write-buffer size in bytes
+        max_retries: Reconnect attempts after a dropped or short transfer
+
+    Returns:
+        Path: ``dest``
+
+    Raises:
+        DownloadRejected: ``accept`` returned False (the response is left unread on the exception)
+        IncompleteDownload: Still short after ``max_retries`` retries (the ``.part`` file is kept)
+        requests.RequestException: HTTP error status or connection failure
+    """
+    dest = Path(dest)
+    part = part_path(dest)
+    for attempt in range(max_retries + 1):
+        offset = part.stat().st_size if part.exists() else 0
+        # Ranges count encoded bytes; ask for the raw file so offsets and lengths line up
+        headers = {'Accept-Encoding': 'identity'}
+        if offset:
+            headers['Range'] = f"bytes={offset}-"
+        try:
+            response = fetch(headers)
+        except _RETRYABLE as e:
+            if attempt == max_retries:
+                raise
+            logger.warning(f"Connection to {dest.name} source failed ({e}); retrying")
+            continue
+        rejected = False
+        try:
+            if response.status_code == 416 and offset:
+                # Nothing left to send: either the .part is already complete or it is stale
+                match = _UNSATISFIED_RANGE.match(response.headers.get('Content-Range', ''))
+                if match and int(match.group(1)) == offset:
+                    os.replace(part, dest)
+                    return dest
+                part.unlink()
+                continue
+            response.raise_for_status()
+            if accept is not None and response.status_code != 206 and not accept(response):
+                rejected = True
+                raise DownloadRejected(response)
+            resumed = response.status_code == 206
+            if resumed:
+                match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+                if not match or int(match.group(1)) != offset:
+                    # Server answered a different range; start over
+                    part.unlink()
+                    continue
+            else:
+                offset = 0
+            expected = _expected_size(response, offset)
+            try:
+                with open(part, 'ab' if resumed else 'wb', buffering=buffer_size) as f:
+                    for chunk in response.iter_content(chunk_size=DEFAULT_READ_SIZE):
+                        if chunk:
+                            f.write(chunk)
+            except _RETRYABLE as e:
+                if attempt == max_retries:
+                    raise
+                logger.warning(f"Download of {dest.name} interrupted at {part.stat().st_size} bytes ({e}); resuming")
+                continue
+            size = part.stat().st_size
+            if expected is not None and size != expected:
+                if attempt == max_retries:
+                    raise IncompleteDownload(f"{dest.name}: got {size} of {expected} bytes")
+                logger.warning(f"Download of {dest.name} short ({size} of {expected} bytes); resuming")
+                continue
+            os.replace(part, dest)
+            return dest
+        finally:
+            if not rejected:
+                response.close()
+    raise IncompleteDownload(f"{dest.name}: gave up after {max_retries} retries")
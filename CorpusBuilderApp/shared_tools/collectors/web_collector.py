@@ -1,5 +1,6 @@
 # sources/web_collector.py
 from CryptoFinanceCorpusBuilder.shared_tools.collectors.base_collector import BaseCollector
+from CryptoFinanceCorpusBuilder.shared_tools.collectors.download_engine import url_host
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
@@ -40,8 +41,6 @@ class WebCollector(BaseCollector):
         Returns:
             Page content as string, or None if fetch failed
         """
-        self._respect_rate_limits(url)
-        
         # Check robots.txt if enabled
         if self.respect_robots_txt and not self._can_fetch(url):
             self.logger.warning(f"Robots.txt disallows access to {url}")
@@ -54,7 +53,10 @@ class WebCollector(BaseCollector):
         headers = {'User-Agent': self._get_random_user_agent()}
         try:
             self.logger.debug(f"Fetching page: {url}")
-            response = self.session.get(url, params=params, headers=headers, timeout=30)
+            response = self._cached_get(
+                url, url_host(url), lambda: self._respect_rate_limits(url),
+                params=params, headers=headers, timeout=30
+            )
             response.raise_for_status()
             return response.text
         except requests.exceptions.RequestException as e:
@@ -121,7 +123,7 @@ class WebCollector(BaseCollector):
         Returns:
             List of dictionaries containing download results
         """
-        results = []
+        jobs = []
         
         for link in links:
             url = link['url'] if isinstance(link, dict) else link
@@ -133,14 +135,17 @@ class WebCollector(BaseCollector):
             # Generate filename based on URL
             filename = os.path.basename(urlparse(url).path)
             if not filename:
-                filename = f"download_{int(time.time())}"
+                filename = f"download_{int(time.time())}_{len(jobs)}"
                 
             # Add extension if needed
             if file_ext and not filename.lower().endswith(file_ext.lower()):
                 filename = f"{filename}.{file_ext.lstrip('.')}"
                 
-            # Download the file
-            filepath = self.download_file(url, filename, subfolder)
+            jobs.append((url, filename, subfolder))
+        
+        # Download the files concurrently
+        results = []
+        for (url, filename, _), filepath in zip(jobs, self.download_files(jobs)):
             if filepath:
                 results.append({
                     'url': url, 
@@ -180,13 +185,7 @@ class WebCollector(BaseCollector):
             
             # Download the file
             self.logger.info(f"Downloading {url} to {filepath}")
-            response = self.session.get(url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            self._download_to(url, filepath)
                         
             return filepath
             
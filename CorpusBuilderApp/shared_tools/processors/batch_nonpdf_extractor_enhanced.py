@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, Any, Tuple, List, Optional, Union
+from typing import Dict, Any, Iterator, Tuple, List, Optional, Union
 import logging
 import json
 import ast
@@ -22,21 +22,28 @@ import shutil
 from collections import Counter
 import math
 import hashlib
+import tempfile
+import time
 from io import StringIO
 import types
+import itertools
 
 from .base_extractor import BaseExtractor, ExtractionError
-from .formula_extractor import FormulaExtractor
-from .finacial_symbol_processor import FinancialSymbolProcessor, AcademicPaperProcessor, MemoryOptimizer
-from .chart_image_extractor import ChartImageExtractor
-from .domain_classifier import DomainClassifier
+from .finacial_symbol_processor import MemoryOptimizer
 from .quality_control import QualityControl
 from .language_confidence_detector import detect_language_confidence
 from .corruption_detector import detect_corruption
 from .machine_translation_detector import detect_machine_translation
-from ..utils.extractor_utils import extract_metadata, calculate_hash, safe_filename
+from .processor_registry import init_processors, get_processor
+from ..utils.extractor_utils import extract_metadata, calculate_hash, safe_filename, NONPDF_SUPPORTED_EXTENSIONS
 from ..utils.domain_utils import get_domain_for_file, DOMAIN_KEYWORDS
 from ..utils.metadata_normalizer import main as normalize_directory
+from ..utils.extraction_cache import ExtractionCache, compute_fingerprint, reusable
+from ..utils.work_journal import WorkJournal, DEFAULT_MAX_ATTEMPTS
+from ..utils.fred_store import is_series_index, iter_series_documents, series_document_name
+from ..utils.batch_scheduler import walk_input_files, largest_first, BoundedScheduler, DEFAULT_TASKS_PER_WORKER, submit_lookahead
+from ..utils.worker_pool import ManagedProcessPool, TaskTimeout
+from ..utils.corpus_metadata_store import record_output_metadata, prepare_store
 from shared_tools.project_config import ProjectConfig
 
 # Configure logging
@@ -56,19 +63,34 @@ logger = logging.getLogger(__name__)
 # Constants
 MIN_TOKEN_THRESHOLD = 100
 LOW_QUALITY_TOKEN_THRESHOLD = 500
-SUPPORTED_EXTENSIONS = {
-    '.py': 'python',
-    '.ipynb': 'jupyter',
-    '.md': 'markdown',
-    '.html': 'html',
-    '.htm': 'html',
-    '.json': 'json',
-    '.csv': 'csv'
-}
+# FRED domain files; kept out of NONPDF_SUPPORTED_EXTENSIONS, which also selects the files collectors keep from repos
+SUPPORTED_EXTENSIONS = {**NONPDF_SUPPORTED_EXTENSIONS, '.parquet': 'parquet'}
 CHUNK_TOKEN_THRESHOLD = 1000  # Lower threshold for non-PDF files since they're typically shorter
 
 BATCH_SIZE = 20
 DEFAULT_TIMEOUT = 300
+# Completed files between extraction cache index saves during a run
+CACHE_SAVE_INTERVAL = 25
+# Worker pool settings (each can be overridden in the processor config; num_workers fixes the pool size)
+POOL_DEFAULTS = {
+    'worker_memory_mb': 400,
+    'max_tasks_per_worker': 500,
+    'max_worker_rss_mb': 1024,
+    'task_timeout': 600,
+    'task_retries': 1
+}
+
+# Bump when a change outside the files below alters extraction output
+PIPELINE_VERSION = 'nonpdf-enhanced-1'
+PIPELINE_CODE_FILES = [
+    Path(__file__),
+    Path(__file__).with_name('formula_extractor.py'),
+    Path(__file__).with_name('finacial_symbol_processor.py'),
+    Path(__file__).with_name('domain_classifier.py'),
+    Path(__file__).with_name('corruption_detector.py'),
+    Path(__file__).with_name('language_confidence_detector.py'),
+    Path(__file__).with_name('machine_translation_detector.py'),
+]
 
 # Thread-local storage for worker info
 thread_local = threading.local()
@@ -102,9 +124,10 @@ def get_worker_temp_dir():
     temp_dir.mkdir(exist_ok=True)
     return temp_dir
 
-def worker_initializer():
-    """Initialize worker process"""
+def worker_initializer(processor_settings: Optional[Dict[str, Dict]] = None, mt_config: Optional[str] = None):
+    """Initialize worker process and build its shared processor instances"""
     thread_local.worker_id = os.getpid()
+    init_processors(processor_settings, mt_config)
 
 class ExtractionResult:
     def __init__(self, text: str, metadata: Dict[str, Any], tables: List[Dict], formulas: List[Dict], 
@@ -128,7 +151,7 @@ def get_domain_for_file(file_path: str) -> Optional[str]:
     try:
         # Extract text and ignore tables/images for domain classification
         text, _, _ = extract_text_from_file(file_path)
-        domain_classifier = DomainClassifier()
+        domain_classifier = get_processor('domain')
         domain_info = domain_classifier.classify(text)
         return domain_info.get('domain')
     except Exception as e:
@@ -149,7 +172,7 @@ def compute_relevance_score(text: str, domain: str) -> Tuple[float, str, List[st
         return 0, 'low', []
     
     # Get domain keywords
-    domain_classifier = DomainClassifier()
+    domain_classifier = get_processor('domain')
     domain_info = domain_classifier.classify(text)
     domain_scores = domain_info.get('scores', {})
     
@@ -197,7 +220,16 @@ def preprocess_text_for_quality_checks(text: str, file_type: str) -> str:
         text = re.sub(r'^\s*[-*+]\s+', '', text, flags=re.MULTILINE)  # Remove list markers
     return text
 
-def process_nonpdf_file_enhanced(file_path: str, args: argparse.Namespace) -> Optional[ExtractionResult]:
+def process_nonpdf_file_enhanced(file_path: str, args: argparse.Namespace,
+                                 document: Optional[Dict[str, Any]] = None) -> Optional[ExtractionResult]:
+    """Extract and analyse one document.
+
+    Args:
+        file_path: Source file
+        args: Worker arguments
+        document: Already extracted document of a multi-document file (a FRED series):
+            text, and optionally domain and extra metadata; the file is not read again
+    """
     worker_temp = get_worker_temp_dir()
     worker_id = getattr(thread_local, 'worker_id', 'unknown')
     try:
@@ -216,7 +248,10 @@ def process_nonpdf_file_enhanced(file_path: str, args: argparse.Namespace) -> Op
         print(f"DEBUG: Using extraction method: {SUPPORTED_EXTENSIONS[ext]}")
         
         # Extract text
-        text, tables, images = extract_text_from_file(file_path)
+        if document is not None:
+            text, tables, images = document['text'], [], []
+        else:
+            text, tables, images = extract_text_from_file(file_path)
         print(f"DEBUG: Text extracted successfully, length: {len(text)}")
         
         if not text or len(text.strip()) < MIN_TOKEN_THRESHOLD:
@@ -224,19 +259,19 @@ def process_nonpdf_file_enhanced(file_path: str, args: argparse.Namespace) -> Op
             return None
             
         # Get domain classification
-        domain = get_domain_for_file(file_path)
+        domain = (document or {}).get('domain') or get_domain_for_file(file_path)
         if not domain:
             print(f"[{worker_id}] Could not determine domain for {os.path.basename(file_path)}")
             return None
             
         # Get domain info from classifier
-        domain_classifier = DomainClassifier()
+        domain_classifier = get_processor('domain')
         domain_info = domain_classifier.classify(text)
         
-        # Initialize processors
-        formula_extractor = FormulaExtractor()
-        symbol_processor = FinancialSymbolProcessor()
-        academic_processor = AcademicPaperProcessor()
+        # Shared per-process processors (built once in worker_initializer)
+        formula_extractor = get_processor('formula')
+        symbol_processor = get_processor('symbols')
+        academic_processor = get_processor('academic')
         
         # Special handling for code files
         is_code_file = ext in ['.py', '.ipynb']
@@ -535,12 +570,16 @@ def process_nonpdf_file_enhanced(file_path: str, args: argparse.Namespace) -> Op
                 }
             }
         
-        # Add quality thresholds
+        if document is not None and document.get('metadata'):
+            metadata.update(document['metadata'])
+        
+        # Add quality thresholds (domains without tuned thresholds get none)
+        domain_thresholds = DOMAIN_THRESHOLDS.get(domain, {})
         quality_metrics.update({
             'min_tokens': MIN_TOKEN_THRESHOLD,
-            'quality_threshold': DOMAIN_THRESHOLDS[domain]['quality_threshold'],
-            'table_threshold': DOMAIN_THRESHOLDS[domain]['table_threshold'],
-            'formula_threshold': DOMAIN_THRESHOLDS[domain]['formula_threshold'],
+            'quality_threshold': domain_thresholds.get('quality_threshold'),
+            'table_threshold': domain_thresholds.get('table_threshold'),
+            'formula_threshold': domain_thresholds.get('formula_threshold'),
             'extraction_quality': {
                 'formulas_detected': bool(formula_results.get('formulas', []) if isinstance(formula_results, dict) else formula_results),
                 'symbols_detected': bool(symbol_results['symbols_by_type'].get('crypto_symbol' if is_code_file else 'stock_ticker')),
@@ -580,6 +619,8 @@ def extract_text_from_file(file_path: str) -> Tuple[str, List[Dict], List[Dict]]
             return extract_text_from_json(file_path), [], []
         elif ext == '.csv':
             return extract_text_from_csv(file_path), [], []
+        elif ext == '.parquet':
+            return '\n\n'.join(text for _, text, _ in iter_series_documents(file_path)), [], []
         else:
             raise ExtractionError(f"Unsupported file type: {ext}")
     except Exception as e:
@@ -819,19 +860,33 @@ def extract_text_from_csv(file_path: str) -> str:
     rows = df.to_string(index=False, header=False)
     return f"{header}\n{rows}"
 
-def write_outputs(base_dir, rel_path, text, meta, quality, tables=None, formulas=None):
-    """Write extracted text and metadata to files."""
+def output_paths(base_dir, rel_path):
+    """Paths of the text and metadata outputs for a source file."""
     base_dir = Path(base_dir).resolve()  # Ensure absolute path
-    out_dir = base_dir / '_extracted'  # Create _extracted subdirectory
-    out_dir.mkdir(parents=True, exist_ok=True)
+    out_dir = base_dir / '_extracted'
     # Use stem to remove original extension before adding new ones
     base = safe_filename(rel_path.stem, 128)
-    txt_path = out_dir / f"{base}.txt"
-    json_path = out_dir / f"{base}.json"
+    return out_dir / f"{base}.txt", out_dir / f"{base}.json"
+
+def _atomic_write(path: Path, write):
+    """Write through a temp file in the same directory and rename it onto path."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_outputs(base_dir, rel_path, text, meta, quality, tables=None, formulas=None):
+    """Write extracted text and metadata to files (each atomically, so a killed worker leaves no partial output)."""
+    txt_path, json_path = output_paths(base_dir, rel_path)
+    txt_path.parent.mkdir(parents=True, exist_ok=True)
 
     print(f"DEBUG: Writing text output to {txt_path}")
-    with open(txt_path, 'w', encoding='utf-8') as f:
-        f.write(text)
+    _atomic_write(txt_path, lambda f: f.write(text))
     print(f"DEBUG: Finished writing text output to {txt_path}")
 
     output_json = dict(meta)
@@ -841,12 +896,109 @@ def write_outputs(base_dir, rel_path, text, meta, quality, tables=None, formulas
         output_json['formulas'] = formulas
 
     print(f"DEBUG: Writing JSON output to {json_path}")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(output_json, f, ensure_ascii=False, indent=2)
+    _atomic_write(json_path, lambda f: json.dump(output_json, f, ensure_ascii=False, indent=2))
     print(f"DEBUG: Finished writing JSON output to {json_path}")
+    record_output_metadata(json_path, output_json)
 
     return txt_path, json_path
 
+def _fred_series_documents(file_path: str) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+    """(output name, document) for every series in a FRED domain file."""
+    for series_id, text, info in iter_series_documents(file_path):
+        yield Path(series_document_name(series_id)), {
+            'text': text,
+            'domain': info.get('domain'),
+            'metadata': {'source': 'fred', 'fred_series': info}
+        }
+
+def extract_and_write_nonpdf(file_path: str, args: argparse.Namespace, hash_input: bool = False,
+                             cache_entry: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Worker entry point: extract a file, write its outputs and return a small status record.
+
+    The text, tables and metadata stay in the worker; only the output paths,
+    token count, quality flag and stage timings are pickled back to the parent.
+    A FRED domain file (.parquet) yields one output pair per series.
+
+    Args:
+        file_path: Input file
+        args: Worker arguments
+        hash_input: Hash the file for the extraction cache first (the parent's
+            stat index did not know it, and the parent never reads input files)
+        cache_entry: The parent's snapshot of the file's cache entry; when the
+            hash matches it and its outputs exist, they are reused as they are
+
+    Returns:
+        dict with file_path, outputs, documents, token_count, quality_flag,
+        file_hash (None unless hash_input), cached and timings (seconds), or
+        None if the file could not be extracted
+    """
+    hash_start = time.perf_counter()
+    file_hash = calculate_hash(file_path) if hash_input else None
+    hash_seconds = time.perf_counter() - hash_start
+    if file_hash and reusable(cache_entry, file_hash):
+        # Touched, copied over or restored, but the content is what was extracted last time
+        return {
+            'file_path': file_path,
+            'outputs': cache_entry['outputs'],
+            'documents': len(cache_entry['outputs']) // 2,
+            'token_count': cache_entry.get('token_count'),
+            'quality_flag': cache_entry.get('quality', 'ok'),
+            'file_hash': file_hash,
+            'cached': True,
+            'timings': {'hash': round(hash_seconds, 4)}
+        }
+    if Path(file_path).suffix.lower() == '.parquet':
+        documents = _fred_series_documents(file_path)
+    else:
+        documents = [(Path(file_path), None)]
+    outputs = []
+    token_count = 0
+    quality = 'ok'
+    extract_seconds = write_seconds = 0.0
+    for rel_path, document in documents:
+        document_start = time.perf_counter()
+        result = process_nonpdf_file_enhanced(file_path, args, document)
+        extracted = time.perf_counter()
+        extract_seconds += extracted - document_start
+        if not result:
+            continue
+        extraction_quality = result.quality_metrics.get('extraction_quality', {})
+        document_quality = extraction_quality.get('quality_flag', 'ok')
+        try:
+            txt_path, json_path = write_outputs(
+                args.output_dir,
+                rel_path,
+                result.text,
+                result.metadata,
+                document_quality,
+                tables=result.tables,
+                formulas=result.formulas
+            )
+        except OSError as e:
+            logger.error(f"Could not write outputs for {file_path}: {str(e)}")
+            return None
+        write_seconds += time.perf_counter() - extracted
+        outputs.extend([str(txt_path), str(json_path)])
+        token_count += extraction_quality.get('token_count') or 0
+        if document_quality != 'ok':
+            quality = document_quality
+    if not outputs:
+        return None
+    return {
+        'file_path': file_path,
+        'outputs': outputs,
+        'documents': len(outputs) // 2,
+        'token_count': token_count,
+        'quality_flag': quality,
+        'file_hash': file_hash,
+        'cached': False,
+        'timings': {
+            'extract': round(extract_seconds, 4),
+            'write': round(write_seconds, 4),
+            'hash': round(hash_seconds, 4)
+        }
+    }
+
 def run_with_project_config(
     project: Union[str, ProjectConfig],
     verbose: bool = False,
@@ -914,22 +1066,22 @@ def run_with_paths(
     if not input_dir.exists():
         raise ValueError(f"Input directory missing: {input_dir}")
     output_dir.mkdir(parents=True, exist_ok=True)
+    # Workers only insert metadata rows; the table is created or migrated here, once
+    prepare_store(output_dir)
     if verbose:
         logger.setLevel(logging.DEBUG)
-    files_to_process = []
-    for root, _, files in os.walk(input_dir):
-        for file in files:
-            if file.lower().endswith(tuple(SUPPORTED_EXTENSIONS.keys())):
-                files_to_process.append(os.path.join(root, file))
-    if not files_to_process:
+    # Walk the input lazily; only a bounded window of files is ever queued in the parent
+    input_files = walk_input_files(input_dir, SUPPORTED_EXTENSIONS.keys())
+    first_file = next(input_files, None)
+    if first_file is None:
         logger.error(f"No supported files found in {input_dir}")
         return {'success': False, 'files_processed': 0, 'errors': [f'No supported files found in {input_dir}']}
-    logger.info(f"Found {len(files_to_process)} files to process")
+    input_files = itertools.chain([first_file], input_files)
+    files_found = 0
     failed_files = []
     successful_files = []
-    import multiprocessing
-    num_workers = min(max(1, multiprocessing.cpu_count() - 1), 8)
-    from concurrent.futures import ProcessPoolExecutor, as_completed
+    # Files whose task was killed at the pool's task_timeout
+    timed_out_files = []
     from tqdm import tqdm
     # Use SimpleNamespace for worker args (pickleable)
     worker_args = types.SimpleNamespace(
@@ -942,37 +1094,139 @@ def run_with_paths(
         mt_config=None,
         relevance_threshold=30
     )
-    with ProcessPoolExecutor(max_workers=num_workers, initializer=worker_initializer) as executor:
-        futures = {}
-        for file_path in files_to_process:
-            future = executor.submit(process_nonpdf_file_enhanced, file_path, worker_args)
-            futures[future] = file_path
+    processor_config = processor_config or {}
+    cache = None
+    if processor_config.get('use_extraction_cache', True):
+        fingerprint_config = {
+            key: value for key, value in vars(worker_args).items()
+            if key not in ('output_dir', 'verbose', 'auto_normalize')
+        }
+        fingerprint_config.update({
+            'min_token_threshold': MIN_TOKEN_THRESHOLD,
+            'low_quality_token_threshold': LOW_QUALITY_TOKEN_THRESHOLD
+        })
+        cache = ExtractionCache(output_dir, 'nonpdf', compute_fingerprint(fingerprint_config, PIPELINE_VERSION, PIPELINE_CODE_FILES))
+    # Resume an interrupted run: files the journal marks done (and unchanged) are not resubmitted
+    journal = None
+    resumed_files = 0
+    if processor_config.get('resume', True):
+        journal = WorkJournal(output_dir, 'nonpdf', max_attempts=processor_config.get('max_attempts', DEFAULT_MAX_ATTEMPTS))
+        journal.begin_run()
+
+    def walked_files():
+        """(path, size) of the input documents, straight from the directory walk"""
+        nonlocal files_found
+        for file_path, size in input_files:
+            # The FRED series index describes the domain files; it is not a document
+            if is_series_index(file_path):
+                continue
+            files_found += 1
+            yield file_path, size
+
+    def already_extracted(file_path: str) -> bool:
+        """Account for a file the journal or the cache says needs no work (stat checks only; nothing is read)"""
+        nonlocal resumed_files
+        if journal is not None and not journal.admit(file_path):
+            state = journal.get(file_path)
+            if state['status'] == 'done':
+                resumed_files += 1
+                successful_files.append(file_path)
+                if cache is not None:
+                    # Only a hash the worker or the stat index supplies is recorded; nothing is read here
+                    file_hash = state.get('file_hash') or cache.known_hash(file_path)
+                    if file_hash:
+                        cache.record(file_path, state['outputs'], file_hash=file_hash)
+            else:
+                failed_files.append(f"{file_path}: Skipped after {state['attempts']} failed attempts ({state.get('error')})")
+            return True
+        # Skip files whose size and mtime, config and extractor code are unchanged since the last run
+        if cache is not None:
+            entry = cache.lookup(file_path)
+            if entry is not None:
+                successful_files.append(file_path)
+                if journal is not None:
+                    journal.mark_done(file_path, entry['outputs'], sync=False, cached=True,
+                                      file_hash=cache.known_hash(file_path))
+                return True
+        return False
+
+    def tasks(lookahead: int):
+        # Largest files first so the longest jobs do not end up at the tail of the run
+        for file_path in largest_first(walked_files(), lookahead):
+            if already_extracted(file_path):
+                continue
+            if journal is not None:
+                journal.mark_running(file_path)
+            # Files the cache has not seen at this size and mtime are hashed by the worker,
+            # which reuses the outputs in their entry if the content turns out unchanged
+            hash_input = cache is not None and cache.known_hash(file_path) is None
+            cache_entry = cache.snapshot(file_path) if hash_input else None
+            yield file_path, extract_and_write_nonpdf, (file_path, worker_args, hash_input, cache_entry)
+
+    # Pool sized from cores and available memory; workers are recycled and runaway tasks killed
+    with ManagedProcessPool.from_config(processor_config, POOL_DEFAULTS, worker_initializer,
+                                        (processor_config.get('processor_settings'), worker_args.mt_config)) as executor:
+        max_in_flight = executor.max_workers * processor_config.get('tasks_per_worker', DEFAULT_TASKS_PER_WORKER)
+        lookahead = submit_lookahead(max_in_flight, processor_config.get('submit_lookahead'))
+        scheduler = BoundedScheduler(executor, tasks(lookahead), max_in_flight)
         completed = 0
-        for future in tqdm(as_completed(futures), total=len(futures)):
+        stage_timings = Counter()
+        for file_path, future in tqdm(scheduler):
             completed += 1
-            file_path = futures[future]
-            result = future.result()
+            error = 'Failed to process (see logs for details)'
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Worker failed on {file_path}: {str(e)}")
+                error = f"{type(e).__name__}: {str(e)}"
+                result = None
+                if isinstance(e, TaskTimeout):
+                    timed_out_files.append(file_path)
             if result:
+                # Outputs were written by the worker; only the status record comes back
                 successful_files.append(file_path)
-                write_outputs(
-                    output_dir,
-                    Path(file_path),
-                    result.text,
-                    result.metadata,
-                    result.quality_metrics.get('quality_flag', 'ok'),
-                    tables=result.tables,
-                    formulas=result.formulas
-                )
+                stage_timings.update(result['timings'])
+                if cache is not None:
+                    cache.record(file_path, result['outputs'], file_hash=result['file_hash'], hit=result['cached'],
+                                 quality=result['quality_flag'], token_count=result['token_count'])
+                if journal is not None:
+                    journal.mark_done(file_path, result['outputs'], file_hash=result['file_hash'], cached=result['cached'])
             else:
-                failed_files.append(f"{file_path}: Failed to process (see logs for details)")
-            logger.info(f"Progress: {completed}/{len(files_to_process)} files processed ({len(successful_files)} successful)")
-    logger.info(f"Processing complete. {len(successful_files)}/{len(files_to_process)} files processed successfully")
+                failed_files.append(f"{file_path}: {error}")
+                if journal is not None:
+                    journal.mark_failed(file_path, error)
+            if cache is not None and completed % CACHE_SAVE_INTERVAL == 0:
+                # Keep the cache index close to the journal so a resumed run can skip re-hashing
+                cache.save()
+            logger.info(f"Progress: {completed} files extracted, {files_found} found so far ({len(successful_files)} successful)")
+    pool_stats = executor.summary()
+    logger.info(f"Worker pool: {pool_stats['workers_started']} workers started, peak RSS {pool_stats['peak_rss_mb']} MB, "
+                f"killed {pool_stats['killed']}, {pool_stats['requeued']} tasks requeued")
+    if resumed_files:
+        logger.info(f"Resumed: {resumed_files} files were already done")
+    if timed_out_files:
+        logger.warning(f"Timed out: {len(timed_out_files)} files were killed at the task deadline")
+    logger.info(f"Processing complete. {len(successful_files)}/{files_found} files processed successfully")
+    cache_stats = {'hits': 0, 'misses': files_found}
+    if cache is not None:
+        cache.save()
+        cache_stats = cache.stats()
+        logger.info(f"Extraction cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    if journal is not None:
+        journal.complete()
+        journal.close()
     if auto_normalize:
         logger.info("[INFO] Running metadata normalization on output directory...")
         normalize_directory(output_dir)
     return {
         'success': len(failed_files) == 0,
         'files_processed': len(successful_files),
+        'resumed': resumed_files,
+        'cache': cache_stats,
+        'timings': {stage: round(seconds, 4) for stage, seconds in stage_timings.items()},
+        'pool': pool_stats,
+        'timed_out': len(timed_out_files),
+        'timed_out_files': timed_out_files,
         'errors': failed_files
     }
 
@@ -995,6 +1249,8 @@ def main():
     print(f"Successful extractions: {results['success']}")
     print(f"Failed extractions: {results['errors']}")
     print(f"Low quality files: {results['files_processed'] - results['success']}")
+    if 'cache' in results:
+        print(f"Extraction cache: {results['cache']['hits']} hits, {results['cache']['misses']} misses")
     
     if args.verbose:
         print("\nDetailed Results:")
@@ -1041,6 +1297,10 @@ class BatchNonPDFExtractorEnhanced:
                 relevance_threshold=30
             )
             
+            # FRED domain files hold one document per series
+            if Path(file_path).suffix.lower() == '.parquet':
+                return extract_and_write_nonpdf(file_path, args) is not None
+            
             # Process the file
             result = process_nonpdf_file_enhanced(file_path, args)
             
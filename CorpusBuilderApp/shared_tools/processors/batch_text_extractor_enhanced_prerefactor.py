@@ -9,6 +9,7 @@ import logging
 import time
 import multiprocessing
 import types
+import itertools
 from typing import Optional, List, Dict, Any, Tuple, Union
 
 # ===== CRITICAL: Set Ghostscript environment FIRST, before any imports =====
@@ -60,8 +61,8 @@ def get_worker_temp_dir():
         print(f"Worker {worker_id} using temp dir: {unique_dir}")
     return thread_local.temp_dir
 
-def worker_initializer():
-    """Initialize each worker process with proper Ghostscript environment."""
+def worker_initializer(processor_settings: Optional[Dict[str, Dict]] = None, mt_config: Optional[str] = None):
+    """Initialize each worker process with proper Ghostscript environment and shared processor instances."""
     import os
     import uuid
     import atexit
@@ -92,6 +93,7 @@ def worker_initializer():
             print(f"Cleanup warning for {unique_temp}: {str(e)}")
 
     atexit.register(cleanup_temp)
+    init_processors(processor_settings, mt_config)
 
 GS_PATH = r"C:\Program Files\gs\gs10.05.1\bin\gswin64c.exe"  # adjust if needed
 os.environ["GHOSTSCRIPT_PATH"] = GS_PATH
@@ -102,6 +104,7 @@ from concurrent.futures import ProcessPoolExecutor
 import camelot
 import sys
 import json
+import pickle
 import re
 import shutil
 import argparse
@@ -113,7 +116,7 @@ from collections import Counter
 import math
 from typing import Optional, List, Dict, Any, Tuple
 import threading
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 import hashlib
 from contextlib import contextmanager
@@ -132,15 +135,24 @@ from langdetect import detect, LangDetectException  # type: ignore
 import yaml
 from tqdm import tqdm
 
-from .formula_extractor import FormulaExtractor
-from .chart_image_extractor import ChartImageExtractor
-from .finacial_symbol_processor import FinancialSymbolProcessor, AcademicPaperProcessor, MemoryOptimizer
+from .finacial_symbol_processor import MemoryOptimizer
 from ..utils.domain_utils import get_domain_for_file
 from ..utils.pdf_safe_open import safe_open_pdf
+from ..utils.pdf_document_context import PDFDocumentContext
+from ..utils.table_prefilter import find_table_pages, camelot_pages, read_lattice_tables
+from ..utils.pdf_stages import pdfminer_page_texts, ocr_page_texts
+from ..utils.deadline import run_with_deadline, StageTimeout
+from ..utils.extraction_cache import ExtractionCache, compute_fingerprint, reusable, CACHE_DIR_NAME
+from ..utils.extractor_utils import calculate_hash
+from ..utils.work_journal import WorkJournal, DEFAULT_MAX_ATTEMPTS
+from ..utils.batch_scheduler import walk_input_files, largest_first, BoundedScheduler, DEFAULT_TASKS_PER_WORKER, submit_lookahead
+from ..utils.worker_pool import ManagedProcessPool, TaskTimeout
+from ..utils.corpus_metadata_store import record_output_metadata, prepare_store
 from ..utils.metadata_normalizer import main as normalize_directory
 from .corruption_detector import detect_corruption
 from .language_confidence_detector import detect_language_confidence
 from .machine_translation_detector import detect_machine_translation
+from .processor_registry import init_processors, get_processor
 from shared_tools.project_config import ProjectConfig
 
 # --- Config ---
@@ -152,6 +164,49 @@ DEFAULT_TIMEOUT = 300
 MAX_RETRIES = 2
 BATCH_SIZE = 20
 
+# Text extraction: 'cascade' runs PyMuPDF and falls back per page,
+# 'best_of_all' runs every engine on the whole document (legacy behaviour)
+TEXT_EXTRACTION_MODE = 'cascade'
+CASCADE_MIN_PAGE_WORDS = 20
+CASCADE_MIN_PRINTABLE_RATIO = 0.95
+CASCADE_MAX_GARBAGE_RATIO = 0.05
+CID_GLYPH_PATTERN = re.compile(r'\(cid:\d+\)')
+# Deadlines in seconds per page handled for the pdfminer text fallback and the formula OCR pass. Each
+# runs in a child process killed at its deadline; the file is then written without that stage's output
+TEXT_FALLBACK_SECONDS_PER_PAGE = 2
+OCR_SECONDS_PER_PAGE = 4
+# Floor for both deadlines so short documents are not cut off by process start-up and parsing
+MIN_STAGE_TIMEOUT = 30
+
+# Bump when a change outside the files below alters extraction output
+PIPELINE_VERSION = 'pdf-enhanced-3'
+PIPELINE_CODE_FILES = [
+    Path(__file__),
+    Path(__file__).with_name('formula_extractor.py'),
+    Path(__file__).with_name('chart_image_extractor.py'),
+    Path(__file__).with_name('finacial_symbol_processor.py'),
+    Path(__file__).with_name('corruption_detector.py'),
+    Path(__file__).with_name('language_confidence_detector.py'),
+    Path(__file__).with_name('machine_translation_detector.py'),
+]
+
+# Large PDFs are split into page ranges that the process pool extracts in parallel
+LARGE_PDF_PAGE_THRESHOLD = 150
+PAGE_RANGE_SIZE = 50
+# Completed files between extraction cache index saves during a run
+CACHE_SAVE_INTERVAL = 25
+# Worker pool settings (each can be overridden in the processor config; num_workers fixes the pool size).
+# OCR, OpenCV and camelot make PDF workers heavy, so the pool is sized by memory as much as by cores;
+# the per-task memory cap is derived from the available memory split across the workers.
+POOL_DEFAULTS = {
+    'worker_memory_mb': 1500,
+    'max_tasks_per_worker': 50,
+    'max_worker_rss_mb': 2048,
+    # Per-stage deadlines (tables, pdfminer fallback, OCR) bound the slow stages; this only catches the rest
+    'task_timeout': 1200,
+    'task_retries': 1
+}
+
 # Domain-specific thresholds
 DOMAIN_THRESHOLDS = {
     'crypto_derivatives': {
@@ -207,12 +262,14 @@ def quality_flag(text):
     else:
         return 'ok'
 
-def write_outputs(base_dir, rel_path, text, meta, quality, tables=None, formulas=None):
+def output_paths(base_dir, rel_path, quality):
     out_dir = Path(base_dir) / ('low_quality' if quality == 'low_quality' else '_extracted')
-    out_dir.mkdir(parents=True, exist_ok=True)
     base = safe_filename(rel_path.name, 128)
-    txt_path = out_dir / f"{base}.txt"
-    json_path = out_dir / f"{base}.json"
+    return out_dir / f"{base}.txt", out_dir / f"{base}.json"
+
+def write_outputs(base_dir, rel_path, text, meta, quality, tables=None, formulas=None):
+    txt_path, json_path = output_paths(base_dir, rel_path, quality)
+    txt_path.parent.mkdir(parents=True, exist_ok=True)
     with open(txt_path, 'w', encoding='utf-8') as f:
         f.write(text)
     output_json = dict(meta)
@@ -222,6 +279,7 @@ def write_outputs(base_dir, rel_path, text, meta, quality, tables=None, formulas
         output_json['formulas'] = formulas
     with open(json_path, 'w', encoding='utf-8') as f:
         json.dump(output_json, f, ensure_ascii=False, indent=2)
+    record_output_metadata(json_path, output_json)
     return txt_path, json_path
 
 # --- Extraction Classes ---
@@ -236,67 +294,179 @@ class ExtractionResult:
         self.errors = errors
         self.warnings = warnings
 
-# --- Timeout Context ---
-class timeout_context:
-    def __init__(self, timeout_seconds):
-        self.timeout_seconds = timeout_seconds
-        self.timer = None
-
-    def __enter__(self):
-        self.timer = threading.Timer(self.timeout_seconds, self.raise_timeout)
-        self.timer.start()
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.timer:
-            self.timer.cancel()
-
-    def raise_timeout(self):
-        raise TimeoutError(f"Operation timed out after {self.timeout_seconds} seconds")
-
 # --- Extraction Methods ---
-def extract_text_with_pypdf2(pdf_path: str) -> str:
+def extract_text_with_pypdf2(pdf_path: str, doc_context: Optional[PDFDocumentContext] = None) -> str:
     text = ""
     try:
-        with open(pdf_path, 'rb') as f:
-            pdf = PyPDF2.PdfReader(f)
-            for page in pdf.pages:
-                text += page.extract_text() + "\n"
+        if doc_context is not None:
+            pdf = PyPDF2.PdfReader(doc_context.stream())
+            for page_num in doc_context.page_numbers:
+                text += pdf.pages[page_num].extract_text() + "\n"
+        else:
+            with open(pdf_path, 'rb') as f:
+                pdf = PyPDF2.PdfReader(f)
+                for page in pdf.pages:
+                    text += page.extract_text() + "\n"
     except Exception as e:
         logger.warning(f"PyPDF2 extraction failed: {str(e)}")
     return text
 
-def extract_text_with_pymupdf(pdf_path: str) -> str:
+def extract_text_with_pymupdf(pdf_path: str, doc_context: Optional[PDFDocumentContext] = None) -> str:
     text = ""
     try:
-        doc = fitz.open(pdf_path)
-        for page in doc:
-            text += page.get_text() + "\n"
+        if doc_context is not None:
+            text = "".join(doc_context.get_page_text(page_num) + "\n" for page_num in doc_context.page_numbers)
+        else:
+            with fitz.open(pdf_path) as doc:
+                for page in doc:
+                    text += page.get_text() + "\n"
     except Exception as e:
         logger.warning(f"PyMuPDF extraction failed: {str(e)}")
     return text
 
-def extract_text_with_pdfminer(pdf_path: str) -> str:
+def extract_text_with_pdfminer(pdf_path: str, doc_context: Optional[PDFDocumentContext] = None) -> str:
     text = ""
     try:
-        text = pdfminer_extract_text(pdf_path)
+        if doc_context is not None:
+            text = pdfminer_extract_text(doc_context.stream(), page_numbers=doc_context.page_numbers)
+        else:
+            text = pdfminer_extract_text(pdf_path)
     except Exception as e:
         logger.warning(f"PDFMiner extraction failed: {str(e)}")
     return text
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    print(f"[DEBUG] Entering extract_text_from_pdf for: {pdf_path}")
+def score_page_text(text: str) -> Dict[str, Any]:
+    """Cheap per-page quality check used by the extraction cascade.
+
+    Combines the printable-character ratio, words on the page and the share of
+    glyph garbage (pdfminer ``(cid:NN)`` escapes, U+FFFD, private-use glyphs).
+    """
+    stripped = text.strip() if text else ''
+    if not stripped:
+        return {'score': 0.0, 'word_count': 0, 'printable_ratio': 0.0, 'garbage_ratio': 0.0, 'passed': False}
+    total_chars = len(stripped)
+    printable = sum(1 for c in stripped if c.isprintable() or c.isspace())
+    garbage = sum(1 for c in stripped if c == '\ufffd' or '\ue000' <= c <= '\uf8ff')
+    garbage += 5 * len(CID_GLYPH_PATTERN.findall(stripped))
+    word_count = len(stripped.split())
+    printable_ratio = printable / total_chars
+    garbage_ratio = min(1.0, garbage / total_chars)
+    score = printable_ratio * (1.0 - garbage_ratio) * min(1.0, word_count / CASCADE_MIN_PAGE_WORDS)
+    passed = (
+        word_count >= CASCADE_MIN_PAGE_WORDS
+        and printable_ratio >= CASCADE_MIN_PRINTABLE_RATIO
+        and garbage_ratio <= CASCADE_MAX_GARBAGE_RATIO
+    )
+    return {
+        'score': round(score, 4),
+        'word_count': word_count,
+        'printable_ratio': round(printable_ratio, 4),
+        'garbage_ratio': round(garbage_ratio, 4),
+        'passed': passed
+    }
+
+def stage_timeout(seconds_per_page: Optional[float], page_count: int) -> Optional[float]:
+    """Deadline of a per-page stage (None, i.e. no deadline, if seconds_per_page is 0 or None)."""
+    if not seconds_per_page:
+        return None
+    return max(MIN_STAGE_TIMEOUT, seconds_per_page * page_count)
+
+def _extract_pages_with_pdfminer(doc_context: PDFDocumentContext, page_numbers: List[int],
+                                 seconds_per_page: Optional[float] = TEXT_FALLBACK_SECONDS_PER_PAGE) -> Dict[int, str]:
+    """Extract only the given (0-based) pages with pdfminer, in a child process killed at the stage deadline."""
+    return run_with_deadline(pdfminer_page_texts, doc_context.pdf_path, page_numbers,
+                             timeout=stage_timeout(seconds_per_page, len(page_numbers)), stage='pdfminer')
+
+def _extract_pages_with_pypdf2(doc_context: PDFDocumentContext, page_numbers: List[int]) -> Dict[int, str]:
+    """Extract only the given (0-based) pages with PyPDF2."""
+    reader = PyPDF2.PdfReader(doc_context.stream())
+    return {page_num: reader.pages[page_num].extract_text() or '' for page_num in page_numbers}
+
+def _extract_text_cascade(doc_context: PDFDocumentContext,
+                          fallback_seconds_per_page: Optional[float] = TEXT_FALLBACK_SECONDS_PER_PAGE) -> Tuple[str, Dict[str, Any]]:
+    """PyMuPDF first; pdfminer then PyPDF2 only for pages that fail the quality check.
+
+    pdfminer runs under a deadline of fallback_seconds_per_page per failed page;
+    if it is killed, PyPDF2 still gets those pages and the info has timed_out set.
+    """
+    page_numbers = doc_context.page_numbers
+    page_count = len(page_numbers)
+    timings = {}
+    start = time.perf_counter()
+    page_texts = {}
+    page_scores = {}
+    for page_num in page_numbers:
+        try:
+            page_texts[page_num] = doc_context.get_page_text(page_num)
+        except Exception as e:
+            logger.warning(f"PyMuPDF extraction failed on page {page_num + 1}: {str(e)}")
+            page_texts[page_num] = ''
+        page_scores[page_num] = score_page_text(page_texts[page_num])
+    timings['pymupdf'] = round(time.perf_counter() - start, 4)
+    page_engine = {page_num: 'pymupdf' for page_num in page_numbers}
+    failed_pages = [page_num for page_num in page_numbers if not page_scores[page_num]['passed']]
+    initially_failed = len(failed_pages)
+    timed_out = False
+
+    fallbacks = [
+        ('pdfminer', lambda pages: _extract_pages_with_pdfminer(doc_context, pages, fallback_seconds_per_page)),
+        ('pypdf2', lambda pages: _extract_pages_with_pypdf2(doc_context, pages))
+    ]
+    for engine, extract_pages_fn in fallbacks:
+        if not failed_pages:
+            break
+        start = time.perf_counter()
+        try:
+            candidates = extract_pages_fn(failed_pages)
+        except StageTimeout as e:
+            logger.warning(f"{engine} fallback on {os.path.basename(doc_context.pdf_path)} killed: {str(e)}")
+            candidates = {}
+            timed_out = True
+        except Exception as e:
+            logger.warning(f"{engine} fallback extraction failed: {str(e)}")
+            candidates = {}
+        timings[engine] = round(time.perf_counter() - start, 4)
+        for page_num, candidate in candidates.items():
+            candidate_score = score_page_text(candidate)
+            current = page_scores[page_num]
+            if (candidate_score['score'], candidate_score['word_count']) > (current['score'], current['word_count']):
+                page_texts[page_num] = candidate
+                page_scores[page_num] = candidate_score
+                page_engine[page_num] = engine
+        failed_pages = [page_num for page_num in failed_pages if not page_scores[page_num]['passed']]
+
+    text = "".join(page_texts[page_num] + "\n" for page_num in page_numbers)
+    pages_by_engine = dict(Counter(page_engine.values()))
+    info = {
+        'mode': 'cascade',
+        'page_count': page_count,
+        'engine_timings': timings,
+        'pages_by_engine': pages_by_engine,
+        'winner': max(pages_by_engine, key=pages_by_engine.get) if pages_by_engine else None,
+        'pages_below_quality': initially_failed,
+        'pages_still_below_quality': len(failed_pages),
+        'mean_page_score': round(sum(s['score'] for s in page_scores.values()) / page_count, 4) if page_count else 0.0,
+        'timed_out': timed_out
+    }
+    return text, info
+
+def _extract_text_best_of_all(pdf_path: str, doc_context: Optional[PDFDocumentContext] = None) -> Tuple[str, Dict[str, Any]]:
+    """Legacy mode: run every engine on the whole document and keep the longest output."""
     methods = [
-        extract_text_with_pypdf2,
-        extract_text_with_pymupdf,
-        extract_text_with_pdfminer
+        ('pypdf2', extract_text_with_pypdf2),
+        ('pymupdf', extract_text_with_pymupdf),
+        ('pdfminer', extract_text_with_pdfminer)
     ]
     best_text = ""
     best_score = 0
-    for method in methods:
+    winner = None
+    timings = {}
+    for engine, method in methods:
         try:
             print(f"[DEBUG] Trying method: {method.__name__}")
-            text = method(pdf_path)
+            start = time.perf_counter()
+            text = method(pdf_path, doc_context)
+            timings[engine] = round(time.perf_counter() - start, 4)
             print(f"[DEBUG] Method {method.__name__} returned {len(text) if text else 0} characters")
             if not text:
                 continue
@@ -304,80 +474,143 @@ def extract_text_from_pdf(pdf_path: str) -> str:
             if score > best_score:
                 best_text = text
                 best_score = score
+                winner = engine
         except Exception as e:
             print(f"[DEBUG] Exception in {method.__name__}: {e}")
             logger.warning(f"Text extraction method failed: {str(e)}")
             continue
-    print(f"[DEBUG] extract_text_from_pdf returning {len(best_text) if best_text else 0} characters")
-    return best_text
+    return best_text, {'mode': 'best_of_all', 'engine_timings': timings, 'winner': winner}
+
+def extract_text_from_pdf_detailed(pdf_path: str, doc_context: Optional[PDFDocumentContext] = None,
+                                   mode: Optional[str] = None,
+                                   fallback_seconds_per_page: Optional[float] = TEXT_FALLBACK_SECONDS_PER_PAGE) -> Tuple[str, Dict[str, Any]]:
+    """Extract text and report which engine produced it.
+
+    Args:
+        pdf_path: Path to the PDF
+        doc_context: Optional shared document context
+        mode: 'cascade' (default) or 'best_of_all'
+        fallback_seconds_per_page: pdfminer fallback deadline per page in cascade mode (0/None: no deadline)
+
+    Returns:
+        Tuple of (text, extraction_info) where extraction_info holds the mode,
+        per-engine timings in seconds and the winning engine.
+    """
+    mode = mode or TEXT_EXTRACTION_MODE
+    print(f"[DEBUG] Entering extract_text_from_pdf for: {pdf_path} (mode: {mode})")
+    if mode == 'best_of_all':
+        text, info = _extract_text_best_of_all(pdf_path, doc_context)
+    elif doc_context is not None:
+        text, info = _extract_text_cascade(doc_context, fallback_seconds_per_page)
+    else:
+        with PDFDocumentContext(pdf_path) as ctx:
+            text, info = _extract_text_cascade(ctx, fallback_seconds_per_page)
+    print(f"[DEBUG] extract_text_from_pdf returning {len(text) if text else 0} characters")
+    return text, info
+
+def extract_text_from_pdf(pdf_path: str, doc_context: Optional[PDFDocumentContext] = None,
+                          mode: Optional[str] = None) -> str:
+    text, _ = extract_text_from_pdf_detailed(pdf_path, doc_context, mode)
+    return text
+
+def extract_tables_from_pdf_detailed(pdf_path: str, timeout_seconds: int = 30, verbose: bool = False,
+                                     doc_context: Optional[PDFDocumentContext] = None) -> Tuple[list, Dict[str, Any]]:
+    """Extract tables from the pages that have ruling lines, in one camelot call.
+
+    Pages without enough horizontal and vertical rulings to form a grid cannot
+    hold a lattice table and are not passed to camelot (see utils/table_prefilter.py).
+    camelot runs in a child process that is killed after timeout_seconds, so a
+    hung Ghostscript render cannot hold the worker; the tables are then skipped.
 
-def extract_tables_from_pdf(pdf_path: str, timeout_seconds: int = 30, verbose: bool = False) -> list:
-    """Extract tables from PDF with robust Ghostscript handling and worker isolation."""
+    Returns:
+        Tuple of (tables, table_extraction_info) where the info holds the
+        prefilter's page counts and skip rate, the camelot time in seconds and
+        whether camelot was killed at its deadline (timed_out).
+    """
     worker_temp = get_worker_temp_dir()
     worker_id = getattr(thread_local, 'worker_id', 'unknown')
     tables = []
+    info = {'pages_scanned': 0, 'candidate_pages': [], 'pages_skipped': 0, 'skip_rate': 0.0,
+            'prefilter_seconds': 0.0, 'camelot_seconds': 0.0, 'timed_out': False}
     max_retries = 2
     import fitz
-    import camelot
     try:
-        with fitz.open(pdf_path) as doc:
-            total_pages = len(doc)
-            if verbose:
-                print(f"[{worker_id}] Processing {total_pages} pages from {os.path.basename(pdf_path)}")
-            for batch_start in range(0, total_pages, 3):
-                batch_end = min(batch_start + 3, total_pages)
-                page_range = f"{batch_start + 1}-{batch_end}"
-                for attempt in range(max_retries):
-                    try:
-                        if attempt > 0:
-                            time.sleep(0.5 * attempt)
-                            if verbose:
-                                print(f"[{worker_id}] Retry {attempt} for pages {page_range}")
-                        batch_tables = camelot.read_pdf(
-                            pdf_path,
-                            pages=page_range,
-                            flavor='lattice',
-                            strip_text='\n',
-                            layout_kwargs={
-                                'detect_vertical': True,
-                                'line_margin': 0.5,
-                                'char_margin': 2.0
-                            }
-                        )
-                        for table in batch_tables:
-                            if table.accuracy > 0.5:
-                                tables.append({
-                                    'table_id': f"table_{len(tables) + 1}",
-                                    'page': table.page,
-                                    'accuracy': float(table.accuracy),
-                                    'whitespace': float(table.whitespace),
-                                    'order': len(tables) + 1,
-                                    'data': table.df.to_dict(orient='records'),
-                                    'shape': table.df.shape,
-                                    'extraction_method': 'camelot_lattice',
-                                    'worker_id': worker_id,
-                                    'temp_dir': worker_temp
-                                })
-                                if verbose:
-                                    print(f"[{worker_id}] Page {table.page}: Table extracted with accuracy {table.accuracy:.2f}")
-                        break
-                    except Exception as e:
-                        error_msg = str(e).lower()
-                        if 'ghostscript' in error_msg or 'image conversion' in error_msg:
-                            if attempt < max_retries - 1:
-                                if verbose:
-                                    print(f"[{worker_id}] Ghostscript error on pages {page_range}, attempt {attempt + 1}: {str(e)}")
-                                continue
-                            else:
-                                print(f"[{worker_id}] Ghostscript error on pages {page_range} after {max_retries} attempts: {str(e)}")
-                        else:
-                            if verbose:
-                                print(f"[{worker_id}] Table extraction error on pages {page_range}: {str(e)}")
-                            break
+        if doc_context is not None:
+            candidates, stats = find_table_pages(doc_context.doc, doc_context.page_numbers)
+        else:
+            with fitz.open(pdf_path) as doc:
+                candidates, stats = find_table_pages(doc, range(len(doc)))
+        info.update(stats)
+        if verbose:
+            print(f"[{worker_id}] {len(candidates)} of {stats['pages_scanned']} pages of {os.path.basename(pdf_path)} have ruling lines")
+        if not candidates:
+            return tables, info
+        pages = camelot_pages(candidates)
+        start = time.perf_counter()
+        for attempt in range(max_retries):
+            try:
+                if attempt > 0:
+                    time.sleep(0.5 * attempt)
+                    if verbose:
+                        print(f"[{worker_id}] Retry {attempt} for pages {pages}")
+                page_tables = run_with_deadline(
+                    read_lattice_tables,
+                    pdf_path,
+                    pages,
+                    timeout=timeout_seconds,
+                    stage='tables',
+                    strip_text='\n',
+                    layout_kwargs={
+                        'detect_vertical': True,
+                        'line_margin': 0.5,
+                        'char_margin': 2.0
+                    }
+                )
+                for table in page_tables:
+                    if table['accuracy'] > 0.5:
+                        tables.append({
+                            'table_id': f"table_{len(tables) + 1}",
+                            'page': table['page'],
+                            'accuracy': table['accuracy'],
+                            'whitespace': table['whitespace'],
+                            'order': len(tables) + 1,
+                            'data': table['df'].to_dict(orient='records'),
+                            'shape': table['df'].shape,
+                            'extraction_method': 'camelot_lattice',
+                            'worker_id': worker_id,
+                            'temp_dir': worker_temp
+                        })
+                        if verbose:
+                            print(f"[{worker_id}] Page {table['page']}: Table extracted with accuracy {table['accuracy']:.2f}")
+                break
+            except StageTimeout as e:
+                # Retrying a render that hung would only hang again
+                info['timed_out'] = True
+                print(f"[{worker_id}] Table extraction on pages {pages} killed: {str(e)}")
+                break
+            except Exception as e:
+                error_msg = str(e).lower()
+                if 'ghostscript' in error_msg or 'image conversion' in error_msg:
+                    if attempt < max_retries - 1:
+                        if verbose:
+                            print(f"[{worker_id}] Ghostscript error on pages {pages}, attempt {attempt + 1}: {str(e)}")
+                        continue
+                    else:
+                        print(f"[{worker_id}] Ghostscript error on pages {pages} after {max_retries} attempts: {str(e)}")
+                else:
+                    if verbose:
+                        print(f"[{worker_id}] Table extraction error on pages {pages}: {str(e)}")
+                    break
+        info['camelot_seconds'] = round(time.perf_counter() - start, 4)
     except Exception as e:
         print(f"[{worker_id}] Error processing PDF {os.path.basename(pdf_path)}: {str(e)}")
     if verbose:
         print(f"[{worker_id}] Total tables extracted from {os.path.basename(pdf_path)}: {len(tables)}")
+    return tables, info
+
+def extract_tables_from_pdf(pdf_path: str, timeout_seconds: int = 30, verbose: bool = False,
+                            doc_context: Optional[PDFDocumentContext] = None) -> list:
+    tables, _ = extract_tables_from_pdf_detailed(pdf_path, timeout_seconds, verbose, doc_context)
     return tables
 
 def extract_formulas_from_text(text: str) -> List[Dict]:
@@ -422,13 +655,19 @@ def extract_pdf_chunks(pdf_path: str, token_threshold: int = CHUNK_TOKEN_THRESHO
         chunks.append('\n'.join(current_chunk))
     return chunks
 
-def get_domain_for_pdf(file_path: str) -> Optional[str]:
-    """Get domain classification for PDF"""
+def get_domain_for_pdf(file_path: str, text: Optional[str] = None) -> Optional[str]:
+    """Get domain classification for PDF
+
+    Args:
+        file_path: Path to the PDF
+        text: Already extracted text; avoids re-extracting the PDF for the content fallback
+    """
     domain = get_domain_for_file(file_path)
     if not domain:
         # Try content-based classification
-        text = extract_text_from_pdf(file_path)
-        domain_classifier = DomainClassifier()
+        if text is None:
+            text = extract_text_from_pdf(file_path)
+        domain_classifier = get_processor('domain')
         domain_info = domain_classifier.classify(text)
         domain = domain_info.get('domain')
     return domain
@@ -543,6 +782,42 @@ def resolve_indirect_object(obj):
     else:
         return str(obj)
 
+def extract_pdf_metadata(file_path: str, doc_context: Optional[PDFDocumentContext] = None) -> Dict[str, Any]:
+    """Extract the PDF info dictionary with proper type preservation.
+
+    Uses the already-parsed PyMuPDF document when a context is given and only
+    falls back to a separate PyPDF2 parse without one.
+    """
+    metadata = {}
+    try:
+        if doc_context is not None:
+            resolved_info = doc_context.get_metadata()
+        else:
+            with open(file_path, 'rb') as f:
+                pdf = PyPDF2.PdfReader(f)
+                info = pdf.metadata
+                # First resolve any IndirectObjects
+                resolved_info = resolve_indirect_object(info) if info else {}
+        if resolved_info:
+            # Handle each field with proper type conversion
+            metadata.update({
+                'title': resolved_info.get('/Title', ''),
+                'author': resolved_info.get('/Author', ''),
+                'subject': resolved_info.get('/Subject', ''),
+                'creator': resolved_info.get('/Creator', ''),
+                'producer': resolved_info.get('/Producer', ''),
+                'creation_date': convert_pdf_date(resolved_info.get('/CreationDate')),
+                'modification_date': convert_pdf_date(resolved_info.get('/ModDate'))
+            })
+            
+            # Add any additional metadata fields
+            for key, value in resolved_info.items():
+                if key not in metadata and not key.startswith('/'):
+                    metadata[key] = value
+    except Exception as e:
+        logger.warning(f"Metadata extraction failed: {str(e)}")
+    return metadata
+
 def process_pdf_file_enhanced(file_path: str, args: argparse.Namespace) -> Optional[ExtractionResult]:
     worker_temp = get_worker_temp_dir()
     worker_id = getattr(thread_local, 'worker_id', 'unknown')
@@ -551,128 +826,368 @@ def process_pdf_file_enhanced(file_path: str, args: argparse.Namespace) -> Optio
         if getattr(args, 'verbose', False):
             print(f"[{worker_id}] Starting processing: {os.path.basename(file_path)}")
         
-        # Extract text
-        text = extract_text_from_pdf(file_path)
-        print(f"[DEBUG] process_pdf_file_enhanced: Extracted text length: {len(text) if text else 0}")
-        
-        if not text or len(text.strip()) < MIN_TOKEN_THRESHOLD:
-            print(f"[{worker_id}] Extracted text too short: {len(text.strip()) if text else 0} tokens (threshold: {MIN_TOKEN_THRESHOLD})")
-            return None
-        
-        # Get domain classification
-        domain = get_domain_for_pdf(file_path)
-        domain_thresholds = DOMAIN_THRESHOLDS.get(domain, {})
-
-        # === NEW ENHANCEMENTS START HERE ===
-        formula_extractor = FormulaExtractor()
-        chart_extractor = ChartImageExtractor()
-        symbol_processor = FinancialSymbolProcessor()
-        academic_processor = AcademicPaperProcessor()
-        # MemoryOptimizer can be used for chunked processing if needed
-
-        pdf_output_dir = Path(args.output_dir) / 'extracted' / Path(file_path).stem
-        pdf_output_dir.mkdir(parents=True, exist_ok=True)
-
-        formula_results = formula_extractor.extract_comprehensive(file_path, text)
-        image_results = chart_extractor.extract_from_pdf(file_path, str(pdf_output_dir))
-        symbol_results = symbol_processor.extract_symbols(text)
-        symbol_glossary = symbol_processor.generate_symbol_glossary(symbol_results)
-        academic_analysis = academic_processor.detect_academic_paper(text, {})
-        if academic_analysis['is_academic_paper']:
-            domain_thresholds.update(academic_processor.academic_thresholds)
-            logger.info(f"Detected academic paper: {file_path}")
-        content_validation = academic_processor.validate_academic_content(text, {
+        # Parse the PDF once; every stage below reuses the same document
+        with PDFDocumentContext(file_path) as doc_ctx:
+            return _process_pdf_with_context(file_path, args, doc_ctx)
+    except Exception as e:
+        print(f"[{worker_id}] Error processing {os.path.basename(file_path)}: {str(e)}")
+        return None
+
+def _process_pdf_with_context(file_path: str, args: argparse.Namespace, doc_ctx: PDFDocumentContext) -> Optional[ExtractionResult]:
+    """Run every extraction stage for one PDF against a single parsed document."""
+    worker_id = getattr(thread_local, 'worker_id', 'unknown')
+    # Extract text
+    text, text_extraction_info = extract_text_from_pdf_detailed(
+        file_path, doc_ctx, mode=getattr(args, 'text_extraction_mode', TEXT_EXTRACTION_MODE),
+        fallback_seconds_per_page=getattr(args, 'text_fallback_seconds_per_page', TEXT_FALLBACK_SECONDS_PER_PAGE)
+    )
+    print(f"[DEBUG] process_pdf_file_enhanced: Extracted text length: {len(text) if text else 0}")
+    
+    if not text or len(text.strip()) < MIN_TOKEN_THRESHOLD:
+        print(f"[{worker_id}] Extracted text too short: {len(text.strip()) if text else 0} tokens (threshold: {MIN_TOKEN_THRESHOLD})")
+        return None
+    
+    content = extract_pdf_page_content(file_path, args, doc_ctx, text=text, text_extraction_info=text_extraction_info)
+    # Extract metadata from the already-parsed document
+    metadata = extract_pdf_metadata(file_path, doc_ctx)
+    return finalize_pdf_result(file_path, args, content, metadata, doc_ctx.file_size)
+
+def extract_ocr_formulas(file_path: str, args: argparse.Namespace, doc_ctx: PDFDocumentContext) -> Tuple[List[Dict[str, Any]], bool]:
+    """OCR formula pass over the pages covered by doc_ctx, in a child process killed at the stage deadline.
+
+    Returns:
+        Tuple of (formulas, timed_out); a killed pass contributes no OCR formulas
+    """
+    page_numbers = doc_ctx.page_numbers
+    timeout = stage_timeout(getattr(args, 'ocr_seconds_per_page', OCR_SECONDS_PER_PAGE), len(page_numbers))
+    try:
+        ocr_texts = run_with_deadline(ocr_page_texts, file_path, page_numbers, timeout=timeout, stage='ocr')
+    except StageTimeout as e:
+        logger.warning(f"OCR on {os.path.basename(file_path)} killed: {str(e)}")
+        return [], True
+    except Exception as e:
+        logger.error(f"Error extracting formulas via OCR from PDF {file_path}: {str(e)}")
+        return [], False
+    return get_processor('formula').extract_from_ocr_texts(ocr_texts), False
+
+def extract_pdf_page_content(file_path: str, args: argparse.Namespace, doc_ctx: PDFDocumentContext,
+                             text: Optional[str] = None,
+                             text_extraction_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Run the page-level stages (text, PDF/OCR formulas, charts, tables) on the pages covered by doc_ctx.
+
+    Page numbers in the returned formulas, images and tables are absolute, so
+    contents from several page ranges of the same PDF can be stitched together.
+    timed_out_stages lists the stages killed at their deadline.
+    """
+    if text is None:
+        text, text_extraction_info = extract_text_from_pdf_detailed(
+            file_path, doc_ctx, mode=getattr(args, 'text_extraction_mode', TEXT_EXTRACTION_MODE),
+            fallback_seconds_per_page=getattr(args, 'text_fallback_seconds_per_page', TEXT_FALLBACK_SECONDS_PER_PAGE)
+        )
+    formula_extractor = get_processor('formula')
+    chart_extractor = get_processor('chart')
+
+    pdf_output_dir = Path(args.output_dir) / 'extracted' / Path(file_path).stem
+    pdf_output_dir.mkdir(parents=True, exist_ok=True)
+
+    pdf_formulas = formula_extractor.extract_from_pdf(file_path, doc_ctx)
+    ocr_formulas, ocr_timed_out = extract_ocr_formulas(file_path, args, doc_ctx)
+    image_results = chart_extractor.extract_from_pdf(file_path, str(pdf_output_dir), doc_context=doc_ctx)
+    tables = []
+    table_extraction_info = None
+    if not getattr(args, 'disable_tables', False):
+        tables, table_extraction_info = extract_tables_from_pdf_detailed(file_path, timeout_seconds=getattr(args, 'timeout', 30), verbose=getattr(args, 'verbose', False), doc_context=doc_ctx)
+    page_numbers = doc_ctx.page_numbers
+    timed_out_stages = [
+        stage for stage, timed_out in (
+            ('text_fallback', (text_extraction_info or {}).get('timed_out')),
+            ('ocr', ocr_timed_out),
+            ('tables', (table_extraction_info or {}).get('timed_out'))
+        ) if timed_out
+    ]
+    return {
+        'page_range': (page_numbers[0], page_numbers[-1] + 1) if page_numbers else (0, 0),
+        'text': text,
+        'text_extraction': text_extraction_info,
+        'pdf_formulas': pdf_formulas,
+        'ocr_formulas': ocr_formulas,
+        'images': image_results,
+        'tables': tables,
+        'table_extraction': table_extraction_info,
+        'timed_out_stages': timed_out_stages
+    }
+
+def finalize_pdf_result(file_path: str, args: argparse.Namespace, content: Dict[str, Any],
+                        metadata: Dict[str, Any], file_size: int) -> Optional[ExtractionResult]:
+    """Run the document-level stages on extracted page content and write the outputs."""
+    text = content['text']
+    tables = content['tables']
+    image_results = content['images']
+
+    # Get domain classification
+    domain = get_domain_for_pdf(file_path, text)
+    domain_thresholds = dict(DOMAIN_THRESHOLDS.get(domain, {}))
+
+    # === NEW ENHANCEMENTS START HERE ===
+    formula_extractor = get_processor('formula')
+    symbol_processor = get_processor('symbols')
+    academic_processor = get_processor('academic')
+    # MemoryOptimizer can be used for chunked processing if needed
+
+    formula_results = formula_extractor.extract_comprehensive(
+        file_path, text,
+        pdf_formulas=content['pdf_formulas'],
+        ocr_formulas=content['ocr_formulas']
+    )
+    symbol_results = symbol_processor.extract_symbols(text)
+    symbol_glossary = symbol_processor.generate_symbol_glossary(symbol_results)
+    academic_analysis = academic_processor.detect_academic_paper(text, {})
+    if academic_analysis['is_academic_paper']:
+        domain_thresholds.update(academic_processor.academic_thresholds)
+        logger.info(f"Detected academic paper: {file_path}")
+    content_validation = academic_processor.validate_academic_content(text, {
+        'formulas': formula_results,
+        'images': image_results,
+        'symbols': symbol_results
+    })
+    # === EXISTING CODE CONTINUES ===
+    # Quality checks (existing + enhancements)
+    quality_checks = {
+        'language_confidence': detect_language_confidence(text, mixed_lang_ratio=args.mixed_lang_ratio),
+        'corruption': detect_corruption(text, file_type='.pdf', thresholds=args.corruption_thresholds),
+        'machine_translation': detect_machine_translation(text, config_path=args.mt_config, file_type='.pdf', domain=domain),
+        'academic_analysis': academic_analysis,
+        'content_validation': content_validation,
+        'symbol_richness': {
+            'total_symbols': symbol_results['statistics']['total_symbols'],
+            'unique_symbols': symbol_results['statistics']['unique_symbols'],
+            'financial_symbols': len([s for s in symbol_results['symbols_by_position'] if 'financial' in s['type']])
+        }
+    }
+    quality_metrics = {
+        **quality_checks,
+        **domain_thresholds,
+        'extraction_quality': {
+            'tables_detected': len(tables) > 0,
+            'formulas_detected': formula_results['statistics']['total_formulas'] > 0,
+            'charts_detected': len([img for img in image_results if img['is_chart']]) > 0,
+            'symbols_detected': symbol_results['statistics']['total_symbols'] > 0,
+            'token_count': count_tokens(text),
+            'quality_flag': quality_flag(text),
+            'is_academic_paper': academic_analysis['is_academic_paper'],
+            'academic_confidence': academic_analysis['confidence']
+        }
+    }
+    # Stages killed at their deadline; the file is still written, without that stage's output
+    timed_out_stages = content.get('timed_out_stages', [])
+    metadata = dict(metadata)
+    metadata.update({
+        'domain': domain,
+        'quality_metrics': quality_metrics,
+        'is_scientific_paper': detect_scientific_paper(text, metadata),
+        'content_hash': hashlib.md5(text.encode('utf-8')).hexdigest(),
+        'file_size': file_size,
+        'extraction_date': datetime.now(timezone.utc).isoformat(),
+        'text_extraction': content['text_extraction'],
+        'table_extraction': content.get('table_extraction'),
+        'timed_out_stages': timed_out_stages,
+        'enhancement_results': {
             'formulas': formula_results,
             'images': image_results,
-            'symbols': symbol_results
-        })
-        # === EXISTING CODE CONTINUES ===
-        tables = []
-        if not getattr(args, 'disable_tables', False):
-            tables = extract_tables_from_pdf(file_path, timeout_seconds=getattr(args, 'timeout', 30), verbose=getattr(args, 'verbose', False))
-        # Quality checks (existing + enhancements)
-        quality_checks = {
-            'language_confidence': detect_language_confidence(text, mixed_lang_ratio=args.mixed_lang_ratio),
-            'corruption': detect_corruption(text, file_type='.pdf', thresholds=args.corruption_thresholds),
-            'machine_translation': detect_machine_translation(text, config_path=args.mt_config, file_type='.pdf', domain=domain),
-            'academic_analysis': academic_analysis,
-            'content_validation': content_validation,
-            'symbol_richness': {
-                'total_symbols': symbol_results['statistics']['total_symbols'],
-                'unique_symbols': symbol_results['statistics']['unique_symbols'],
-                'financial_symbols': len([s for s in symbol_results['symbols_by_position'] if 'financial' in s['type']])
-            }
-        }
-        quality_metrics = {
-            **quality_checks,
-            **domain_thresholds,
-            'extraction_quality': {
-                'tables_detected': len(tables) > 0,
-                'formulas_detected': formula_results['statistics']['total_formulas'] > 0,
-                'charts_detected': len([img for img in image_results if img['is_chart']]) > 0,
-                'symbols_detected': symbol_results['statistics']['total_symbols'] > 0,
-                'token_count': count_tokens(text),
-                'quality_flag': quality_flag(text),
-                'is_academic_paper': academic_analysis['is_academic_paper'],
-                'academic_confidence': academic_analysis['confidence']
-            }
+            'symbols': symbol_results,
+            'symbol_glossary': symbol_glossary,
+            'academic_analysis': academic_analysis
         }
-        # Extract metadata with proper type preservation
-        metadata = {}
+    })
+    result = ExtractionResult(
+        text=text,
+        metadata=metadata,
+        tables=tables,
+        formulas=formula_results['formulas'],
+        quality_metrics=quality_metrics,
+        errors=[],
+        warnings=[]
+    )
+    quality = quality_flag(text)
+    txt_path, json_path = write_outputs(args.output_dir, Path(file_path), text, metadata, quality, tables=tables, formulas=formula_results['formulas'])
+    return result
+
+# --- Page-range parallelism for large PDFs ---
+def get_pdf_page_count(file_path: str) -> int:
+    """Page count without parsing page content (0 if the PDF cannot be opened)."""
+    try:
+        with fitz.open(file_path) as doc:
+            return len(doc)
+    except Exception as e:
+        logger.warning(f"Could not read page count for {file_path}: {str(e)}")
+        return 0
+
+def split_page_ranges(page_count: int, range_size: int = PAGE_RANGE_SIZE,
+                      threshold: int = LARGE_PDF_PAGE_THRESHOLD) -> List[Tuple[int, int]]:
+    """Split a document into (start, end) page ranges; small documents stay whole."""
+    if page_count < threshold or range_size <= 0:
+        return [(0, page_count)]
+    return [(start, min(start + range_size, page_count)) for start in range(0, page_count, range_size)]
+
+def extract_pdf_task(file_path: str, args: argparse.Namespace, range_size: int = PAGE_RANGE_SIZE,
+                     range_threshold: int = LARGE_PDF_PAGE_THRESHOLD, hash_input: bool = False,
+                     cache_entry: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Worker entry point for one input PDF: extract it, or plan its page ranges if it is large.
+
+    The page count is read here rather than in the parent, so a PDF that hangs
+    fitz is killed at the pool's task deadline like any other task.
+
+    Args:
+        file_path: Input PDF
+        args: Worker arguments
+        range_size: Pages per range for large documents
+        range_threshold: Page count from which a document is split
+        hash_input: Hash the file for the extraction cache first (the parent's
+            stat index did not know it, and the parent never reads input files)
+        cache_entry: The parent's snapshot of the file's cache entry; when the
+            hash matches it and its outputs exist, they are reused as they are
+
+    Returns:
+        dict with file_hash (None unless hash_input) and either cached (the
+        reused entry), page_ranges (the parent submits one task per range) or
+        result (the ExtractionResult, None on failure)
+    """
+    file_hash = calculate_hash(file_path) if hash_input else None
+    if file_hash and reusable(cache_entry, file_hash):
+        # Touched, copied over or restored, but the content is what was extracted last time
+        return {'file_hash': file_hash, 'cached': cache_entry}
+    page_count = get_pdf_page_count(file_path)
+    page_ranges = split_page_ranges(page_count, range_size, range_threshold)
+    status = {'file_hash': file_hash, 'page_count': page_count}
+    if len(page_ranges) > 1:
+        status['page_ranges'] = page_ranges
+    else:
+        status['result'] = process_pdf_file_enhanced(file_path, args)
+    return status
+
+def range_part_path(output_dir: str, file_path: str, index: int) -> Path:
+    """Where the worker for one page range of a large PDF leaves its extracted content."""
+    key = hashlib.md5(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+    return Path(output_dir) / CACHE_DIR_NAME / 'ranges' / f"{key}_{index}.pkl"
+
+def remove_range_parts(part_paths: List[str]):
+    """Delete the page-range parts of a document once it is finalized or has failed."""
+    for part_path in part_paths:
         try:
-            with open(file_path, 'rb') as f:
-                pdf = PyPDF2.PdfReader(f)
-                info = pdf.metadata
-                if info:
-                    # First resolve any IndirectObjects
-                    resolved_info = resolve_indirect_object(info)
-                    
-                    # Handle each field with proper type conversion
-                    metadata.update({
-                        'title': resolved_info.get('/Title', ''),
-                        'author': resolved_info.get('/Author', ''),
-                        'subject': resolved_info.get('/Subject', ''),
-                        'creator': resolved_info.get('/Creator', ''),
-                        'producer': resolved_info.get('/Producer', ''),
-                        'creation_date': convert_pdf_date(resolved_info.get('/CreationDate')),
-                        'modification_date': convert_pdf_date(resolved_info.get('/ModDate'))
-                    })
-                    
-                    # Add any additional metadata fields
-                    for key, value in resolved_info.items():
-                        if key not in metadata and not key.startswith('/'):
-                            metadata[key] = value
-        except Exception as e:
-            logger.warning(f"Metadata extraction failed: {str(e)}")
-        metadata.update({
-            'domain': domain,
-            'quality_metrics': quality_metrics,
-            'is_scientific_paper': detect_scientific_paper(text, metadata),
-            'content_hash': hashlib.md5(text.encode('utf-8')).hexdigest(),
-            'file_size': os.path.getsize(file_path),
-            'extraction_date': datetime.now(timezone.utc).isoformat(),
-            'enhancement_results': {
-                'formulas': formula_results,
-                'images': image_results,
-                'symbols': symbol_results,
-                'symbol_glossary': symbol_glossary,
-                'academic_analysis': academic_analysis
-            }
-        })
-        result = ExtractionResult(
-            text=text,
-            metadata=metadata,
-            tables=tables,
-            formulas=formula_results['formulas'],
-            quality_metrics=quality_metrics,
-            errors=[],
-            warnings=[]
-        )
-        quality = quality_flag(text)
-        txt_path, json_path = write_outputs(args.output_dir, Path(file_path), text, metadata, quality, tables=tables, formulas=formula_results['formulas'])
-        return result
+            os.remove(part_path)
+        except OSError:
+            pass
+
+def process_pdf_page_range(file_path: str, page_range: Tuple[int, int], args: argparse.Namespace,
+                           index: int = 0) -> Optional[str]:
+    """Worker entry point: extract the page-level content of one page range of a large PDF.
+
+    The content (text, tables, images) is written to ``range_part_path`` rather
+    than returned, so only its path is pickled back to the parent and on to the
+    finalize task.
+    """
+    worker_id = getattr(thread_local, 'worker_id', 'unknown')
+    try:
+        if getattr(args, 'verbose', False):
+            print(f"[{worker_id}] Processing pages {page_range[0] + 1}-{page_range[1]} of {os.path.basename(file_path)}")
+        with PDFDocumentContext(file_path, page_range=page_range) as doc_ctx:
+            content = extract_pdf_page_content(file_path, args, doc_ctx)
+            # Document-level info only needs to be stored once
+            content['metadata'] = extract_pdf_metadata(file_path, doc_ctx) if page_range[0] == 0 else None
+            content['file_size'] = doc_ctx.file_size
+        part_path = range_part_path(args.output_dir, file_path, index)
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        # Written under a temporary name so a killed worker never leaves a partial part behind
+        fd, tmp_path = tempfile.mkstemp(dir=part_path.parent, prefix=f".{part_path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, part_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return str(part_path)
     except Exception as e:
-        print(f"[{worker_id}] Error processing {os.path.basename(file_path)}: {str(e)}")
+        print(f"[{worker_id}] Error processing pages {page_range[0] + 1}-{page_range[1]} of {os.path.basename(file_path)}: {str(e)}")
+        return None
+
+def merge_pdf_page_contents(contents: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Stitch page-range contents back together in page order."""
+    contents = sorted(contents, key=lambda c: c['page_range'][0])
+    tables = []
+    for content in contents:
+        for table in content['tables']:
+            table = dict(table)
+            table['table_id'] = f"table_{len(tables) + 1}"
+            table['order'] = len(tables) + 1
+            tables.append(table)
+    engine_timings = Counter()
+    pages_by_engine = Counter()
+    pages_below_quality = 0
+    pages_still_below_quality = 0
+    for content in contents:
+        info = content.get('text_extraction') or {}
+        engine_timings.update(info.get('engine_timings', {}))
+        pages_by_engine.update(info.get('pages_by_engine', {}))
+        pages_below_quality += info.get('pages_below_quality', 0)
+        pages_still_below_quality += info.get('pages_still_below_quality', 0)
+    first_info = (contents[0].get('text_extraction') or {}) if contents else {}
+    text_extraction = {
+        'mode': first_info.get('mode'),
+        'page_count': sum(c['page_range'][1] - c['page_range'][0] for c in contents),
+        'page_ranges': [list(c['page_range']) for c in contents],
+        'engine_timings': {engine: round(seconds, 4) for engine, seconds in engine_timings.items()},
+        'pages_by_engine': dict(pages_by_engine),
+        'winner': pages_by_engine.most_common(1)[0][0] if pages_by_engine else first_info.get('winner'),
+        'pages_below_quality': pages_below_quality,
+        'pages_still_below_quality': pages_still_below_quality,
+        'timed_out': any((c.get('text_extraction') or {}).get('timed_out') for c in contents)
+    }
+    table_infos = [c['table_extraction'] for c in contents if c.get('table_extraction')]
+    table_extraction = None
+    if table_infos:
+        pages_scanned = sum(info['pages_scanned'] for info in table_infos)
+        pages_skipped = sum(info['pages_skipped'] for info in table_infos)
+        table_extraction = {
+            'pages_scanned': pages_scanned,
+            'candidate_pages': [page for info in table_infos for page in info['candidate_pages']],
+            'pages_skipped': pages_skipped,
+            'skip_rate': round(pages_skipped / pages_scanned, 4) if pages_scanned else 0.0,
+            'prefilter_seconds': round(sum(info['prefilter_seconds'] for info in table_infos), 4),
+            'camelot_seconds': round(sum(info['camelot_seconds'] for info in table_infos), 4),
+            'timed_out': any(info.get('timed_out') for info in table_infos)
+        }
+    return {
+        'page_range': (contents[0]['page_range'][0], contents[-1]['page_range'][1]) if contents else (0, 0),
+        'text': ''.join(c['text'] for c in contents),
+        'text_extraction': text_extraction,
+        'pdf_formulas': [f for c in contents for f in c['pdf_formulas']],
+        'ocr_formulas': [f for c in contents for f in c['ocr_formulas']],
+        'images': [img for c in contents for img in c['images']],
+        'tables': tables,
+        'table_extraction': table_extraction,
+        'timed_out_stages': list(dict.fromkeys(stage for c in contents for stage in c.get('timed_out_stages', [])))
+    }
+
+def finalize_pdf_from_ranges(file_path: str, part_paths: List[str], args: argparse.Namespace) -> Optional[ExtractionResult]:
+    """Worker entry point: load the page-range parts, stitch them and run the document-level stages."""
+    worker_id = getattr(thread_local, 'worker_id', 'unknown')
+    try:
+        contents = []
+        for part_path in part_paths:
+            with open(part_path, 'rb') as f:
+                contents.append(pickle.load(f))
+        content = merge_pdf_page_contents(contents)
+        text = content['text']
+        if not text or len(text.strip()) < MIN_TOKEN_THRESHOLD:
+            print(f"[{worker_id}] Extracted text too short: {len(text.strip()) if text else 0} tokens (threshold: {MIN_TOKEN_THRESHOLD})")
+            return None
+        metadata = next((c['metadata'] for c in contents if c.get('metadata') is not None), {})
+        file_size = contents[0].get('file_size') or os.path.getsize(file_path)
+        return finalize_pdf_result(file_path, args, content, metadata, file_size)
+    except Exception as e:
+        print(f"[{worker_id}] Error finalizing {os.path.basename(file_path)}: {str(e)}")
         return None
 
 def run_with_project_config(
@@ -741,12 +1256,255 @@ def run_with_paths(
     """
     # Use processor config if provided
     if processor_config:
-        global MIN_TOKEN_THRESHOLD, LOW_QUALITY_TOKEN_THRESHOLD, CHUNK_TOKEN_THRESHOLD
+        global MIN_TOKEN_THRESHOLD, LOW_QUALITY_TOKEN_THRESHOLD, CHUNK_TOKEN_THRESHOLD, TEXT_EXTRACTION_MODE
         MIN_TOKEN_THRESHOLD = processor_config.get('min_token_threshold', MIN_TOKEN_THRESHOLD)
         LOW_QUALITY_TOKEN_THRESHOLD = processor_config.get('low_quality_token_threshold', LOW_QUALITY_TOKEN_THRESHOLD)
         CHUNK_TOKEN_THRESHOLD = processor_config.get('chunk_token_threshold', CHUNK_TOKEN_THRESHOLD)
-    
-    # Rest of the existing function...
+        TEXT_EXTRACTION_MODE = processor_config.get('text_extraction_mode', TEXT_EXTRACTION_MODE)
+
+    logger = logging.getLogger(__name__)
+    input_dir = Path(input_dir)
+    output_dir = Path(output_dir)
+    if not input_dir.exists():
+        raise ValueError(f"Input directory missing: {input_dir}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Workers only insert metadata rows; the table is created or migrated here, once
+    prepare_store(output_dir)
+    if verbose:
+        logger.setLevel(logging.DEBUG)
+    processor_config = processor_config or {}
+    # Walk the input lazily; only a bounded window of files is ever queued in the parent
+    input_files = walk_input_files(input_dir, SUPPORTED_EXTENSIONS)
+    first_file = next(input_files, None)
+    if first_file is None:
+        logger.error(f"No supported files found in {input_dir}")
+        return {'success': False, 'processed_files': 0, 'files_processed': 0, 'successful': 0, 'failed': 0,
+                'low_quality': 0, 'errors': [f'No supported files found in {input_dir}']}
+    input_files = itertools.chain([first_file], input_files)
+    files_found = 0
+
+    worker_args = types.SimpleNamespace(
+        output_dir=str(output_dir),
+        verbose=verbose,
+        auto_normalize=auto_normalize,
+        chunking_mode=chunking_mode,
+        chunk_overlap=chunk_overlap,
+        timeout=processor_config.get('timeout', DEFAULT_TIMEOUT),
+        text_extraction_mode=TEXT_EXTRACTION_MODE,
+        disable_tables=processor_config.get('disable_tables', False),
+        mixed_lang_ratio=processor_config.get('mixed_lang_ratio', 0.30),
+        corruption_thresholds=processor_config.get('corruption_thresholds'),
+        mt_config=processor_config.get('mt_config'),
+        text_fallback_seconds_per_page=processor_config.get('text_fallback_seconds_per_page', TEXT_FALLBACK_SECONDS_PER_PAGE),
+        ocr_seconds_per_page=processor_config.get('ocr_seconds_per_page', OCR_SECONDS_PER_PAGE)
+    )
+    successful_files = []
+    failed_files = []
+    low_quality_files = []
+    # "path: stage" for files whose task or one of whose stages was killed at its deadline
+    timed_out_files = []
+
+    cache = None
+    if processor_config.get('use_extraction_cache', True):
+        fingerprint_config = {
+            key: value for key, value in vars(worker_args).items()
+            if key not in ('output_dir', 'verbose', 'auto_normalize')
+        }
+        fingerprint_config.update({
+            'min_token_threshold': MIN_TOKEN_THRESHOLD,
+            'low_quality_token_threshold': LOW_QUALITY_TOKEN_THRESHOLD
+        })
+        cache = ExtractionCache(output_dir, 'pdf', compute_fingerprint(fingerprint_config, PIPELINE_VERSION, PIPELINE_CODE_FILES))
+
+    # Resume an interrupted run: files the journal marks done (and unchanged) are not resubmitted
+    journal = None
+    resumed_files = 0
+    if processor_config.get('resume', True):
+        journal = WorkJournal(output_dir, 'pdf', max_attempts=processor_config.get('max_attempts', DEFAULT_MAX_ATTEMPTS))
+        journal.begin_run()
+
+    def walked_files():
+        """(path, size) of the input PDFs, straight from the directory walk"""
+        nonlocal files_found
+        for file_path, size in input_files:
+            files_found += 1
+            yield file_path, size
+
+    def already_extracted(file_path: str) -> bool:
+        """Account for a file the journal or the cache says needs no work (stat checks only; nothing is read)"""
+        nonlocal resumed_files
+        if journal is not None and not journal.admit(file_path):
+            state = journal.get(file_path)
+            if state['status'] == 'done':
+                resumed_files += 1
+                successful_files.append(file_path)
+                if state.get('quality') == 'low_quality':
+                    low_quality_files.append(file_path)
+                if cache is not None:
+                    # Only a hash the worker or the stat index supplies is recorded; nothing is read here
+                    file_hash = state.get('file_hash') or cache.known_hash(file_path)
+                    if file_hash:
+                        cache.record(file_path, state['outputs'], file_hash=file_hash, quality=state.get('quality'))
+            else:
+                failed_files.append(f"{file_path}: Skipped after {state['attempts']} failed attempts ({state.get('error')})")
+            return True
+        # Skip files whose size and mtime, config and extractor code are unchanged since the last run
+        if cache is not None:
+            entry = cache.lookup(file_path)
+            if entry is not None:
+                successful_files.append(file_path)
+                if entry.get('quality') == 'low_quality':
+                    low_quality_files.append(file_path)
+                if journal is not None:
+                    journal.mark_done(file_path, entry['outputs'], sync=False, quality=entry.get('quality'), cached=True,
+                                      file_hash=cache.known_hash(file_path))
+                return True
+        return False
+
+    # Split large documents into page ranges so one book cannot hold a single worker for the whole tail of the batch
+    range_size = processor_config.get('page_range_size', PAGE_RANGE_SIZE)
+    range_threshold = processor_config.get('large_pdf_page_threshold', LARGE_PDF_PAGE_THRESHOLD)
+    # Part paths of split documents: filled as ranges finish, then kept until the finalize task is done
+    range_contents = {}
+    range_parts = {}
+    # Hashes returned by workers for split documents, recorded once the merged outputs are written
+    range_hashes = {}
+
+    def tasks(lookahead: int):
+        # Biggest documents first (by size from the walk) so they and their ranges start early
+        for file_path in largest_first(walked_files(), lookahead):
+            if already_extracted(file_path):
+                continue
+            if journal is not None:
+                journal.mark_running(file_path)
+            # Files the cache has not seen at this size and mtime are hashed by the worker,
+            # which reuses the outputs in their entry if the content turns out unchanged
+            hash_input = cache is not None and cache.known_hash(file_path) is None
+            cache_entry = cache.snapshot(file_path) if hash_input else None
+            yield (('file', file_path, None), extract_pdf_task,
+                   (file_path, worker_args, range_size, range_threshold, hash_input, cache_entry))
+
+    # Pool sized from cores and available memory; workers are recycled and runaway tasks killed
+    with ManagedProcessPool.from_config(processor_config, POOL_DEFAULTS, worker_initializer,
+                                        (processor_config.get('processor_settings'), worker_args.mt_config)) as executor:
+        max_in_flight = executor.max_workers * processor_config.get('tasks_per_worker', DEFAULT_TASKS_PER_WORKER)
+        lookahead = submit_lookahead(max_in_flight, processor_config.get('submit_lookahead'))
+        scheduler = BoundedScheduler(executor, tasks(lookahead), max_in_flight)
+        with tqdm() as progress:
+            for (kind, file_path, index), future in scheduler:
+                error = 'Failed to process (see logs for details)'
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Worker failed on {file_path}: {str(e)}")
+                    error = f"{type(e).__name__}: {str(e)}"
+                    result = None
+                    if isinstance(e, TaskTimeout):
+                        timed_out_files.append(f"{file_path}: {'page range' if kind == 'range' else 'file'}")
+                file_hash = None
+                if kind == 'file' and result is not None:
+                    file_hash = result['file_hash']
+                    if result.get('cached'):
+                        progress.update(1)
+                        entry = result['cached']
+                        successful_files.append(file_path)
+                        if entry.get('quality') == 'low_quality':
+                            low_quality_files.append(file_path)
+                        cache.record(file_path, entry['outputs'], file_hash=file_hash, hit=True, quality=entry.get('quality'))
+                        if journal is not None:
+                            journal.mark_done(file_path, entry['outputs'], quality=entry.get('quality'), cached=True,
+                                              file_hash=file_hash)
+                        continue
+                    if result.get('page_ranges'):
+                        page_ranges = result['page_ranges']
+                        logger.info(f"Splitting {os.path.basename(file_path)} ({result['page_count']} pages) into {len(page_ranges)} page ranges")
+                        range_contents[file_path] = [None] * len(page_ranges)
+                        range_hashes[file_path] = file_hash
+                        for range_index, page_range in enumerate(page_ranges):
+                            scheduler.add(('range', file_path, range_index), process_pdf_page_range,
+                                          file_path, page_range, worker_args, range_index)
+                        continue
+                    result = result['result']
+                elif kind == 'merge':
+                    file_hash = range_hashes.pop(file_path, None)
+                    remove_range_parts(range_parts.pop(file_path, []))
+                if kind == 'range':
+                    parts = range_contents.get(file_path)
+                    if parts is None:
+                        # Another range of this file already failed
+                        if result is not None:
+                            remove_range_parts([result])
+                        continue
+                    if result is None:
+                        del range_contents[file_path]
+                        range_hashes.pop(file_path, None)
+                        remove_range_parts([part for part in parts if part is not None])
+                        error = f"Failed to process page range {index + 1}/{len(parts)} ({error})"
+                        failed_files.append(f"{file_path}: {error}")
+                        if journal is not None:
+                            journal.mark_failed(file_path, error)
+                        progress.update(1)
+                        continue
+                    parts[index] = result
+                    if all(part is not None for part in parts):
+                        del range_contents[file_path]
+                        range_parts[file_path] = parts
+                        scheduler.add(('merge', file_path, None), finalize_pdf_from_ranges, file_path, parts, worker_args)
+                    continue
+                progress.update(1)
+                if result:
+                    successful_files.append(file_path)
+                    quality = result.quality_metrics['extraction_quality']['quality_flag']
+                    if quality == 'low_quality':
+                        low_quality_files.append(file_path)
+                    outputs = output_paths(output_dir, Path(file_path), quality)
+                    if result.metadata.get('timed_out_stages'):
+                        timed_out_files.append(f"{file_path}: {', '.join(result.metadata['timed_out_stages'])}")
+                    if cache is not None:
+                        cache.record(file_path, outputs, file_hash=file_hash, hit=False, quality=quality)
+                    if journal is not None:
+                        journal.mark_done(file_path, outputs, quality=quality, file_hash=file_hash)
+                else:
+                    failed_files.append(f"{file_path}: {error}")
+                    if journal is not None:
+                        journal.mark_failed(file_path, error)
+                if cache is not None and progress.n % CACHE_SAVE_INTERVAL == 0:
+                    # Keep the cache index close to the journal so a resumed run can skip re-hashing
+                    cache.save()
+                logger.info(f"Progress: {progress.n} files extracted, {files_found} found so far ({len(successful_files)} successful)")
+    pool_stats = executor.summary()
+    logger.info(f"Worker pool: {pool_stats['workers_started']} workers started, peak RSS {pool_stats['peak_rss_mb']} MB, "
+                f"killed {pool_stats['killed']}, {pool_stats['requeued']} tasks requeued")
+    if resumed_files:
+        logger.info(f"Resumed: {resumed_files} files were already done")
+    if timed_out_files:
+        logger.warning(f"Timed out: {len(timed_out_files)} files had work killed at its deadline")
+    logger.info(f"Processing complete. {len(successful_files)}/{files_found} files processed successfully")
+    cache_stats = {'hits': 0, 'misses': files_found}
+    if cache is not None:
+        cache.save()
+        cache_stats = cache.stats()
+        logger.info(f"Extraction cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    if journal is not None:
+        journal.complete()
+        journal.close()
+    if auto_normalize:
+        logger.info("[INFO] Running metadata normalization on output directory...")
+        normalize_directory(output_dir)
+    return {
+        'success': len(failed_files) == 0,
+        'processed_files': files_found,
+        'files_processed': len(successful_files),
+        'successful': len(successful_files),
+        'failed': len(failed_files),
+        'low_quality': len(low_quality_files),
+        'resumed': resumed_files,
+        'cache': cache_stats,
+        'pool': pool_stats,
+        'timed_out': len(timed_out_files),
+        'timed_out_files': timed_out_files,
+        'errors': failed_files
+    }
 
 class BatchTextExtractorEnhancedPrerefactor:
     """Enhanced batch processor for PDF files with pre-refactoring features"""
@@ -784,7 +1542,10 @@ class BatchTextExtractorEnhancedPrerefactor:
             'max_retries': MAX_RETRIES,
             'batch_size': BATCH_SIZE,
             'verbose': False,
-            'auto_normalize': True
+            'auto_normalize': True,
+            'text_extraction_mode': TEXT_EXTRACTION_MODE,
+            'resume': True,
+            'max_attempts': DEFAULT_MAX_ATTEMPTS
         })
     
     def process_directory(self, input_dir: str, output_dir: str) -> Dict[str, Any]:
@@ -806,6 +1567,7 @@ class BatchTextExtractorEnhancedPrerefactor:
                 chunking_mode=self.config.get('chunking_mode', 'page'),
                 chunk_overlap=self.config.get('chunk_overlap', 1),
                 timeout=self.config.get('timeout', DEFAULT_TIMEOUT),
+                text_extraction_mode=self.config.get('text_extraction_mode', TEXT_EXTRACTION_MODE),
                 disable_tables=False,
                 mixed_lang_ratio=0.30,
                 corruption_thresholds=None,
@@ -855,6 +1617,7 @@ class BatchTextExtractorEnhancedPrerefactor:
                 chunking_mode=self.config.get('chunking_mode', 'page'),
                 chunk_overlap=self.config.get('chunk_overlap', 1),
                 timeout=self.config.get('timeout', DEFAULT_TIMEOUT),
+                text_extraction_mode=self.config.get('text_extraction_mode', TEXT_EXTRACTION_MODE),
                 disable_tables=False,
                 mixed_lang_ratio=0.30,
                 corruption_thresholds=None,
@@ -910,6 +1673,8 @@ def main():
     print(f"Successful extractions: {results['successful']}")
     print(f"Failed extractions: {results['failed']}")
     print(f"Low quality files: {results['low_quality']}")
+    if 'cache' in results:
+        print(f"Extraction cache: {results['cache']['hits']} hits, {results['cache']['misses']} misses")
     
     if args.verbose:
         print("\nDetailed Results:")
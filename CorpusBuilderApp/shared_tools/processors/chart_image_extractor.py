@@ -138,14 +138,22 @@ class ChartImageExtractor:
         # Implementation details...
         return []
     
-    def extract_from_pdf(self, pdf_path: str, output_dir: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Extract all images and charts from a PDF."""
+    def extract_from_pdf(self, pdf_path: str, output_dir: Optional[str] = None,
+                         doc_context=None) -> List[Dict[str, Any]]:
+        """Extract all images and charts from a PDF.
+
+        Args:
+            pdf_path (str): Path to the PDF file
+            output_dir (str): Optional directory for saved images
+            doc_context (PDFDocumentContext): Optional shared document context;
+                when given, the PDF is not re-opened and page renders are reused
+        """
         images_data = []
         total_raster_images = 0
         total_vector_graphics = 0
         
         try:
-            doc = fitz.open(pdf_path)
+            doc = doc_context.doc if doc_context is not None else fitz.open(pdf_path)
             
             # Setup output directory if saving images
             if self.config['save_images'] and output_dir:
@@ -154,7 +162,8 @@ class ChartImageExtractor:
             else:
                 img_output_dir = None
             
-            for page_num in range(len(doc)):
+            page_numbers = doc_context.page_numbers if doc_context is not None else range(len(doc))
+            for page_num in page_numbers:
                 page = doc.load_page(page_num)
                 
                 # Extract images from page
@@ -163,11 +172,12 @@ class ChartImageExtractor:
                 total_raster_images += len(page.get_images())
                 
                 # Look for vector graphics that might be charts
-                vector_graphics = self._extract_vector_graphics(page, page_num)
+                vector_graphics = self._extract_vector_graphics(page, page_num, doc_context)
                 images_data.extend(vector_graphics)
                 total_vector_graphics += len(vector_graphics)
             
-            doc.close()
+            if doc_context is None:
+                doc.close()
             
             print(f"Total raster images found: {total_raster_images}")
             print(f"Total vector graphics detected: {total_vector_graphics}")
@@ -263,14 +273,17 @@ class ChartImageExtractor:
         
         return images
     
-    def _extract_vector_graphics(self, page, page_num: int) -> List[Dict[str, Any]]:
+    def _extract_vector_graphics(self, page, page_num: int, doc_context=None) -> List[Dict[str, Any]]:
         """Extract vector graphics that might be charts, rasterize, OCR, and analyze."""
         vector_graphics = []
         try:
-            # Convert page to image to analyze vector content
-            mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better analysis
-            pix = page.get_pixmap(matrix=mat)
-            pil_image = Image.open(BytesIO(pix.tobytes("png")))
+            # Convert page to image to analyze vector content (2x zoom for better analysis)
+            if doc_context is not None:
+                pil_image = doc_context.get_page_image(page_num, zoom=2.0)
+            else:
+                mat = fitz.Matrix(2.0, 2.0)
+                pix = page.get_pixmap(matrix=mat)
+                pil_image = Image.open(BytesIO(pix.tobytes("png")))
             # Look for chart-like patterns in the rendered page
             chart_detection = self._detect_chart_in_rendered_page(pil_image, page)
             if chart_detection['has_charts']:
@@ -25,6 +25,7 @@ from plotly.subplots import make_subplots
 # Import existing utilities from your codebase
 from ..utils.domain_utils import get_valid_domains, get_domain_for_file
 from ..utils.extractor_utils import safe_filename
+from ..utils.corpus_metadata_store import CorpusMetadataStore, find_output_roots
 from shared_tools.project_config import ProjectConfig
 
 class CorpusAnalyzer:
@@ -64,6 +65,7 @@ class CorpusAnalyzer:
                 'corruption_score': 0.1
             },
             'file_types': ['.txt', '.json'],
+            'use_metadata_store': True,  # Read the per-root metadata table instead of every JSON
             'analysis_cache_ttl': 3600,  # 1 hour
             'visualization_output_dir': 'analysis_reports'
         }
@@ -120,6 +122,8 @@ class CorpusAnalyzer:
     
     def _load_corpus_metadata(self) -> pd.DataFrame:
         """Load metadata from all JSON files in corpus."""
+        if self.config.get('use_metadata_store', True):
+            return self._load_corpus_metadata_from_store()
         metadata_records = []
         subdirs = ['_extracted', 'low_quality']
         if self.recursive:
@@ -198,6 +202,28 @@ class CorpusAnalyzer:
                         continue
         return pd.DataFrame(metadata_records)
     
+    def _load_corpus_metadata_from_store(self) -> pd.DataFrame:
+        """Load the analysis columns from each output root's metadata table.
+        
+        Only JSON files whose size or mtime differ from the stored row are parsed.
+        """
+        frames = []
+        for root in find_output_roots(self.corpus_dir, self.recursive):
+            try:
+                with CorpusMetadataStore(root) as store:
+                    sync_stats = store.sync()
+                    frames.append(store.read_dataframe())
+                self.logger.info(
+                    f"Metadata store {root}: {sync_stats['parsed']} parsed, "
+                    f"{sync_stats['unchanged']} unchanged, {sync_stats['removed']} removed"
+                )
+            except Exception as e:
+                self.logger.warning(f"Error reading metadata store in {root}: {e}")
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+    
     def _analyze_domain_distribution(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze distribution across domains."""
         domain_counts = df['domain'].value_counts()
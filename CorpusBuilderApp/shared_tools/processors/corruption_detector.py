@@ -61,8 +61,11 @@ class CorruptionDetector:
                 'encoding_errors': True,
                 'garbled_text': True,
                 'incomplete_sentences': True,
-                'missing_content': True
+                'missing_content': True,
+                'gibberish': True,
+                'format_errors': True
             },
+            'corruption_threshold': 0.5,
             'encoding_patterns': [
                 r'\\x[0-9a-fA-F]{2}',
                 r'\\u[0-9a-fA-F]{4}',
@@ -208,28 +211,28 @@ class CorruptionDetector:
         }
         
         # Check for encoding errors
-        if self.config['checks']['encoding_errors']:
+        if self.config['checks'].get('encoding_errors', True):
             encoding_score = self._check_encoding_errors(text)
             if encoding_score > 0.3:
                 results['issues_found'].append('encoding_errors')
                 results['corruption_score'] = max(results['corruption_score'], encoding_score)
         
         # Check for gibberish
-        if self.config['checks']['gibberish']:
+        if self.config['checks'].get('gibberish', True):
             gibberish_score = self._check_gibberish(text)
             if gibberish_score > 0.3:
                 results['issues_found'].append('gibberish')
                 results['corruption_score'] = max(results['corruption_score'], gibberish_score)
         
         # Check for format errors
-        if self.config['checks']['format_errors']:
+        if self.config['checks'].get('format_errors', True):
             format_score = self._check_format_errors(text)
             if format_score > 0.3:
                 results['issues_found'].append('format_errors')
                 results['corruption_score'] = max(results['corruption_score'], format_score)
         
         # Set final result
-        results['is_corrupted'] = results['corruption_score'] >= self.config['corruption_threshold']
+        results['is_corrupted'] = results['corruption_score'] >= self.config.get('corruption_threshold', 0.5)
         
         return results
     
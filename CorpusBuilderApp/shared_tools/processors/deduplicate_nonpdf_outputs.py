@@ -34,13 +34,15 @@ def main():
     parser.add_argument('--strategy', default='keep_first', choices=['keep_first', 'keep_largest'], help='Deduplication strategy (metadata only)')
     parser.add_argument('--minhash', action='store_true', help='Enable MinHash/LSH near-duplicate detection')
     parser.add_argument('--similarity-threshold', type=float, default=0.8, help='MinHash similarity threshold')
+    parser.add_argument('--minhash-engine', default='batch', choices=['batch', 'datasketch'], help='MinHash signature engine')
     parser.add_argument('--report', default='deduplication_report.json', help='Path to save deduplication report (JSON)')
     args = parser.parse_args()
 
     dedup = Deduplicator(
         corpus_dir=args.corpus_dir,
         similarity_threshold=args.similarity_threshold,
-        use_minhash=args.minhash
+        use_minhash=args.minhash,
+        minhash_engine=args.minhash_engine
     )
     duplicates = dedup.find_duplicates()
     deduplication_date = datetime.utcnow().isoformat()
@@ -108,18 +110,21 @@ def main():
 
 class DeduplicateNonPDFOutputs:
     """Class for deduplicating non-PDF extracted outputs and updating metadata programmatically."""
-    def __init__(self, corpus_dir, strategy='keep_first', minhash=False, similarity_threshold=0.8, report_path=None):
+    def __init__(self, corpus_dir, strategy='keep_first', minhash=False, similarity_threshold=0.8, report_path=None,
+                 minhash_engine='batch'):
         self.corpus_dir = corpus_dir
         self.strategy = strategy
         self.minhash = minhash
         self.similarity_threshold = similarity_threshold
         self.report_path = report_path
+        self.minhash_engine = minhash_engine
 
     def run(self):
         dedup = Deduplicator(
             corpus_dir=self.corpus_dir,
             similarity_threshold=self.similarity_threshold,
-            use_minhash=self.minhash
+            use_minhash=self.minhash,
+            minhash_engine=self.minhash_engine
         )
         duplicates = dedup.find_duplicates()
         deduplication_date = datetime.utcnow().isoformat()
@@ -3,9 +3,9 @@ import os
 import sys
 from pathlib import Path
 import logging
-import hashlib
 import json
 import re
+import sqlite3
 import numpy as np
 from collections import defaultdict
 from typing import Dict, List, Optional, Any, Union
@@ -14,15 +14,82 @@ from typing import Dict, List, Optional, Any, Union
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 from CryptoFinanceCorpusBuilder.shared_tools.storage.corpus_manager import CorpusManager
+from shared_tools.utils.minhash_store import MinHashSignatureStore, text_content_hash
+from shared_tools.utils.batch_minhash import BatchMinHasher, datasketch_scheme
+from shared_tools.utils.file_hashing import hash_file, hash_files, size_collisions
 
 # Set up file-based logging
 logging.basicConfig(filename='deduplication.log', level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
 print('Deduplicator script starting...')
 
+# The SQLite file index, MinHash signatures and LSH index all share this prefix
+INDEX_PREFIX = "deduplication_index"
+INDEX_FILENAME = f"{INDEX_PREFIX}.sqlite"
+INDEX_SCHEMA_VERSION = 1
+
+class DeduplicationIndex:
+    """Persistent per-file index (path, size, mtime, hash, title) backing incremental scans.
+
+    Stored as SQLite next to the corpus so that loading it is a single table read and
+    updating it only touches the rows of new, changed or deleted files.
+    """
+
+    def __init__(self, index_path):
+        """Open (creating if needed) the index database
+
+        Args:
+            index_path (Path): Path of the SQLite file
+        """
+        self.index_path = Path(index_path)
+        self.conn = sqlite3.connect(str(self.index_path))
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_SCHEMA_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS files")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, hash TEXT, "
+            "title TEXT, meta_mtime_ns INTEGER)"
+        )
+        self.conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def load(self):
+        """Return {path: row dict} for every indexed file."""
+        rows = self.conn.execute("SELECT path, size, mtime_ns, hash, title, meta_mtime_ns FROM files")
+        return {
+            path: {'size': size, 'mtime_ns': mtime_ns, 'hash': file_hash,
+                   'title': title, 'meta_mtime_ns': meta_mtime_ns}
+            for path, size, mtime_ns, file_hash, title, meta_mtime_ns in rows
+        }
+
+    def update(self, upserts, deletions):
+        """Apply changed rows and remove deleted paths in one transaction
+
+        Args:
+            upserts (dict): {path: row dict} of new or changed files
+            deletions (iterable): Paths that no longer exist
+        """
+        with self.conn:
+            self.conn.executemany("DELETE FROM files WHERE path = ?", ((p,) for p in deletions))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, hash, title, meta_mtime_ns) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                ((path, row['size'], row['mtime_ns'], row['hash'], row['title'], row['meta_mtime_ns'])
+                 for path, row in upserts.items())
+            )
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM files")
+
+    def close(self):
+        self.conn.close()
+
 class Deduplicator:
     """Identify and remove duplicate content in the corpus"""
     
-    def __init__(self, corpus_dir=None, similarity_threshold=0.8, use_minhash=True, project_config=None):
+    def __init__(self, corpus_dir=None, similarity_threshold=0.8, use_minhash=True, project_config=None,
+                 minhash_engine='batch'):
         """Initialize deduplicator
         
         Args:
@@ -30,6 +97,7 @@ class Deduplicator:
             similarity_threshold (float): Threshold for content similarity (0-1)
             use_minhash (bool): Whether to use MinHash/LSH for near-duplicate detection
             project_config (dict): Optional project configuration
+            minhash_engine (str): 'batch' (vectorised NumPy signatures) or 'datasketch' (per-shingle updates)
         """
         self.corpus_dir = Path(corpus_dir) if corpus_dir else None
         
@@ -38,14 +106,23 @@ class Deduplicator:
             config = project_config['deduplicator']
             self.similarity_threshold = config.get('similarity_threshold', similarity_threshold)
             self.use_minhash = config.get('use_minhash', use_minhash)
+            self.incremental_index = config.get('incremental_index', True)
+            self.minhash_engine = config.get('minhash_engine', minhash_engine)
+            self.size_prefilter = config.get('size_prefilter', True)
+            self.hash_workers = config.get('hash_workers')
         else:
             self.similarity_threshold = similarity_threshold
             self.use_minhash = use_minhash
+            self.incremental_index = True
+            self.minhash_engine = minhash_engine
+            self.size_prefilter = True
+            self.hash_workers = None
         
         # Indexes for duplicate detection
         self.file_hashes = {}  # Maps file hash to file paths
         self.title_index = {}  # Maps normalized title to document info
         self.minhash_index = {}  # Maps MinHash signatures to document info
+        self.index_stats = {}  # Counts from the last incremental scan
         
         # Configure logging
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -61,10 +138,17 @@ class Deduplicator:
         self.logger.info('Deduplicator initialized')
     
     def scan_corpus(self, rebuild_index=False):
-        """Scan corpus directory to build duplicate indexes"""
+        """Scan corpus directory to build duplicate indexes
+        
+        Args:
+            rebuild_index (bool): Re-hash every file instead of reusing the stored index
+        """
         if not self.corpus_dir or not self.corpus_dir.exists():
             self.logger.error("Invalid corpus directory")
             return False
+        
+        if self.incremental_index:
+            return self._scan_corpus_incremental(rebuild_index)
             
         # Load existing index if it exists and rebuild_index is False
         index_path = self.corpus_dir / "deduplication_index.json"
@@ -88,25 +172,23 @@ class Deduplicator:
         self.title_index = {}
         self.minhash_index = {}
         
-        # Scan all files in the corpus directory
-        all_files = list(self.corpus_dir.glob("**/*"))
+        # Scan all files in the corpus directory, skipping metadata files and extracted text files
+        all_files = [
+            file_path for file_path in self.corpus_dir.glob("**/*")
+            if file_path.is_file() and not (file_path.suffix in ['.meta', '.json'] or '_extracted' in str(file_path))
+        ]
         total_files = len(all_files)
         
         self.logger.info(f"Scanning {total_files} files for duplicates")
         
+        # Hash in parallel; hashlib releases the GIL so reads and digests overlap
+        file_hashes = hash_files(all_files, max_workers=self.hash_workers)
+        
         for i, file_path in enumerate(all_files):
             if i % 100 == 0:
                 self.logger.info(f"Processed {i}/{total_files} files")
                 
-            if not file_path.is_file():
-                continue
-                
-            # Skip metadata files and extracted text files
-            if file_path.suffix in ['.meta', '.json'] or '_extracted' in str(file_path):
-                continue
-                
-            # Compute file hash
-            file_hash = self._compute_file_hash(file_path)
+            file_hash = file_hashes.get(str(file_path))
             
             if file_hash:
                 # Check if this hash already exists
@@ -152,6 +234,112 @@ class Deduplicator:
         print('scan_corpus called')
         return True
     
+    def _is_indexable(self, file_path):
+        """Whether a corpus file takes part in duplicate detection"""
+        # Skip metadata files, extracted text files, pipeline caches and the index itself
+        if file_path.suffix in ['.meta', '.json'] or '_extracted' in str(file_path):
+            return False
+        if '.cache' in file_path.parts:
+            return False
+        return not file_path.name.startswith(INDEX_PREFIX)
+    
+    def _scan_corpus_incremental(self, rebuild_index=False):
+        """Update the persistent index, hashing only new or changed files
+        
+        Files whose size and mtime match the stored row keep their stored hash;
+        rows for files that disappeared are dropped. With the size prefilter on,
+        files whose size no other file shares cannot have an identical copy and
+        are not hashed at all until another file of that size shows up.
+        """
+        index = DeduplicationIndex(self.corpus_dir / INDEX_FILENAME)
+        try:
+            if rebuild_index:
+                index.clear()
+            known = index.load()
+            
+            stats = {}
+            for root, _, files in os.walk(self.corpus_dir):
+                for name in files:
+                    file_path = Path(root) / name
+                    if not self._is_indexable(file_path):
+                        continue
+                    try:
+                        stat = file_path.stat()
+                    except OSError as e:
+                        self.logger.error(f"Error reading {file_path}: {e}")
+                        continue
+                    meta_path = Path(f"{file_path}.meta")
+                    meta_mtime_ns = meta_path.stat().st_mtime_ns if meta_path.exists() else None
+                    stats[str(file_path)] = (stat.st_size, stat.st_mtime_ns, meta_mtime_ns)
+            
+            if self.size_prefilter:
+                candidates = size_collisions({path: stat[0] for path, stat in stats.items()})
+            else:
+                candidates = set(stats)
+            
+            current = {}
+            upserts = {}
+            to_hash = []
+            for key, (size, mtime_ns, meta_mtime_ns) in stats.items():
+                row = known.get(key)
+                if row is None or row['size'] != size or row['mtime_ns'] != mtime_ns:
+                    row = {'size': size, 'mtime_ns': mtime_ns, 'hash': None,
+                           'title': self._extract_title(Path(key)), 'meta_mtime_ns': meta_mtime_ns}
+                    upserts[key] = row
+                elif row['meta_mtime_ns'] != meta_mtime_ns:
+                    # Only the metadata sidecar changed; refresh the title without re-hashing
+                    row = dict(row, title=self._extract_title(Path(key)), meta_mtime_ns=meta_mtime_ns)
+                    upserts[key] = row
+                if row['hash'] is None and key in candidates:
+                    to_hash.append(key)
+                current[key] = row
+            
+            self.logger.info(f"Hashing {len(to_hash)} new, changed or size-colliding files")
+            hashes = hash_files(to_hash, max_workers=self.hash_workers)
+            for key in to_hash:
+                file_hash = hashes.get(key)
+                if not file_hash:
+                    # Unreadable; leave it out of the index like before
+                    current.pop(key)
+                    upserts.pop(key, None)
+                    continue
+                current[key] = upserts[key] = dict(current[key], hash=file_hash)
+            
+            deleted = [path for path in known if path not in current]
+            index.update(upserts, deleted)
+        finally:
+            index.close()
+        
+        unhashed = sum(1 for row in current.values() if row['hash'] is None)
+        self.index_stats = {
+            'files': len(current),
+            'hashed': len(to_hash),
+            'reused': len(current) - len(upserts),
+            'unique_size_unhashed': unhashed,
+            'deleted': len(deleted)
+        }
+        self.logger.info(
+            f"Deduplication index updated: {len(current)} files, {len(to_hash)} hashed, "
+            f"{self.index_stats['reused']} unchanged, {unhashed} skipped by size, {len(deleted)} removed"
+        )
+        
+        self.file_hashes = {}
+        self.title_index = {}
+        self.minhash_index = {}
+        for path in sorted(current):
+            row = current[path]
+            if row['hash']:
+                self.file_hashes.setdefault(row['hash'], []).append(path)
+            norm_title = self._normalize_title(row['title'])
+            if norm_title:
+                self.title_index.setdefault(norm_title, []).append({
+                    'path': path,
+                    # A file with a unique size differs from every other file
+                    'hash': row['hash'] or f"size:{row['size']}",
+                    'original_title': row['title']
+                })
+        return True
+    
     def find_duplicates(self):
         """Find duplicate content in the corpus"""
         if not self.file_hashes and not self.title_index:
@@ -302,14 +490,7 @@ class Deduplicator:
     def _compute_file_hash(self, file_path):
         """Compute MD5 hash of a file"""
         try:
-            md5_hash = hashlib.md5()
-            
-            with open(file_path, 'rb') as f:
-                # Read in chunks for large files
-                for chunk in iter(lambda: f.read(4096), b''):
-                    md5_hash.update(chunk)
-                    
-            return md5_hash.hexdigest()
+            return hash_file(file_path, 'md5')
         except Exception as e:
             self.logger.error(f"Error computing hash for {file_path}: {e}")
             return None
@@ -346,16 +527,19 @@ class Deduplicator:
         return normalized
     
     def _find_content_duplicates(self, min_text_length=1000):
-        """Find files with similar content using datasketch MinHash and LSH (scalable version)."""
+        """Find files with similar content using datasketch MinHash and LSH (scalable version).
+        
+        Signatures and the LSH index are persisted next to the corpus; only documents
+        whose extracted text is new or changed are read and signed.
+        """
         print('_find_content_duplicates (LSH) called')
         try:
             import sys
             from pathlib import Path
             sys.path.append(str(Path(__file__).resolve().parent.parent))
-            from datasketch import MinHash, MinHashLSH
+            from datasketch import MinHash
             from processors.text_extractor import TextExtractor
             from shared_tools.storage.corpus_manager import CorpusManager
-            import hashlib
             
             corpus_manager = CorpusManager(self.corpus_dir)
             print(f"[DEBUG] CorpusManager loading from: {corpus_manager.metadata_file}")
@@ -367,10 +551,22 @@ class Deduplicator:
                 return []
             
             num_perm = 128
-            lsh = MinHashLSH(threshold=self.similarity_threshold, num_perm=num_perm)
-            doc_minhashes = {}
-            doc_contents = {}
-            valid, skipped = 0, 0
+            if self.minhash_engine == 'batch':
+                hasher = BatchMinHasher(num_perm=num_perm)
+                compute_signature = hasher.signature
+                scheme = datasketch_scheme()
+            else:
+                def compute_signature(text):
+                    m = MinHash(num_perm=num_perm)
+                    for shingle in create_shingles(text):
+                        m.update(shingle.encode('utf8'))
+                    return m.hashvalues
+                scheme = getattr(MinHash(num_perm=num_perm), 'scheme', None)
+            store = MinHashSignatureStore(
+                self.corpus_dir, num_perm=num_perm, threshold=self.similarity_threshold, scheme=scheme
+            )
+            doc_paths = {}
+            valid, skipped, signed, reused = 0, 0, 0, 0
             
             def create_shingles(text, k=5):
                 return set(text[i:i+k] for i in range(len(text) - k + 1))
@@ -389,28 +585,40 @@ class Deduplicator:
                         skipped += 1
                     continue
                 try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        text = f.read()
-                    if len(text) < min_text_length:
+                    stat = os.stat(path)
+                    entry = store.lookup(doc_id, path, stat.st_size, stat.st_mtime_ns)
+                    if entry is None:
+                        with open(path, 'r', encoding='utf-8') as f:
+                            text = f.read()
+                        content_hash = text_content_hash(text)
+                        signature = None
+                        if len(text) >= min_text_length:
+                            # Same text under a new path or mtime keeps its signature
+                            signature = store.find_by_content_hash(content_hash)
+                            if signature is None:
+                                signature = compute_signature(text)
+                                signed += 1
+                        del text
+                        store.put(doc_id, path, stat.st_size, stat.st_mtime_ns, content_hash, signature)
+                        entry = store.entries[doc_id]
+                    else:
+                        reused += 1
+                    if not entry['valid']:
                         skipped += 1
                         continue
                     valid += 1
-                    shingles = create_shingles(text)
-                    m = MinHash(num_perm=num_perm)
-                    for shingle in shingles:
-                        m.update(shingle.encode('utf8'))
-                    doc_minhashes[doc_id] = m
-                    doc_contents[doc_id] = {
-                        "text": text,
-                        "path": doc_info.get("path"),
-                        "extracted_path": path
-                    }
-                    lsh.insert(doc_id, m)
+                    doc_paths[doc_id] = doc_info.get("path")
                 except Exception as e:
                     self.logger.error(f"Error processing {doc_id}: {e}")
                     skipped += 1
 
-            print(f"[MinHashLSH] Valid docs: {valid}, Skipped: {skipped}")
+            store.retain(documents.keys())
+            lsh = store.sync_lsh()
+            try:
+                store.save()
+            except Exception as e:
+                self.logger.error(f"Error saving MinHash signatures: {e}")
+            print(f"[MinHashLSH] Valid docs: {valid}, Skipped: {skipped}, Newly signed: {signed}, Reused: {reused}")
             if valid == 0:
                 self.logger.warning("All documents skipped — no MinHash input. Check extraction and metadata.")
                 return []
@@ -418,17 +626,17 @@ class Deduplicator:
             # Find duplicate groups using LSH
             seen = set()
             groups = []
-            for doc_id, m in doc_minhashes.items():
+            for doc_id in doc_paths:
                 if doc_id in seen:
                     continue
                 # Query for near-duplicates
-                candidates = lsh.query(m)
-                group = [d for d in candidates if d != doc_id and d not in seen]
+                candidates = lsh.query(store.minhash(doc_id))
+                group = [d for d in candidates if d != doc_id and d not in seen and d in doc_paths]
                 if group:
                     group = [doc_id] + group
                     for d in group:
                         seen.add(d)
-                    files = [doc_contents[d]["path"] for d in group if "path" in doc_contents[d]]
+                    files = [doc_paths[d] for d in group]
                     if len(files) > 1:
                         groups.append({
                             "type": "similar_content",
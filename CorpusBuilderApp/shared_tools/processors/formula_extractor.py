@@ -114,6 +114,10 @@ class FormulaExtractor:
         results['count'] = len(results['formulas'])
         return results
     
+    def extract_from_text(self, text: str) -> Dict[str, Any]:
+        """Extract formulas from the text of a non-PDF document (same results as ``extract``)"""
+        return self.extract(text)
+    
     def _extract_latex(self, text: str) -> List[str]:
         """Extract LaTeX formulas"""
         formulas = []
@@ -304,11 +308,25 @@ class FormulaExtractor:
         
         return unique_formulas
     
-    def extract_comprehensive(self, pdf_path: str, text: str) -> Dict[str, Any]:
-        """Extract formulas using both PDF structure, text analysis, and OCR."""
+    def extract_comprehensive(self, pdf_path: str, text: str, doc_context=None,
+                              pdf_formulas: Optional[List[Dict[str, Any]]] = None,
+                              ocr_formulas: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Extract formulas using both PDF structure, text analysis, and OCR.
+
+        Args:
+            pdf_path (str): Path to the PDF file
+            text (str): Text already extracted from the PDF
+            doc_context (PDFDocumentContext): Optional shared document context;
+                when given, the PDF is not re-opened
+            pdf_formulas (list): Precomputed PDF-structure formulas (e.g. stitched
+                from page-range workers); skips the PDF pass when given
+            ocr_formulas (list): Precomputed OCR formulas; skips the OCR pass when given
+        """
         text_formulas = self.extract(text)
-        pdf_formulas = self.extract_from_pdf(pdf_path)
-        ocr_formulas = self.extract_from_ocr(pdf_path)
+        if pdf_formulas is None:
+            pdf_formulas = self.extract_from_pdf(pdf_path, doc_context)
+        if ocr_formulas is None:
+            ocr_formulas = self.extract_from_ocr(pdf_path, doc_context)
         # Combine and deduplicate
         all_formulas = text_formulas['formulas'] + pdf_formulas + ocr_formulas
         unique_formulas = self._deduplicate_formulas(all_formulas)
@@ -356,18 +374,20 @@ class FormulaExtractor:
         
         return type_counts
 
-    def extract_from_pdf(self, pdf_path: str) -> List[Dict[str, Any]]:
+    def extract_from_pdf(self, pdf_path: str, doc_context=None) -> List[Dict[str, Any]]:
         """Extract formulas directly from PDF structure."""
         formulas = []
         
         try:
-            doc = fitz.open(pdf_path)
+            doc = doc_context.doc if doc_context is not None else fitz.open(pdf_path)
+            page_numbers = doc_context.page_numbers if doc_context is not None else range(len(doc))
             
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                
+            for page_num in page_numbers:
                 # Extract text blocks with formatting
-                blocks = page.get_text("dict")
+                if doc_context is not None:
+                    blocks = doc_context.get_text_dict(page_num)
+                else:
+                    blocks = doc.load_page(page_num).get_text("dict")
                 
                 for block in blocks.get("blocks", []):
                     if "lines" in block:
@@ -396,7 +416,8 @@ class FormulaExtractor:
                                     formula['font_based'] = True
                                     formulas.append(formula)
             
-            doc.close()
+            if doc_context is None:
+                doc.close()
             
         except Exception as e:
             self.logger.error(f"Error extracting formulas from PDF {pdf_path}: {e}")
@@ -409,28 +430,38 @@ class FormulaExtractor:
         
         return formulas
     
-    def extract_from_ocr(self, pdf_path: str) -> List[Dict[str, Any]]:
+    def extract_from_ocr(self, pdf_path: str, doc_context=None) -> List[Dict[str, Any]]:
         """Extract formulas from rendered page images using OCR."""
-        formulas = []
+        ocr_texts = {}
         try:
-            doc = fitz.open(pdf_path)
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                pix = page.get_pixmap()
-                img = Image.open(BytesIO(pix.tobytes("png")))
-                ocr_text = pytesseract.image_to_string(img, config='--psm 6')
-                # Heuristic: look for math symbols or patterns
-                if any(sym in ocr_text for sym in ['=', '\\frac', '\\sum', '\\int', '+', '-', '*', '/', '^']):
-                    formulas.append({
-                        'formula': ocr_text.strip(),
-                        'type': 'ocr_image',
-                        'page': page_num + 1,
-                        'confidence': 0.5,  # Placeholder
-                        'source': 'ocr_image'
-                    })
-            doc.close()
+            doc = doc_context.doc if doc_context is not None else fitz.open(pdf_path)
+            page_numbers = doc_context.page_numbers if doc_context is not None else range(len(doc))
+            for page_num in page_numbers:
+                if doc_context is not None:
+                    img = doc_context.get_page_image(page_num)
+                else:
+                    pix = doc.load_page(page_num).get_pixmap()
+                    img = Image.open(BytesIO(pix.tobytes("png")))
+                ocr_texts[page_num] = pytesseract.image_to_string(img, config='--psm 6')
+            if doc_context is None:
+                doc.close()
         except Exception as e:
             self.logger.error(f"Error extracting formulas via OCR from PDF {pdf_path}: {e}")
+        return self.extract_from_ocr_texts(ocr_texts)
+    
+    def extract_from_ocr_texts(self, ocr_texts: Dict[int, str]) -> List[Dict[str, Any]]:
+        """Formulas in OCR text already produced per (0-based) page, e.g. by a deadline-bound OCR stage."""
+        formulas = []
+        for page_num, ocr_text in sorted(ocr_texts.items()):
+            # Heuristic: look for math symbols or patterns
+            if any(sym in ocr_text for sym in ['=', '\\frac', '\\sum', '\\int', '+', '-', '*', '/', '^']):
+                formulas.append({
+                    'formula': ocr_text.strip(),
+                    'type': 'ocr_image',
+                    'page': page_num + 1,
+                    'confidence': 0.5,  # Placeholder
+                    'source': 'ocr_image'
+                })
         
         for formula in formulas:
             if 'metadata' not in formula or not formula['metadata']:
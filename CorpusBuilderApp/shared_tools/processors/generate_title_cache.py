@@ -3,13 +3,15 @@ import csv
 import re
 import unicodedata
 import argparse
-from typing import List, Set
+from typing import List, Optional, Set
 
-def generate_title_cache(corpus_dir: str, output_dir: str) -> None:
+def generate_title_cache(corpus_dir: str, output_dir: str, index_path: Optional[str] = None) -> None:
     """
     Generate a cache of document titles from the corpus metadata.
     This function scans the corpus directory for metadata files, normalizes titles,
     and writes a cache file of unique titles to the output directory.
+    If index_path is given, the titles are also added to that download index
+    (the SQLite index collectors consult before downloading).
     """
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
@@ -48,10 +50,16 @@ def generate_title_cache(corpus_dir: str, output_dir: str) -> None:
             f.write(f"{title}\n")
     
     print(f"Title cache generated: {cache_file}")
+    
+    if index_path:
+        from shared_tools.utils.download_index import DownloadIndex
+        added = DownloadIndex(index_path).import_values('title', all_titles, source='title_cache')
+        print(f"Added {added} new titles to download index: {index_path}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate a cache of document titles from corpus metadata.")
     parser.add_argument("corpus_dir", help="Directory containing the corpus metadata files")
     parser.add_argument("output_dir", help="Directory to write the title cache file")
+    parser.add_argument("--index", help="Also add the titles to this download index (e.g. <raw_data_dir>/.cache/download_index.sqlite)")
     args = parser.parse_args()
-    generate_title_cache(args.corpus_dir, args.output_dir) 
\ No newline at end of file
+    generate_title_cache(args.corpus_dir, args.output_dir, args.index) 
\ No newline at end of file
@@ -7,7 +7,33 @@ from typing import Dict, List, Optional, Any, Union
 from shared_tools.project_config import ProjectConfig
 
 # --- Load language/domain-specific config ---
+# Loaded configs keyed by (path, mtime, size): an edited file is re-read, an unchanged one is not
+_MT_CONFIG_CACHE = {}
+
 def load_mt_config(config_path=None):
+    """Default config updated with the JSON file at config_path (cached until the file changes).
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    key = None
+    if config_path:
+        try:
+            stat = Path(config_path).stat()
+            key = (str(config_path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            key = None
+    else:
+        key = (None, None, None)
+    if key is not None and key in _MT_CONFIG_CACHE:
+        return _MT_CONFIG_CACHE[key]
+    config = _read_mt_config(config_path)
+    if key is not None:
+        for stale in [k for k in _MT_CONFIG_CACHE if k[0] == key[0]]:
+            del _MT_CONFIG_CACHE[stale]
+        _MT_CONFIG_CACHE[key] = config
+    return config
+
+def _read_mt_config(config_path=None):
     default_config = {
         'disclaimer_patterns': [
             r'translated by', r'machine translation', r'automatic translation',
@@ -1,11 +1,13 @@
 from typing import Dict, Any, List, Optional
-import camelot
+import fitz  # PyMuPDF
 import pandas as pd
 from pathlib import Path
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
+from ...utils.table_prefilter import find_table_pages, camelot_pages, read_lattice_tables
+from ...utils.deadline import run_with_deadline, StageTimeout
+
 class TableMixin:
     """Mixin for table extraction functionality using Camelot."""
     
@@ -13,9 +15,11 @@ class TableMixin:
         """Initialize the table mixin.
         
         Args:
-            table_timeout: Timeout in seconds for table extraction
+            table_timeout: Timeout in seconds for table extraction; camelot is killed when it passes
         """
         self.table_timeout = table_timeout
+        # Prefilter stats (pages scanned/skipped, skip rate, timed_out) of the last extraction
+        self.last_table_extraction = None
         self.logger = logging.getLogger(self.__class__.__name__)
     
     def extract_tables(self, file_path: Path) -> List[Dict[str, Any]]:
@@ -27,15 +31,9 @@ class TableMixin:
         Returns:
             List of dictionaries containing table data and metadata
         """
+        self.last_table_extraction = None
         try:
-            # Use ThreadPoolExecutor to handle timeout
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(self._extract_tables_internal, file_path)
-                try:
-                    return future.result(timeout=self.table_timeout)
-                except TimeoutError:
-                    self.logger.warning(f"Table extraction timed out after {self.table_timeout} seconds for {file_path}")
-                    return []
+            return self._extract_tables_internal(file_path)
         except Exception as e:
             self.logger.error(f"Error extracting tables from {file_path}: {str(e)}")
             return []
@@ -51,19 +49,34 @@ class TableMixin:
         """
         tables = []
         try:
-            # Extract tables using Camelot
-            camelot_tables = camelot.read_pdf(
-                str(file_path),
-                pages='all',
-                flavor='lattice',
-                suppress_stdout=True,
-                copy_text=['v']
-            )
+            # Only pages with enough ruling lines for a grid can hold a lattice table
+            with fitz.open(str(file_path)) as doc:
+                candidates, stats = find_table_pages(doc, range(len(doc)))
+            stats['timed_out'] = False
+            self.last_table_extraction = stats
+            if not candidates:
+                return tables
+            
+            # Extract tables using Camelot in a child process that is killed at the deadline
+            try:
+                camelot_tables = run_with_deadline(
+                    read_lattice_tables,
+                    str(file_path),
+                    camelot_pages(candidates),
+                    timeout=self.table_timeout,
+                    stage='tables',
+                    suppress_stdout=True,
+                    copy_text=['v']
+                )
+            except StageTimeout:
+                self.logger.warning(f"Table extraction timed out after {self.table_timeout} seconds for {file_path}")
+                stats['timed_out'] = True
+                return tables
             
             for idx, table in enumerate(camelot_tables):
                 try:
                     # Convert table to DataFrame
-                    df = table.df
+                    df = table['df']
                     
                     # Clean up the table
                     df = self._clean_table(df)
@@ -71,9 +84,9 @@ class TableMixin:
                     # Convert to dictionary format
                     table_dict = {
                         'table_id': f"table_{idx + 1}",
-                        'page': table.page,
-                        'accuracy': float(table.accuracy),
-                        'whitespace': float(table.whitespace),
+                        'page': table['page'],
+                        'accuracy': table['accuracy'],
+                        'whitespace': table['whitespace'],
                         'order': idx + 1,
                         'data': df.to_dict(orient='records'),
                         'shape': df.shape,
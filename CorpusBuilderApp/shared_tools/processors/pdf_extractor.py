@@ -79,6 +79,7 @@ class PDFExtractor(BaseExtractor, TableMixin, FormulaMixin):
                 'tables': tables,
                 'formulas': formulas,
                 'table_count': len(tables),
+                'table_extraction': self.last_table_extraction,
                 'formula_count': len(formulas)
             }
             
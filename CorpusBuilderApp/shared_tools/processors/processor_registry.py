@@ -0,0 +1,87 @@
+# processors/processor_registry.py
+"""
+Processor instances shared by all files handled in one process.
+
+FormulaExtractor, ChartImageExtractor, FinancialSymbolProcessor,
+AcademicPaperProcessor and DomainClassifier compile their pattern tables and
+symbol dictionaries when they are constructed, and hold no per-document state
+afterwards. The batch extractors build them once per worker process in
+``worker_initializer`` (via ``init_processors``) and fetch them with
+``get_processor`` instead of constructing them for every file.
+
+The registry remembers a fingerprint of the settings it was built from; calling
+``init_processors`` with different settings rebuilds every instance, so a
+long-lived process (the UI) picks up configuration changes between runs.
+"""
+
+import json
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from .formula_extractor import FormulaExtractor
+from .chart_image_extractor import ChartImageExtractor
+from .finacial_symbol_processor import FinancialSymbolProcessor, AcademicPaperProcessor
+from .domain_classifier import DomainClassifier
+from .machine_translation_detector import load_mt_config
+
+logger = logging.getLogger(__name__)
+
+PROCESSOR_FACTORIES = {
+    'formula': lambda config: FormulaExtractor(config=config),
+    'chart': lambda config: ChartImageExtractor(config=config),
+    'symbols': lambda config: FinancialSymbolProcessor(config=config),
+    'academic': lambda config: AcademicPaperProcessor(),
+    'domain': lambda config: DomainClassifier(config=config),
+}
+
+_lock = threading.Lock()
+_instances: Dict[str, Any] = {}
+_fingerprint: Optional[str] = None
+_settings: Dict[str, Dict] = {}
+
+
+def settings_fingerprint(settings: Optional[Dict[str, Dict]] = None) -> str:
+    """Stable hash of per-processor settings."""
+    payload = json.dumps(settings or {}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def init_processors(settings: Optional[Dict[str, Dict]] = None, mt_config: Optional[str] = None):
+    """Build the shared processor instances (no-op if already built from the same settings)
+
+    Args:
+        settings: Optional config dict per processor name (see ``PROCESSOR_FACTORIES``)
+        mt_config: Machine-translation config path, loaded now so the first file does not pay for it
+    """
+    global _fingerprint, _settings
+    fingerprint = settings_fingerprint(settings)
+    with _lock:
+        if fingerprint != _fingerprint:
+            if _fingerprint is not None:
+                logger.info("Processor settings changed; rebuilding shared processors")
+            _settings = dict(settings or {})
+            _instances.clear()
+            for name, factory in PROCESSOR_FACTORIES.items():
+                _instances[name] = factory(_settings.get(name))
+            _fingerprint = fingerprint
+    load_mt_config(mt_config)
+
+
+def get_processor(name: str):
+    """Shared instance of a processor, built on first use if ``init_processors`` was not called
+
+    Args:
+        name: One of ``PROCESSOR_FACTORIES``
+
+    Returns:
+        The processor instance
+    """
+    instance = _instances.get(name)
+    if instance is None:
+        with _lock:
+            instance = _instances.get(name)
+            if instance is None:
+                instance = _instances[name] = PROCESSOR_FACTORIES[name](_settings.get(name))
+    return instance
@@ -0,0 +1,135 @@
+# utils/batch_scheduler.py
+"""
+Streaming submission of batch extraction work to a process pool.
+
+The batch extractors used to walk the whole input tree into a list and submit
+every file at once, so the parent held a future and a pending work item per
+file of the corpus. Here the input tree is walked lazily, files are reordered
+largest-first within a lookahead window of a few files per in-flight task (long
+jobs start early instead of ending up at the tail, and the first task does not
+wait for a large tree to be walked), and ``BoundedScheduler`` keeps only a few
+tasks per worker in flight, pulling the next one from the source as tasks complete.
+"""
+
+import os
+import heapq
+import logging
+from collections import deque
+from concurrent.futures import Executor, FIRST_COMPLETED, Future, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Tasks kept submitted per worker: one running, one queued so a worker never idles waiting for the parent
+DEFAULT_TASKS_PER_WORKER = 2
+# Files buffered for largest-first ordering per in-flight task (paths and sizes only). The first
+# task is submitted once the window fills, so it scales with the pool rather than the input tree
+DEFAULT_LOOKAHEAD_PER_SLOT = 8
+
+
+def walk_input_files(input_dir: Union[str, Path], extensions: Iterable[str]) -> Iterator[Tuple[str, int]]:
+    """Lazily walk a directory tree
+
+    Args:
+        input_dir: Root directory
+        extensions: Lowercase file extensions to yield (e.g. ``('.pdf',)``)
+
+    Yields:
+        (path, size in bytes) of every matching file
+    """
+    extensions = tuple(extensions)
+    stack = [str(input_dir)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(extensions) and entry.is_file():
+                            yield entry.path, entry.stat().st_size
+                    except OSError as e:
+                        logger.warning(f"Skipping {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Cannot read directory {directory}: {e}")
+
+
+def submit_lookahead(max_in_flight: int, configured: Optional[int] = None) -> int:
+    """Largest-first window for a scheduler keeping ``max_in_flight`` tasks submitted
+
+    Args:
+        max_in_flight: Scheduler's in-flight limit
+        configured: Explicit window from the processor config (``submit_lookahead``), if any
+    """
+    return configured or max(1, max_in_flight) * DEFAULT_LOOKAHEAD_PER_SLOT
+
+
+def largest_first(items: Iterable[Tuple[Any, int]], lookahead: int) -> Iterator[Any]:
+    """Reorder (item, size) pairs largest-first within a window of ``lookahead`` items
+
+    With a window at least as large as the input this is a full descending sort;
+    a smaller window bounds memory on huge inputs at the cost of local ordering only.
+    """
+    heap = []
+    for order, (item, size) in enumerate(items):
+        heapq.heappush(heap, (-size, order, item))
+        if len(heap) >= max(1, lookahead):
+            yield heapq.heappop(heap)[2]
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+
+class BoundedScheduler:
+    """Submit tasks from a lazy source keeping at most ``max_in_flight`` futures outstanding.
+
+    Usage:
+        scheduler = BoundedScheduler(executor, tasks, max_in_flight=2 * num_workers)
+        for key, future in scheduler:
+            ...  # may call scheduler.add(...) for follow-up work
+    """
+
+    def __init__(self, executor: Executor, tasks: Iterable[Tuple[Any, Callable, tuple]], max_in_flight: int):
+        """Initialize the scheduler
+
+        Args:
+            executor: Pool the tasks are submitted to
+            tasks: Lazy iterable of (key, fn, args); pulled only when a slot frees up
+            max_in_flight: Maximum number of submitted, unfinished tasks
+        """
+        self.executor = executor
+        self.max_in_flight = max(1, max_in_flight)
+        self._tasks = iter(tasks)
+        self._followups = deque()
+        self._futures: Dict[Future, Any] = {}
+        self.submitted = 0
+
+    def add(self, key: Any, fn: Callable, *args):
+        """Queue follow-up work; it is submitted ahead of new tasks from the source."""
+        self._followups.append((key, fn, args))
+
+    def _fill(self):
+        while len(self._futures) < self.max_in_flight:
+            if self._followups:
+                key, fn, args = self._followups.popleft()
+            else:
+                task = next(self._tasks, None)
+                if task is None:
+                    break
+                key, fn, args = task
+            self._futures[self.executor.submit(fn, *args)] = key
+            self.submitted += 1
+
+    def __len__(self) -> int:
+        """Tasks currently in flight."""
+        return len(self._futures)
+
+    def __iter__(self) -> Iterator[Tuple[Any, Future]]:
+        """Yield (key, future) for every task as it completes."""
+        self._fill()
+        while self._futures:
+            done, _ = wait(self._futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield self._futures.pop(future), future
+            self._fill()
@@ -0,0 +1,261 @@
+# utils/corpus_metadata_store.py
+"""
+Columnar table of the per-document metadata used by corpus balance analysis.
+
+Each extractor output root (the directory holding ``_extracted/`` and
+``low_quality/``) gets ``.cache/corpus_metadata.sqlite`` with one row per
+metadata JSON and only the analysis columns. Extractors and the metadata
+normalizer upsert a row whenever they write a JSON file; ``sync`` catches
+anything written by other tools by comparing each JSON's size and mtime with
+the stored row and parsing only files that differ. Analysis then reads the
+table instead of loading every JSON (and its formula/symbol/thumbnail blobs).
+
+The schema is created or migrated by ``prepare_store``, which the extractors
+call once per run in the parent before any worker starts. Workers only insert
+rows into the existing table.
+"""
+
+import os
+import json
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+
+logger = logging.getLogger(__name__)
+
+STORE_RELATIVE_PATH = Path('.cache') / 'corpus_metadata.sqlite'
+STORE_SCHEMA_VERSION = 1
+METADATA_SUBDIRS = ('_extracted', 'low_quality')
+
+# (column, SQLite type) for every analysis column, in DataFrame order
+ANALYSIS_COLUMNS = [
+    ('file_path', 'TEXT PRIMARY KEY'),
+    ('document_id', 'TEXT'),
+    ('directory', 'TEXT'),
+    ('domain', 'TEXT'),
+    ('file_type', 'TEXT'),
+    ('extraction_method', 'TEXT'),
+    ('token_count', 'INTEGER'),
+    ('quality_flag', 'TEXT'),
+    ('extraction_date', 'TEXT'),
+    ('language', 'TEXT'),
+    ('language_confidence', 'REAL'),
+    ('file_size', 'INTEGER'),
+    ('corruption_score', 'REAL'),
+    ('machine_translation_flag', 'INTEGER'),
+    ('academic_paper', 'INTEGER'),
+]
+_BOOL_COLUMNS = ('machine_translation_flag', 'academic_paper')
+# Source JSON stat used to detect files changed outside the extractors
+_STAT_COLUMNS = [('json_size', 'INTEGER'), ('json_mtime_ns', 'INTEGER')]
+
+
+def _number(value, cast, default=None):
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def metadata_record(json_path: Union[str, Path], metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Analysis columns for one metadata JSON (same fields CorpusAnalyzer used to build per file)
+
+    Args:
+        json_path: Path of the metadata JSON
+        metadata: Parsed JSON contents
+
+    Returns:
+        dict: One table row
+    """
+    json_path = Path(json_path)
+    record = {
+        'file_path': str(json_path),
+        'document_id': json_path.stem,
+        'directory': json_path.parent.name,
+        'domain': metadata.get('domain', 'unknown'),
+        'file_type': metadata.get('file_type', 'unknown'),
+        'extraction_method': metadata.get('extraction_method', 'unknown'),
+        'token_count': _number(metadata.get('token_count', 0), int, 0),
+        'quality_flag': metadata.get('quality_flag', 'unknown'),
+        'extraction_date': metadata.get('extraction_date'),
+        'language': metadata.get('language', 'unknown'),
+        'language_confidence': _number(metadata.get('language_confidence', 0.0), float),
+        'file_size': _number(metadata.get('file_size', 0), int, 0),
+        'corruption_score': None,
+        'machine_translation_flag': None,
+        'academic_paper': None,
+    }
+    qm = metadata.get('quality_metrics', {})
+    if isinstance(qm, dict):
+        record['corruption_score'] = _number(qm.get('corruption', {}).get('corruption_score_normalized', 100), float)
+        record['machine_translation_flag'] = bool(qm.get('machine_translation', {}).get('machine_translated_flag', False))
+        record['academic_paper'] = bool(qm.get('academic_analysis', {}).get('is_academic_paper', False))
+    for key in ('domain', 'file_type', 'extraction_method', 'quality_flag', 'extraction_date', 'language'):
+        if record[key] is not None and not isinstance(record[key], str):
+            record[key] = str(record[key])
+    return record
+
+
+class CorpusMetadataStore:
+    """SQLite table of analysis columns for one extractor output root."""
+
+    def __init__(self, root: Union[str, Path], migrate: bool = True):
+        """Open the store of an output root
+
+        Args:
+            root: Directory that contains the ``_extracted``/``low_quality`` folders
+            migrate: Create or migrate the table; with False the table must already
+                exist (extractor workers, after ``prepare_store`` ran in the parent)
+        """
+        self.root = Path(root)
+        self.path = self.root / STORE_RELATIVE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Extractor workers write concurrently; wait for the lock instead of failing
+        self.conn = sqlite3.connect(str(self.path), timeout=30)
+        if migrate:
+            self._migrate()
+
+    def _migrate(self):
+        # The write lock is taken before reading the version, so two processes opening a
+        # fresh store cannot both decide to (re)create the table and drop each other's rows
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != STORE_SCHEMA_VERSION:
+                self.conn.execute("DROP TABLE IF EXISTS documents")
+            columns = ', '.join(f"{name} {sql_type}" for name, sql_type in ANALYSIS_COLUMNS + _STAT_COLUMNS)
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS documents ({columns})")
+            self.conn.execute(f"PRAGMA user_version = {STORE_SCHEMA_VERSION}")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "CorpusMetadataStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def upsert(self, records: Iterable[Dict[str, Any]]):
+        """Insert or replace rows (each must include ``json_size`` and ``json_mtime_ns``)."""
+        names = [name for name, _ in ANALYSIS_COLUMNS + _STAT_COLUMNS]
+        placeholders = ', '.join('?' for _ in names)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO documents ({', '.join(names)}) VALUES ({placeholders})",
+                ([record.get(name) for name in names] for record in records)
+            )
+
+    def record(self, json_path: Union[str, Path], metadata: Dict[str, Any]):
+        """Upsert the row for a JSON file that was just written."""
+        stat = os.stat(json_path)
+        row = metadata_record(json_path, metadata)
+        row.update(json_size=stat.st_size, json_mtime_ns=stat.st_mtime_ns)
+        self.upsert([row])
+
+    def sync(self) -> Dict[str, int]:
+        """Bring the table in line with the JSON files on disk
+
+        Returns:
+            dict: Counts of parsed (new or changed), unchanged and removed files
+        """
+        known = {
+            path: (size, mtime_ns)
+            for path, size, mtime_ns in self.conn.execute("SELECT file_path, json_size, json_mtime_ns FROM documents")
+        }
+        seen = set()
+        changed = []
+        for subdir in METADATA_SUBDIRS:
+            subdir_path = self.root / subdir
+            if not subdir_path.is_dir():
+                continue
+            with os.scandir(subdir_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json') or not entry.is_file():
+                        continue
+                    json_path = str(subdir_path / entry.name)
+                    seen.add(json_path)
+                    stat = entry.stat()
+                    if known.get(json_path) == (stat.st_size, stat.st_mtime_ns):
+                        continue
+                    try:
+                        with open(json_path, 'r', encoding='utf-8') as f:
+                            metadata = json.load(f)
+                    except Exception as e:
+                        logger.warning(f"Error loading metadata from {json_path}: {e}")
+                        continue
+                    row = metadata_record(json_path, metadata)
+                    row.update(json_size=stat.st_size, json_mtime_ns=stat.st_mtime_ns)
+                    changed.append(row)
+        removed = [path for path in known if path not in seen]
+        if changed:
+            self.upsert(changed)
+        if removed:
+            with self.conn:
+                self.conn.executemany("DELETE FROM documents WHERE file_path = ?", ((p,) for p in removed))
+        return {'parsed': len(changed), 'unchanged': len(seen) - len(changed), 'removed': len(removed)}
+
+    def read_dataframe(self):
+        """All rows as a pandas DataFrame with the analysis columns."""
+        import pandas as pd
+        names = [name for name, _ in ANALYSIS_COLUMNS]
+        df = pd.read_sql_query(f"SELECT {', '.join(names)} FROM documents", self.conn)
+        for name in _BOOL_COLUMNS:
+            df[name] = df[name].astype('boolean')
+        return df
+
+
+def find_output_roots(corpus_dir: Union[str, Path], recursive: bool = True) -> List[Path]:
+    """Directories under ``corpus_dir`` that hold ``_extracted``/``low_quality`` folders
+
+    The metadata folders themselves (often tens of thousands of files) are not descended into.
+    """
+    corpus_dir = Path(corpus_dir)
+    if not recursive:
+        return [corpus_dir] if any((corpus_dir / s).is_dir() for s in METADATA_SUBDIRS) else []
+    roots = []
+    for root, dirs, _ in os.walk(corpus_dir):
+        if any(d in METADATA_SUBDIRS for d in dirs):
+            roots.append(Path(root))
+        dirs[:] = [d for d in dirs if d not in METADATA_SUBDIRS and d != STORE_RELATIVE_PATH.parent.name]
+    return roots
+
+
+def prepare_store(root: Union[str, Path]):
+    """Create or migrate the metadata table of an output root (once per run, before workers start)
+
+    Never raises: without a table, workers' rows are added by the next ``sync``.
+    """
+    try:
+        CorpusMetadataStore(root).close()
+    except Exception as e:
+        logger.warning(f"Could not prepare corpus metadata store in {root}: {e}")
+
+
+def record_output_metadata(json_path: Union[str, Path], metadata: Dict[str, Any]):
+    """Keep the output root's metadata table current after writing ``json_path``
+
+    Only inserts into an existing table. Outside a prepared extractor run (no
+    table yet) the schema is created first, under the store's write lock.
+    Never raises: a failure only means the next analysis re-parses this file.
+    """
+    json_path = Path(json_path)
+    if json_path.parent.name not in METADATA_SUBDIRS:
+        return
+    root = json_path.parent.parent
+    try:
+        try:
+            with CorpusMetadataStore(root, migrate=False) as store:
+                store.record(json_path, metadata)
+        except sqlite3.OperationalError as e:
+            if 'no such table' not in str(e):
+                raise
+            with CorpusMetadataStore(root) as store:
+                store.record(json_path, metadata)
+    except Exception as e:
+        logger.debug(f"Could not update corpus metadata store for {json_path}: {e}")
@@ -0,0 +1,138 @@
+# utils/deadline.py
+"""
+Stage deadlines that actually stop the work.
+
+A thread cannot be interrupted: ``future.result(timeout=...)`` or a
+``threading.Timer`` only stops the caller from waiting, while the stuck
+camelot, Ghostscript or pdfminer call keeps running in the background with
+the worker's CPU and memory. ``run_with_deadline`` runs a stage in a child
+process instead. If the stage misses its deadline, the child and everything
+it started (Ghostscript runs as a subprocess of camelot) is killed, and
+``StageTimeout`` is raised in the caller.
+
+The stage function and its arguments must be picklable, and so must its
+result. Where ``fork`` is available the child starts without re-importing
+anything. Under ``spawn`` (Windows) the function's module is imported in the
+child, so stage functions should live in light modules.
+"""
+
+import time
+import pickle
+import logging
+import traceback
+import multiprocessing
+from typing import Any, Callable, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+# Seconds a killed stage process gets to exit before the caller stops waiting for it
+KILL_GRACE = 5.0
+
+
+class StageTimeout(TimeoutError):
+    """A stage ran past its deadline and its process was killed."""
+
+    def __init__(self, stage: str, seconds: float):
+        super().__init__(f"{stage} timed out after {seconds:g}s")
+        self.stage = stage
+        self.seconds = seconds
+
+
+class StageCrashed(RuntimeError):
+    """The stage process died without returning a result."""
+
+
+def _context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+
+
+def kill_process_tree(pid: int, include_parent: bool = True, wait: bool = True):
+    """Kill a process and all of its descendants
+
+    Args:
+        pid: Root process id
+        include_parent: Also kill the root process itself
+        wait: Wait up to ``KILL_GRACE`` seconds for the processes to exit
+    """
+    try:
+        parent = psutil.Process(pid)
+        processes = parent.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return
+    if include_parent:
+        processes.append(parent)
+    for process in processes:
+        try:
+            process.kill()
+        except psutil.NoSuchProcess:
+            pass
+    if wait:
+        psutil.wait_procs(processes, timeout=KILL_GRACE)
+
+
+def _stage_main(conn, fn: Callable, args: tuple, kwargs: dict):
+    try:
+        message = ('ok', fn(*args, **kwargs))
+    except BaseException as e:
+        message = ('error', e, traceback.format_exc())
+    try:
+        payload = pickle.dumps(message)
+        if message[0] == 'error':
+            # Some exceptions pickle but cannot be rebuilt (custom __init__ signatures); check here, not in the caller
+            pickle.loads(payload)
+    except Exception as e:
+        # Unpicklable result or exception: report what we can
+        error = message[1] if message[0] == 'error' else e
+        details = message[2] if message[0] == 'error' else traceback.format_exc()
+        payload = pickle.dumps(('error', StageCrashed(f"{type(error).__name__}: {error}"), details))
+    conn.send_bytes(payload)
+    conn.close()
+
+
+def run_with_deadline(fn: Callable, *args, timeout: Optional[float], stage: str = 'stage', **kwargs) -> Any:
+    """Run ``fn(*args, **kwargs)`` in a child process that is killed at the deadline
+
+    Args:
+        fn: Module-level stage function
+        timeout: Deadline in seconds; ``None`` or ``0`` runs the stage inline without a deadline
+        stage: Stage name used in the timeout error and log messages
+
+    Returns:
+        The stage's return value
+
+    Raises:
+        StageTimeout: The deadline passed and the stage process tree was killed
+        StageCrashed: The stage process died (e.g. a segfault in a native library)
+        Exception: Whatever the stage raised, with the child traceback logged at debug level
+    """
+    if not timeout:
+        return fn(*args, **kwargs)
+    ctx = _context()
+    reader, writer = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_stage_main, args=(writer, fn, args, kwargs), name=f'stage-{stage}', daemon=True)
+    start = time.perf_counter()
+    process.start()
+    writer.close()
+    try:
+        if not reader.poll(timeout):
+            logger.warning(f"{stage} missed its {timeout:g}s deadline; killing process {process.pid}")
+            kill_process_tree(process.pid)
+            raise StageTimeout(stage, timeout)
+        try:
+            message = pickle.loads(reader.recv_bytes())
+        except EOFError:
+            process.join(KILL_GRACE)
+            raise StageCrashed(f"{stage} process exited with code {process.exitcode}")
+    finally:
+        reader.close()
+        process.join(KILL_GRACE)
+        if process.is_alive():
+            kill_process_tree(process.pid)
+    logger.debug(f"{stage} finished in {time.perf_counter() - start:.2f}s")
+    if message[0] == 'error':
+        logger.debug(f"{stage} failed in child process:\n{message[2]}")
+        raise message[1]
+    return message[1]
@@ -102,93 +102,118 @@ def get_valid_domains():
     """Get list of valid domains (backward compatible)."""
     return _domain_config.get_valid_domains()
 
+class DomainResolver:
+    """Assigns a domain to a file from its path or, failing that, domain keywords.
+    
+    The lowercased domain list and the keyword search order are computed once,
+    and the path-based part of the answer (which only depends on the directory)
+    is cached per directory, so resolving the files of a batch costs one
+    dictionary lookup each. Keyword fallbacks use substring scans over the
+    precomputed order; for keyword lists of this size a C-level ``in`` scan per
+    keyword is faster than one Python-level regex pass.
+    """
+    
+    def __init__(self, valid_domains: List[str], domain_keywords: Dict[str, List[str]]):
+        """Precompute the lookup tables
+        
+        Args:
+            valid_domains: Domain names, in match-priority order
+            domain_keywords: Fallback keywords per domain, in match-priority order
+        """
+        self.valid_domains = [d.lower() for d in valid_domains]
+        self._domain_set = set(self.valid_domains)
+        self._keywords = tuple((kw, dom) for dom, keywords in domain_keywords.items() for kw in keywords)
+        self._directory_cache: Dict[str, Optional[tuple]] = {}
+    
+    def _match_part(self, part: str) -> Optional[str]:
+        """Domain named by a path component (exact, else the first domain contained in it)"""
+        if part in self._domain_set:
+            return part
+        for domain in self.valid_domains:
+            if domain in part:
+                return domain
+        return None
+    
+    def _directory_domain(self, directory: str) -> Optional[tuple]:
+        """(domain, how it matched) implied by a directory, or None (cached per directory)"""
+        try:
+            return self._directory_cache[directory]
+        except KeyError:
+            pass
+        match = None
+        # 1./2. Parent directory, exact then partial
+        parent_dir = os.path.basename(directory).lower()
+        domain = self._match_part(parent_dir)
+        if domain is not None:
+            match = (domain, f"parent directory '{parent_dir}'")
+        else:
+            # 3. All path components, outermost first
+            for part in directory.replace('\\', '/').split('/'):
+                domain = self._match_part(part.lower())
+                if domain is not None:
+                    match = (domain, f"path part '{part.lower()}'")
+                    break
+        self._directory_cache[directory] = match
+        return match
+    
+    def _keyword_domain(self, text_lower: str) -> Optional[tuple]:
+        for kw, dom in self._keywords:
+            if kw in text_lower:
+                return dom, kw
+        return None
+    
+    def resolve(self, file_path: Union[str, Path], text: Optional[str] = None, debug: bool = False) -> str:
+        """Domain of a file: parent dir, partial match, path parts, then filename/text keywords
+        
+        Args:
+            file_path: File path
+            text: Optional document text for the keyword fallback
+            debug: Print how the domain was chosen
+            
+        Returns:
+            str: Domain name, or 'unknown'
+        """
+        file_path_str = os.path.normpath(str(file_path))
+        directory, fname = os.path.split(file_path_str)
+        
+        match = self._directory_domain(directory)
+        how = match and match[1]
+        if match is None:
+            # 3. (cont.) The filename is the last path component
+            for part in fname.replace('\\', '/').split('/'):
+                domain = self._match_part(part.lower())
+                if domain is not None:
+                    match = (domain, f"path part '{part.lower()}'")
+                    break
+            how = match and match[1]
+        if match is None:
+            # 4. Keyword matching (filename, then text)
+            match = self._keyword_domain(fname.lower())
+            how = match and f"keyword '{match[1]}' in filename"
+            if match is None and text:
+                match = self._keyword_domain(text.lower())
+                how = match and f"keyword '{match[1]}' in text"
+        
+        assigned_domain = match[0] if match else "unknown"
+        if debug:
+            print(f"[DEBUG] get_domain_for_file: {file_path_str}")
+            print(f"  valid_domains: {self.valid_domains}")
+            print(f"  ✅ Domain matched via {how}" if match else "  ❌ No domain match found, returning 'unknown'")
+            print(f"[FINAL] Path: {file_path_str}, Assigned: {assigned_domain}")
+        return assigned_domain
+
+
+_domain_resolver: Optional[DomainResolver] = None
+
+def get_domain_resolver() -> DomainResolver:
+    """Process-wide resolver over the default domain config (built on first use)."""
+    global _domain_resolver
+    if _domain_resolver is None:
+        _domain_resolver = DomainResolver(get_valid_domains(), _domain_config.get_domain_keywords())
+    return _domain_resolver
+
 def get_domain_for_file(file_path, text=None, debug=False):
     """
     Robust domain assignment: parent dir, partial match, all path parts, keyword fallback. Debuggable.
     """
-    valid_domains = [d.lower() for d in get_valid_domains()]
-    # Normalize path
-    if isinstance(file_path, Path):
-        file_path_str = str(file_path)
-    else:
-        file_path_str = file_path
-    file_path_str = os.path.normpath(file_path_str)
-    if debug:
-        print(f"[DEBUG] get_domain_for_file called with:")
-        print(f"  file_path: {file_path_str}")
-        print(f"  valid_domains: {valid_domains}")
-    # 1. Parent directory (lowercased)
-    parent_dir = os.path.basename(os.path.dirname(file_path_str)).lower()
-    if debug:
-        print(f"  Parent directory (lowercased): {parent_dir}")
-    if parent_dir in valid_domains:
-        if debug:
-            print(f"  ✅ Domain matched from parent directory: {parent_dir}")
-        assigned_domain = parent_dir
-        if debug:
-            print(f"[FINAL] Path: {file_path_str}, Domains: {valid_domains}, Assigned: {assigned_domain}")
-        assert isinstance(assigned_domain, str), "Assigned domain is not a string"
-        return assigned_domain
-    # 2. Partial match in parent directory
-    for domain in valid_domains:
-        if domain in parent_dir:
-            if debug:
-                print(f"  ✅ Domain matched partially in parent directory: {domain}")
-            assigned_domain = domain
-            if debug:
-                print(f"[FINAL] Path: {file_path_str}, Domains: {valid_domains}, Assigned: {assigned_domain}")
-            assert isinstance(assigned_domain, str), "Assigned domain is not a string"
-            return assigned_domain
-    # 3. All path components (lowercased)
-    path_parts = file_path_str.replace('\\', '/').split('/')
-    path_parts = [p.lower() for p in path_parts]
-    if debug:
-        print(f"  Path parts: {path_parts}")
-    for part in path_parts:
-        if part in valid_domains:
-            if debug:
-                print(f"  ✅ Domain matched in path part: {part}")
-            assigned_domain = part
-            if debug:
-                print(f"[FINAL] Path: {file_path_str}, Domains: {valid_domains}, Assigned: {assigned_domain}")
-            assert isinstance(assigned_domain, str), "Assigned domain is not a string"
-            return assigned_domain
-        for domain in valid_domains:
-            if domain in part:
-                if debug:
-                    print(f"  ✅ Domain matched partially in path part: {domain} in {part}")
-                assigned_domain = domain
-                if debug:
-                    print(f"[FINAL] Path: {file_path_str}, Domains: {valid_domains}, Assigned: {assigned_domain}")
-                assert isinstance(assigned_domain, str), "Assigned domain is not a string"
-                return assigned_domain
-    # 4. Keyword matching (filename/text)
-    fname = os.path.basename(file_path_str).lower()
-    for dom, keywords in _domain_config.get_domain_keywords().items():
-        for kw in keywords:
-            if kw in fname:
-                if debug:
-                    print(f"  ✅ Domain keyword match in filename: {dom} via {kw}")
-                assigned_domain = dom
-                if debug:
-                    print(f"[FINAL] Path: {file_path_str}, Domains: {valid_domains}, Assigned: {assigned_domain}")
-                assert isinstance(assigned_domain, str), "Assigned domain is not a string"
-                return assigned_domain
-    if text:
-        text_lower = text.lower()
-        for dom, keywords in _domain_config.get_domain_keywords().items():
-            for kw in keywords:
-                if kw in text_lower:
-                    if debug:
-                        print(f"  ✅ Domain keyword match in text: {dom} via {kw}")
-                    assigned_domain = dom
-                    if debug:
-                        print(f"[FINAL] Path: {file_path_str}, Domains: {valid_domains}, Assigned: {assigned_domain}")
-                    assert isinstance(assigned_domain, str), "Assigned domain is not a string"
-                    return assigned_domain
-    if debug:
-        print("  ❌ No domain match found, returning 'unknown'")
-        print(f"[FINAL] Path: {file_path_str}, Domains: {valid_domains}, Assigned: unknown")
-    assigned_domain = "unknown"
-    assert isinstance(assigned_domain, str), "Assigned domain is not a string"
-    return assigned_domain 
\ No newline at end of file
+    return get_domain_resolver().resolve(file_path, text=text, debug=debug)
@@ -0,0 +1,255 @@
+# utils/download_index.py
+"""
+Persistent index of documents already collected, consulted before downloading.
+
+One SQLite table (``<raw_data_dir>/.cache/download_index.sqlite``) maps every
+identifier of a collected document -- normalized title, DOI, arXiv id, source
+URL and content hash -- to the file it was saved as. Collectors look
+identifiers up before issuing a download and record them in one transaction
+after each successful download, so every collector, process and run shares the
+same view of the corpus.
+
+Lookups go through an in-memory Bloom filter first: most candidates from a
+search are new, and a negative Bloom answer needs no SQL query at all. The
+filter picks up rows added by other processes by reading rows past the last
+rowid it has seen.
+"""
+
+import re
+import math
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
+
+from .file_hashing import hash_file
+
+logger = logging.getLogger(__name__)
+
+INDEX_RELATIVE_PATH = Path('.cache') / 'download_index.sqlite'
+IDENTIFIER_KINDS = ('title', 'doi', 'arxiv_id', 'url', 'md5')
+DEFAULT_CAPACITY = 100000
+DEFAULT_ERROR_RATE = 0.001
+
+
+def normalize_title(title) -> str:
+    """Lowercase, punctuation-free, single-spaced title (the collectors' title-cache format)."""
+    title = unicodedata.normalize('NFKC', str(title))
+    title = re.sub(r'[^\w\s]', '', title.lower())
+    return re.sub(r'\s+', ' ', title).strip()
+
+
+def normalize_doi(doi) -> str:
+    doi = str(doi).strip().lower()
+    doi = re.sub(r'^(https?://(dx\.)?doi\.org/|doi:\s*)', '', doi)
+    return doi
+
+
+def normalize_arxiv_id(arxiv_id) -> str:
+    """Bare arXiv id without URL prefix or version ('http://arxiv.org/abs/2101.00001v2' -> '2101.00001')."""
+    arxiv_id = str(arxiv_id).strip()
+    arxiv_id = re.sub(r'^(https?://(export\.)?arxiv\.org/(abs|pdf)/|arxiv:)', '', arxiv_id, flags=re.IGNORECASE)
+    arxiv_id = re.sub(r'\.pdf$', '', arxiv_id)
+    return re.sub(r'v\d+$', '', arxiv_id).lower()
+
+
+def normalize_url(url) -> str:
+    """URL without fragment, trailing slash, 'www.' or scheme/host case differences."""
+    parts = urlsplit(str(url).strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return urlunsplit(('', host, parts.path.rstrip('/'), parts.query, ''))
+
+
+_NORMALIZERS = {
+    'title': normalize_title,
+    'doi': normalize_doi,
+    'arxiv_id': normalize_arxiv_id,
+    'url': normalize_url,
+    'md5': lambda value: str(value).strip().lower(),
+}
+
+
+def document_identifiers(**identifiers) -> List[Tuple[str, str]]:
+    """Normalized (kind, value) pairs for the given identifiers, skipping empty ones
+
+    Args:
+        **identifiers: Any of title, doi, arxiv_id, url, md5
+
+    Returns:
+        list: (kind, normalized value) pairs
+    """
+    pairs = []
+    for kind, value in identifiers.items():
+        if kind not in _NORMALIZERS:
+            raise ValueError(f"Unknown identifier kind: {kind}")
+        if value is None or value == '':
+            continue
+        normalized = _NORMALIZERS[kind](value)
+        if normalized:
+            pairs.append((kind, normalized))
+    return pairs
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, error_rate: float = DEFAULT_ERROR_RATE):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+def _bloom_key(kind: str, value: str) -> str:
+    return f"{kind}\x00{value}"
+
+
+class DownloadIndex:
+    """Identifiers of collected documents in SQLite behind a Bloom filter."""
+
+    def __init__(self, path: Union[str, Path], error_rate: float = DEFAULT_ERROR_RATE):
+        """Open (creating if needed) the index
+
+        Args:
+            path: SQLite file (usually ``<raw_data_dir>/.cache/download_index.sqlite``)
+            error_rate: Target false-positive rate of the Bloom filter
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.error_rate = error_rate
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS identifiers ("
+                "kind TEXT NOT NULL, value TEXT NOT NULL, file_path TEXT, source TEXT, added_at REAL, "
+                "PRIMARY KEY (kind, value))"
+            )
+        self._bloom = None
+        self._last_rowid = 0
+        self._rebuild_bloom()
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections must stay on the thread that opened them
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def _rebuild_bloom(self):
+        conn = self._connect()
+        total = conn.execute("SELECT COUNT(*) FROM identifiers").fetchone()[0]
+        self._bloom = BloomFilter(max(DEFAULT_CAPACITY, 2 * total), self.error_rate)
+        self._last_rowid = 0
+        self._refresh_bloom()
+
+    def _refresh_bloom(self):
+        """Add rows written since the last refresh (by this or any other process)."""
+        rows = self._connect().execute(
+            "SELECT rowid, kind, value FROM identifiers WHERE rowid > ? ORDER BY rowid", (self._last_rowid,)
+        ).fetchall()
+        for rowid, kind, value in rows:
+            self._bloom.add(_bloom_key(kind, value))
+            self._last_rowid = rowid
+        if self._bloom.count > self._bloom.capacity:
+            # Past capacity the false-positive rate climbs; resize
+            self._rebuild_bloom()
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM identifiers").fetchone()[0]
+
+    def find(self, **identifiers) -> Optional[Dict[str, str]]:
+        """First stored identifier matching any of the given ones
+
+        Args:
+            **identifiers: Any of title, doi, arxiv_id, url, md5
+
+        Returns:
+            dict with kind, value, file_path and source of the match, or None
+        """
+        pairs = document_identifiers(**identifiers)
+        with self._lock:
+            self._refresh_bloom()
+            candidates = [pair for pair in pairs if _bloom_key(*pair) in self._bloom]
+        conn = self._connect()
+        for kind, value in candidates:
+            row = conn.execute(
+                "SELECT file_path, source FROM identifiers WHERE kind = ? AND value = ?", (kind, value)
+            ).fetchone()
+            if row:
+                return {'kind': kind, 'value': value, 'file_path': row[0], 'source': row[1]}
+        return None
+
+    def contains(self, **identifiers) -> bool:
+        return self.find(**identifiers) is not None
+
+    def record(self, file_path: Optional[Union[str, Path]] = None, source: Optional[str] = None,
+               hash_content: bool = True, **identifiers):
+        """Record a collected document's identifiers in one transaction
+
+        Args:
+            file_path: Where the document was saved
+            source: Collector name
+            hash_content: Also record the MD5 of ``file_path`` (unless ``md5`` is given)
+            **identifiers: Any of title, doi, arxiv_id, url, md5
+        """
+        if hash_content and file_path and not identifiers.get('md5') and Path(file_path).is_file():
+            identifiers['md5'] = hash_file(file_path)
+        pairs = document_identifiers(**identifiers)
+        if not pairs:
+            return
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO identifiers (kind, value, file_path, source, added_at) VALUES (?, ?, ?, ?, ?)",
+                [(kind, value, str(file_path) if file_path else None, source, now) for kind, value in pairs]
+            )
+        with self._lock:
+            self._refresh_bloom()
+
+    def import_values(self, kind: str, values: Iterable[str], source: Optional[str] = None) -> int:
+        """Bulk-add identifiers of one kind (e.g. a legacy title cache)
+
+        Returns:
+            int: Number of identifiers that were not yet indexed
+        """
+        rows = []
+        for value in values:
+            rows.extend(document_identifiers(**{kind: value}))
+        if not rows:
+            return 0
+        now = time.time()
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO identifiers (kind, value, file_path, source, added_at) VALUES (?, ?, NULL, ?, ?)",
+                [(k, v, source, now) for k, v in rows]
+            )
+            added = conn.total_changes - before
+        with self._lock:
+            self._refresh_bloom()
+        return added
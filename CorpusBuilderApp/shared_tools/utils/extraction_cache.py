@@ -0,0 +1,221 @@
+# utils/extraction_cache.py
+"""
+Persistent content-addressed cache for the batch extractors.
+
+An entry records, for one input path, the MD5 of its content
+(``calculate_hash``), a fingerprint of the processor configuration and
+extractor code, and the ``.txt``/``.json`` outputs written for it. When a
+file's content, the config and the code are all unchanged, the extractor skips
+it and reuses those outputs.
+
+Entries are kept per source path because the outputs are named after the
+path: two files with the same content each get (and keep) their own outputs.
+
+Hashes are remembered per path with the file's size and mtime, and the parent
+process only ever consults that stat index (``lookup``). A file whose size or
+mtime changed is handed to a worker together with a read-only ``snapshot`` of
+its entry; the worker hashes it first and, when ``reusable`` says the content
+is unchanged, returns the existing outputs instead of extracting again
+(a touched, copied-over or restored file). The worker's hash is then passed
+back to ``record``.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .extractor_utils import calculate_hash
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = '.cache'
+CACHE_FORMAT_VERSION = 2
+
+
+def compute_fingerprint(config: Optional[Dict[str, Any]], version: str,
+                        code_paths: Iterable[Union[str, Path]] = ()) -> str:
+    """Fingerprint of everything besides the input file that affects the outputs.
+
+    Args:
+        config: Processor configuration (must be JSON-serialisable; other values are str()-ed)
+        version: Extractor pipeline version string
+        code_paths: Source files whose contents should invalidate the cache when edited
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(version.encode('utf-8'))
+    digest.update(json.dumps(config or {}, sort_keys=True, default=str).encode('utf-8'))
+    for code_path in code_paths:
+        try:
+            digest.update(Path(code_path).read_bytes())
+        except OSError:
+            digest.update(str(code_path).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def reusable(entry: Optional[Dict[str, Any]], file_hash: str) -> bool:
+    """Whether a cache entry (from ``ExtractionCache.snapshot``) still holds for content with file_hash.
+
+    Called in the worker, after it has hashed the input and before it extracts.
+    """
+    return (bool(entry) and entry.get('file_hash') == file_hash
+            and all(Path(p).exists() for p in entry.get('outputs', [])))
+
+
+class ExtractionCache:
+    """On-disk map of input path -> (content hash, extraction outputs) for a given fingerprint."""
+
+    def __init__(self, output_dir: Union[str, Path], name: str, fingerprint: str):
+        """Initialize the cache
+
+        Args:
+            output_dir: Extractor output directory; the index lives in ``<output_dir>/.cache``
+            name: Cache name, one per extractor (e.g. 'pdf', 'nonpdf')
+            fingerprint: Result of ``compute_fingerprint`` for the current run
+        """
+        self.output_dir = Path(output_dir)
+        self.cache_path = self.output_dir / CACHE_DIR_NAME / f"extraction_cache_{name}.json"
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._file_hashes: Dict[str, str] = {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._stat_index: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format_version') == CACHE_FORMAT_VERSION:
+                self._entries = data.get('entries', {})
+                self._stat_index = data.get('stat_index', {})
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable extraction cache {self.cache_path}: {e}")
+
+    def file_hash(self, file_path: Union[str, Path]) -> str:
+        """Content hash of a file, reusing the stored hash when size and mtime are unchanged."""
+        file_hash = self.known_hash(file_path)
+        if file_hash is None:
+            file_hash = calculate_hash(os.path.abspath(str(file_path)))
+            self.remember_hash(file_path, file_hash)
+        return file_hash
+
+    def known_hash(self, file_path: Union[str, Path]) -> Optional[str]:
+        """Stored hash for the file's current size and mtime, without reading the file.
+
+        Returns:
+            The hash, or None if the file changed, was never hashed or cannot be stat'ed
+        """
+        key = os.path.abspath(str(file_path))
+        if key in self._file_hashes:
+            return self._file_hashes[key]
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return None
+        known = self._stat_index.get(key)
+        if known and known.get('size') == stat.st_size and known.get('mtime') == stat.st_mtime:
+            self._file_hashes[key] = known['hash']
+            return known['hash']
+        return None
+
+    def remember_hash(self, file_path: Union[str, Path], file_hash: str):
+        """Store a hash computed elsewhere (e.g. by a worker) for the file's current size and mtime."""
+        key = os.path.abspath(str(file_path))
+        stat = os.stat(key)
+        self._stat_index[key] = {'size': stat.st_size, 'mtime': stat.st_mtime, 'hash': file_hash}
+        self._file_hashes[key] = file_hash
+        self._dirty = True
+
+    def lookup(self, file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """Return the cached entry if the file, config and code are unchanged and outputs still exist.
+
+        Only the stat index is consulted: a file whose size or mtime changed is a
+        miss here and is never read (see ``snapshot``).
+        """
+        file_hash = self.known_hash(file_path)
+        entry = self.snapshot(file_path)
+        if file_hash and reusable(entry, file_hash):
+            self.hits += 1
+            return entry
+        return None
+
+    def snapshot(self, file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """Copy of the file's entry under the current fingerprint, for a worker to check after hashing.
+
+        Returns:
+            The entry, or None if the file has none for this config and code
+        """
+        entry = self._entries.get(os.path.abspath(str(file_path)))
+        if entry and entry.get('fingerprint') == self.fingerprint:
+            return dict(entry)
+        return None
+
+    def record(self, file_path: Union[str, Path], outputs: Iterable[Union[str, Path]],
+               file_hash: Optional[str] = None, hit: Optional[bool] = None, **info):
+        """Remember the outputs produced for a file under the current fingerprint.
+
+        Args:
+            file_path: Input file
+            outputs: Output paths written for it
+            file_hash: Content hash computed by the worker; hashed here if not given
+                and the stat index does not know the file
+            hit: Count the file as a cache hit (a worker reused its outputs) or a
+                miss (it was extracted); None counts neither
+        """
+        try:
+            if file_hash:
+                self.remember_hash(file_path, file_hash)
+            else:
+                file_hash = self.file_hash(file_path)
+        except OSError as e:
+            logger.warning(f"Could not hash {file_path}: {e}")
+            return
+        if hit is not None:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        self._entries[os.path.abspath(str(file_path))] = {
+            'file_hash': file_hash,
+            'fingerprint': self.fingerprint,
+            'outputs': [str(p) for p in outputs],
+            'cached_at': datetime.now(timezone.utc).isoformat(),
+            **info
+        }
+        self._dirty = True
+
+    def save(self):
+        """Atomically write the index back to disk if it changed."""
+        if not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'entries': self._entries,
+            'stat_index': self._stat_index
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
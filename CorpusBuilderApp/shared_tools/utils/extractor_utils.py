@@ -2,15 +2,27 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 import json
-import hashlib
 from datetime import datetime
 import os
 
+from .file_hashing import hash_file
+
 try:
     from CryptoFinanceCorpusBuilder.shared_tools.project_config import ProjectConfig
 except ImportError:
     ProjectConfig = None
 
+# Non-PDF file types the non-PDF extractor handles (extension -> extraction method)
+NONPDF_SUPPORTED_EXTENSIONS = {
+    '.py': 'python',
+    '.ipynb': 'jupyter',
+    '.md': 'markdown',
+    '.html': 'html',
+    '.htm': 'html',
+    '.json': 'json',
+    '.csv': 'csv'
+}
+
 def safe_filename(filename: str, max_length: int = 128) -> str:
     """Convert a string to a safe filename, truncated to max_length chars."""
     # Remove invalid characters
@@ -70,12 +82,8 @@ def calculate_hash(file_path: Union[str, Path]) -> str:
     Returns:
         MD5 hash as hex string
     """
-    file_path = Path(file_path)
-    hash_md5 = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+    # Streams the file in 1 MiB chunks; see file_hashing.hash_files for hashing many files in parallel
+    return hash_file(Path(file_path), 'md5')
 
 def load_json_config(config_path: Union[str, Path, ProjectConfig]) -> Dict:
     """Load and validate a JSON configuration file.
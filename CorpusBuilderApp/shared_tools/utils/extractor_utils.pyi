@@ -7,6 +7,8 @@ try:
 except ImportError:
     ProjectConfig = None
 
+NONPDF_SUPPORTED_EXTENSIONS: Dict[str, str]
+
 def safe_filename(filename: str) -> str: ...
 def count_tokens(text: str) -> int: ...
 def extract_metadata(file_path: Union[str, Path], project_config: Optional[ProjectConfig] = ...) -> Dict: ...
@@ -0,0 +1,90 @@
+# utils/fred_store.py
+"""
+On-disk layout of collected FRED data and the reader the extractors use.
+
+The FRED collector stores observations in one Parquet file per domain
+(``<domain>.parquet`` with series_id/date/value rows) and one row of metadata
+per series in ``series_index.parquet`` next to them. A domain file holds many
+series, so ``iter_series_documents`` turns it into one text document per
+series_id, with the title, units and frequency taken from the index. The index
+itself is not a data file and is never extracted.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# One metadata row per collected series (observations live in <domain>.parquet files)
+SERIES_INDEX_FILENAME = 'series_index.parquet'
+SERIES_INDEX_COLUMNS = [
+    'series_id', 'title', 'domain', 'datafile', 'frequency', 'units', 'last_updated',
+    'observation_start', 'observation_end', 'observation_count'
+]
+
+
+def is_series_index(path: Union[str, Path]) -> bool:
+    """True for the series index, which describes the data files but holds no observations."""
+    return Path(path).name == SERIES_INDEX_FILENAME
+
+
+def load_series_index(fred_dir: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    """Series index rows keyed by series ID ({} if there is no readable index)
+
+    Args:
+        fred_dir: Directory holding the domain files and the series index
+    """
+    index_path = Path(fred_dir) / SERIES_INDEX_FILENAME
+    if not index_path.exists():
+        return {}
+    try:
+        df = pd.read_parquet(index_path)
+    except Exception as e:
+        logger.warning(f"Could not read FRED series index {index_path}: {e}")
+        return {}
+    return {row['series_id']: row for row in df.to_dict('records')}
+
+
+def series_document_name(series_id: str) -> str:
+    """Base name of the extracted outputs of one series."""
+    return f"FRED_{series_id}"
+
+
+def format_series_text(series_id: str, observations: pd.DataFrame, info: Dict[str, Any]) -> str:
+    """Plain-text document for one series: a metadata header followed by date,value rows."""
+    lines = [f"FRED series {series_id}: {info.get('title') or series_id}"]
+    for label, key in (('Units', 'units'), ('Frequency', 'frequency'), ('Last updated', 'last_updated')):
+        if info.get(key):
+            lines.append(f"{label}: {info[key]}")
+    if len(observations):
+        lines.append(f"Observations: {len(observations)} from {observations['date'].min():%Y-%m-%d} "
+                     f"to {observations['date'].max():%Y-%m-%d}")
+    lines.append('')
+    lines.append('date,value')
+    for date, value in zip(observations['date'], observations['value']):
+        lines.append(f"{date:%Y-%m-%d},{'' if pd.isna(value) else value}")
+    return '\n'.join(lines)
+
+
+def iter_series_documents(data_path: Union[str, Path]) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """One document per series stored in a FRED domain file
+
+    Args:
+        data_path: ``<domain>.parquet`` written by the FRED collector
+
+    Yields:
+        (series_id, text, series index row) for every series in the file; series
+        missing from the index get a row with just their ID and the file's domain
+    """
+    data_path = Path(data_path)
+    index = load_series_index(data_path.parent)
+    data = pd.read_parquet(data_path, columns=['series_id', 'date', 'value'])
+    data['date'] = pd.to_datetime(data['date'])
+    for series_id, observations in data.sort_values(['series_id', 'date']).groupby('series_id', sort=True):
+        info = index.get(series_id) or {'series_id': series_id, 'domain': data_path.stem}
+        info = {key: (None if not isinstance(value, (list, dict)) and pd.isna(value) else value)
+                for key, value in info.items()}
+        yield series_id, format_series_text(series_id, observations, info), info
@@ -4,6 +4,8 @@ from pathlib import Path
 from collections import defaultdict
 from typing import Optional, Union
 
+from .corpus_metadata_store import record_output_metadata
+
 try:
     from CryptoFinanceCorpusBuilder.shared_tools.project_config import ProjectConfig
 except ImportError:
@@ -97,6 +99,7 @@ def normalize_metadata_file(json_file: Union[str, Path], backup: bool = True):
             os.rename(json_file, backup_path)
         with open(json_file, 'w', encoding='utf-8') as f:
             json.dump(metadata, f, indent=2)
+        record_output_metadata(json_file, metadata)
         print(f"Normalized: {json_file}")
     else:
         print(f"No changes: {json_file}")
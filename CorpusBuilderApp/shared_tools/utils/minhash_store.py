@@ -0,0 +1,228 @@
+# utils/minhash_store.py
+"""
+On-disk MinHash signatures and LSH index for near-duplicate detection.
+
+Signatures are kept as one unsigned-integer NumPy matrix (one row per document) together
+with the document id, extracted text path, file size/mtime and content hash
+each row was computed from. A later scan only reads and signs documents that
+are new or whose extracted text changed; everything else is served from the
+stored rows. The datasketch ``MinHashLSH`` index is pickled alongside and
+updated in place (removed/changed keys dropped, new keys inserted).
+"""
+
+import os
+import pickle
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SIGNATURES_FILENAME = "deduplication_index.minhash.npz"
+LSH_FILENAME = "deduplication_index.lsh.pkl"
+STORE_FORMAT_VERSION = 1
+MINHASH_SEED = 1  # datasketch default
+
+
+def _atomic_write(path: Path, write):
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class MinHashSignatureStore:
+    """Persistent doc id -> MinHash signature map with an incrementally maintained LSH index."""
+
+    def __init__(self, store_dir: Union[str, Path], num_perm: int = 128, threshold: float = 0.8,
+                 scheme: Optional[str] = None):
+        """Load the store from ``store_dir`` if present
+
+        Args:
+            store_dir: Directory holding the signature and LSH files (the corpus directory)
+            num_perm: Number of MinHash permutations
+            threshold: Jaccard threshold of the LSH index
+            scheme: datasketch hash scheme of the signatures (``MinHash.scheme``; None before datasketch 2.0)
+        """
+        self.store_dir = Path(store_dir)
+        self.signatures_path = self.store_dir / SIGNATURES_FILENAME
+        self.lsh_path = self.store_dir / LSH_FILENAME
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.scheme = scheme
+        # doc_id -> {'path', 'size', 'mtime_ns', 'content_hash', 'valid'}
+        self.entries: Dict[str, Dict] = {}
+        self.signatures: Dict[str, np.ndarray] = {}
+        self.lsh = None
+        self._lsh_keys = set()
+        self._stale_keys = set()  # in the LSH index with an outdated signature
+        self._by_content_hash: Dict[str, str] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.signatures_path.exists():
+            return
+        try:
+            with np.load(self.signatures_path, allow_pickle=False) as data:
+                if (int(data['format_version']) != STORE_FORMAT_VERSION
+                        or int(data['num_perm']) != self.num_perm
+                        or str(data['scheme']) != (self.scheme or '')):
+                    logger.info("MinHash store parameters changed; signatures will be recomputed")
+                    return
+                matrix = data['signatures']
+                for row, (doc_id, path, size, mtime_ns, content_hash, valid) in enumerate(zip(
+                        data['doc_ids'], data['paths'], data['sizes'], data['mtimes_ns'],
+                        data['content_hashes'], data['valid'])):
+                    doc_id = str(doc_id)
+                    self.entries[doc_id] = {
+                        'path': str(path),
+                        'size': int(size),
+                        'mtime_ns': int(mtime_ns),
+                        'content_hash': str(content_hash),
+                        'valid': bool(valid)
+                    }
+                    if valid:
+                        self.signatures[doc_id] = matrix[row]
+                        self._by_content_hash[str(content_hash)] = doc_id
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable MinHash store {self.signatures_path}: {e}")
+            self.entries, self.signatures, self._by_content_hash = {}, {}, {}
+            return
+        if self.lsh_path.exists():
+            try:
+                with open(self.lsh_path, 'rb') as f:
+                    saved = pickle.load(f)
+                if (saved.get('format_version') == STORE_FORMAT_VERSION
+                        and saved.get('num_perm') == self.num_perm
+                        and saved.get('scheme') == self.scheme
+                        and saved.get('threshold') == self.threshold):
+                    self.lsh = saved['lsh']
+                    self._lsh_keys = set(saved['keys'])
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable LSH index {self.lsh_path}: {e}")
+
+    def lookup(self, doc_id: str, path: str, size: int, mtime_ns: int) -> Optional[Dict]:
+        """Stored entry if the document's extracted text is unchanged (same path, size and mtime)."""
+        entry = self.entries.get(doc_id)
+        if entry and entry['path'] == path and entry['size'] == size and entry['mtime_ns'] == mtime_ns:
+            return entry
+        return None
+
+    def find_by_content_hash(self, content_hash: str) -> Optional[np.ndarray]:
+        """Signature of any stored document with identical text (e.g. a copied or touched file)."""
+        doc_id = self._by_content_hash.get(content_hash)
+        if doc_id is not None and doc_id in self.signatures and self.entries[doc_id]['content_hash'] == content_hash:
+            return self.signatures[doc_id]
+        return None
+
+    def put(self, doc_id: str, path: str, size: int, mtime_ns: int, content_hash: str,
+            signature: Optional[np.ndarray]):
+        """Store (or replace) a document's signature; ``None`` marks it as too short to sign."""
+        self.entries[doc_id] = {
+            'path': path,
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'content_hash': content_hash,
+            'valid': signature is not None
+        }
+        if signature is not None:
+            self.signatures[doc_id] = np.asarray(signature)
+            self._by_content_hash[content_hash] = doc_id
+        else:
+            self.signatures.pop(doc_id, None)
+        if doc_id in self._lsh_keys:
+            self._stale_keys.add(doc_id)
+        self._dirty = True
+
+    def retain(self, doc_ids: Iterable[str]):
+        """Drop every document not in ``doc_ids`` (deleted from the corpus)."""
+        keep = set(doc_ids)
+        for doc_id in [d for d in self.entries if d not in keep]:
+            del self.entries[doc_id]
+            self.signatures.pop(doc_id, None)
+            self._dirty = True
+
+    def minhash(self, doc_id: str):
+        """Stored signature as a datasketch ``LeanMinHash``."""
+        from datasketch import LeanMinHash
+        if self.scheme is None:
+            return LeanMinHash(seed=MINHASH_SEED, hashvalues=self.signatures[doc_id])
+        return LeanMinHash(seed=MINHASH_SEED, hashvalues=self.signatures[doc_id], scheme=self.scheme)
+
+    def sync_lsh(self):
+        """Bring the LSH index in line with the stored signatures
+
+        Returns:
+            MinHashLSH: Index containing exactly the valid stored signatures
+        """
+        from datasketch import MinHashLSH
+        if self.lsh is None:
+            self.lsh = MinHashLSH(threshold=self.threshold, num_perm=self.num_perm)
+            self._lsh_keys = set()
+        # Deleted documents and documents whose signature was replaced
+        stale = {doc_id for doc_id in self._lsh_keys if doc_id not in self.signatures} | self._stale_keys
+        self._stale_keys = set()
+        for doc_id in stale:
+            self.lsh.remove(doc_id)
+            self._lsh_keys.discard(doc_id)
+        added = 0
+        for doc_id in self.signatures:
+            if doc_id not in self._lsh_keys:
+                self.lsh.insert(doc_id, self.minhash(doc_id))
+                self._lsh_keys.add(doc_id)
+                added += 1
+        if stale or added:
+            self._dirty = True
+        logger.info(f"LSH index: {added} inserted, {len(stale)} removed, {len(self._lsh_keys)} total")
+        return self.lsh
+
+    def save(self):
+        """Atomically write signatures and LSH index if anything changed."""
+        if not self._dirty:
+            return
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        doc_ids = list(self.entries)
+        dtype = next(iter(self.signatures.values())).dtype if self.signatures else np.uint64
+        matrix = np.zeros((len(doc_ids), self.num_perm), dtype=dtype)
+        for row, doc_id in enumerate(doc_ids):
+            if doc_id in self.signatures:
+                matrix[row] = self.signatures[doc_id]
+        arrays = {
+            'format_version': np.array(STORE_FORMAT_VERSION),
+            'num_perm': np.array(self.num_perm),
+            'scheme': np.array(self.scheme or ''),
+            'doc_ids': np.array(doc_ids, dtype=str),
+            'paths': np.array([self.entries[d]['path'] for d in doc_ids], dtype=str),
+            'sizes': np.array([self.entries[d]['size'] for d in doc_ids], dtype=np.int64),
+            'mtimes_ns': np.array([self.entries[d]['mtime_ns'] for d in doc_ids], dtype=np.int64),
+            'content_hashes': np.array([self.entries[d]['content_hash'] for d in doc_ids], dtype=str),
+            'valid': np.array([self.entries[d]['valid'] for d in doc_ids], dtype=bool),
+            'signatures': matrix
+        }
+        _atomic_write(self.signatures_path, lambda f: np.savez(f, **arrays))
+        if self.lsh is not None:
+            saved = {
+                'format_version': STORE_FORMAT_VERSION,
+                'num_perm': self.num_perm,
+                'scheme': self.scheme,
+                'threshold': self.threshold,
+                'keys': sorted(self._lsh_keys),
+                'lsh': self.lsh
+            }
+            _atomic_write(self.lsh_path, lambda f: pickle.dump(saved, f, protocol=pickle.HIGHEST_PROTOCOL))
+        self._dirty = False
+
+
+def text_content_hash(text: str) -> str:
+    """Hash of extracted text used to recognise unchanged content under a new path or mtime."""
+    return hashlib.md5(text.encode('utf-8', errors='ignore')).hexdigest()
@@ -0,0 +1,191 @@
+# utils/pdf_document_context.py
+"""
+Per-file PDF document context shared by every extraction stage.
+
+The PDF is read from disk once and parsed once with PyMuPDF. Pages, text
+dicts and rendered page images are cached so that text extraction, formula
+extraction, OCR, chart detection and metadata extraction all reuse the same
+parsed objects instead of re-opening the file.
+"""
+
+import os
+import logging
+from collections import OrderedDict
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Rendered pages are large (a 2x A4 render is ~10 MB as RGB); keep only a few.
+DEFAULT_MAX_CACHED_IMAGES = 4
+# Text dicts are much smaller but still add up on 900-page books.
+DEFAULT_MAX_CACHED_TEXT_DICTS = 64
+
+
+class PDFDocumentContext:
+    """Open a PDF once and hand the parsed objects to every extraction stage.
+
+    Usage:
+        with PDFDocumentContext(pdf_path) as doc_ctx:
+            text = extract_text_with_pymupdf(pdf_path, doc_ctx)
+            formulas = formula_extractor.extract_comprehensive(pdf_path, text, doc_ctx)
+    """
+
+    def __init__(self, pdf_path: str,
+                 page_range: Optional[Tuple[int, int]] = None,
+                 max_cached_images: int = DEFAULT_MAX_CACHED_IMAGES,
+                 max_cached_text_dicts: int = DEFAULT_MAX_CACHED_TEXT_DICTS):
+        """Initialize the document context
+
+        Args:
+            pdf_path: Path to the PDF file
+            page_range: Optional (start, end) 0-based, end-exclusive range of pages
+                that stages should process; page numbers stay absolute
+            max_cached_images: Maximum number of rendered page images kept in memory
+            max_cached_text_dicts: Maximum number of page text dicts kept in memory
+        """
+        self.pdf_path = os.path.abspath(str(pdf_path))
+        self.page_range = page_range
+        self.max_cached_images = max_cached_images
+        self.max_cached_text_dicts = max_cached_text_dicts
+        self._pdf_bytes: Optional[bytes] = None
+        self._doc = None
+        self._page_texts: Dict[int, str] = {}
+        self._text_dicts: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._images: "OrderedDict[Tuple[int, float], Image.Image]" = OrderedDict()
+
+    def __enter__(self) -> "PDFDocumentContext":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self) -> "PDFDocumentContext":
+        """Read the file and parse it with PyMuPDF (idempotent)."""
+        if self._doc is None:
+            with open(self.pdf_path, 'rb') as f:
+                self._pdf_bytes = f.read()
+            self._doc = fitz.open(stream=self._pdf_bytes, filetype='pdf')
+        return self
+
+    def close(self):
+        """Close the document and drop all cached objects."""
+        if self._doc is not None:
+            try:
+                self._doc.close()
+            except Exception as e:
+                logger.debug(f"Error closing {self.pdf_path}: {e}")
+        self._doc = None
+        self._pdf_bytes = None
+        self._page_texts.clear()
+        self._text_dicts.clear()
+        self._images.clear()
+
+    @property
+    def doc(self):
+        """The parsed PyMuPDF document."""
+        if self._doc is None:
+            self.open()
+        return self._doc
+
+    @property
+    def page_count(self) -> int:
+        """Total number of pages in the document."""
+        return len(self.doc)
+
+    @property
+    def page_numbers(self) -> List[int]:
+        """0-based page numbers this context covers (all pages unless a range was given)."""
+        if self.page_range is None:
+            return list(range(self.page_count))
+        start, end = self.page_range
+        return list(range(max(0, start), min(end, self.page_count)))
+
+    @property
+    def is_partial(self) -> bool:
+        """True when the context only covers a slice of the document."""
+        return len(self.page_numbers) != self.page_count
+
+    @property
+    def file_size(self) -> int:
+        return len(self.pdf_bytes)
+
+    @property
+    def pdf_bytes(self) -> bytes:
+        """Raw file contents, read once from disk."""
+        if self._pdf_bytes is None:
+            self.open()
+        return self._pdf_bytes
+
+    def stream(self) -> BytesIO:
+        """Fresh in-memory stream for engines that need a file object (PyPDF2, pdfminer)."""
+        return BytesIO(self.pdf_bytes)
+
+    def page(self, page_num: int):
+        """Return the (0-based) page object."""
+        return self.doc.load_page(page_num)
+
+    def pages(self):
+        """Iterate over (page_num, page) pairs for the covered pages."""
+        for page_num in self.page_numbers:
+            yield page_num, self.page(page_num)
+
+    def get_page_text(self, page_num: int) -> str:
+        """Plain text of a page, as returned by ``page.get_text()``."""
+        if page_num not in self._page_texts:
+            self._page_texts[page_num] = self.page(page_num).get_text()
+        return self._page_texts[page_num]
+
+    def get_text_dict(self, page_num: int) -> Dict[str, Any]:
+        """Structured text of a page, as returned by ``page.get_text("dict")``."""
+        cached = self._text_dicts.get(page_num)
+        if cached is not None:
+            self._text_dicts.move_to_end(page_num)
+            return cached
+        text_dict = self.page(page_num).get_text("dict")
+        self._text_dicts[page_num] = text_dict
+        while len(self._text_dicts) > self.max_cached_text_dicts:
+            self._text_dicts.popitem(last=False)
+        return text_dict
+
+    def get_page_image(self, page_num: int, zoom: float = 1.0) -> Image.Image:
+        """Rendered page as a PIL image, cached per (page, zoom)."""
+        key = (page_num, float(zoom))
+        cached = self._images.get(key)
+        if cached is not None:
+            self._images.move_to_end(key)
+            return cached
+        page = self.page(page_num)
+        if zoom == 1.0:
+            pix = page.get_pixmap()
+        else:
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        if pix.n == 3 and not pix.alpha:
+            # Skip the PNG encode/decode round trip for plain RGB renders
+            image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+        else:
+            image = Image.open(BytesIO(pix.tobytes("png")))
+            image.load()
+        self._images[key] = image
+        while len(self._images) > self.max_cached_images:
+            self._images.popitem(last=False)
+        return image
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Document info dictionary in PDF key form (``/Title``, ``/Author`` ...)."""
+        info = self.doc.metadata or {}
+        key_map = {
+            'title': '/Title',
+            'author': '/Author',
+            'subject': '/Subject',
+            'keywords': '/Keywords',
+            'creator': '/Creator',
+            'producer': '/Producer',
+            'creationDate': '/CreationDate',
+            'modDate': '/ModDate',
+        }
+        return {pdf_key: info.get(key) for key, pdf_key in key_map.items() if info.get(key)}
@@ -3,11 +3,24 @@ import fitz  # PyMuPDF
 import logging
 import warnings
 
+from .deadline import run_with_deadline, StageTimeout
+
 # Suppress PyMuPDF warnings about wrong pointing objects
 warnings.filterwarnings("ignore", message="Ignoring wrong pointing object")
 
+def _read_pdf_bytes(pdf_path):
+    doc = fitz.open(pdf_path)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+    return pdf_bytes
+
 def safe_open_pdf(pdf_path, timeout=10):
-    """Safely open a PDF file with timeout and error handling."""
+    """Safely open a PDF file with timeout and error handling.
+
+    The PyMuPDF parse runs in a child process that is killed after ``timeout``
+    seconds (``None`` or ``0`` parses in-process), so a malformed file cannot
+    hang the caller.
+    """
     try:
         # Convert to absolute path
         pdf_path = os.path.abspath(pdf_path)
@@ -31,10 +44,10 @@ def safe_open_pdf(pdf_path, timeout=10):
             
         # Now try to load with PyMuPDF with proper error handling
         try:
-            doc = fitz.open(pdf_path)
-            pdf_bytes = doc.tobytes()
-            doc.close()
-            return pdf_bytes
+            return run_with_deadline(_read_pdf_bytes, pdf_path, timeout=timeout, stage='pdf_open')
+        except StageTimeout as e:
+            logging.getLogger(__name__).warning(f"Gave up opening {pdf_path}: {e}")
+            return None
         except Exception:
             return None
             
@@ -0,0 +1,56 @@
+# utils/pdf_stages.py
+"""
+PDF extraction stages that run in deadline-bound child processes.
+
+pdfminer can spin for a very long time on a malformed content stream and
+tesseract on a huge rendered page, and neither can be interrupted from a
+thread. The PDF extractor runs the pdfminer text fallback and the formula OCR
+pass through ``run_with_deadline`` (see utils/deadline.py), so a pathological
+PDF costs at most the stage deadline instead of the whole task timeout.
+
+The stages take a file path and page numbers rather than a parsed document
+so that their arguments and results stay picklable, and this module stays
+light enough to import in a spawned child.
+"""
+
+from io import BytesIO
+from typing import Dict, Iterable
+
+
+def pdfminer_page_texts(pdf_path: str, page_numbers: Iterable[int]) -> Dict[int, str]:
+    """Text of the given (0-based) pages with pdfminer, in a single parse
+
+    Returns:
+        Page number -> text
+    """
+    from pdfminer.high_level import extract_text
+
+    page_numbers = sorted(page_numbers)
+    texts = extract_text(str(pdf_path), page_numbers=page_numbers)
+    # pdfminer terminates every page with a form feed
+    parts = texts.split('\f')
+    if len(parts) >= len(page_numbers):
+        return {page_num: parts[i] for i, page_num in enumerate(page_numbers)}
+    return {page_num: extract_text(str(pdf_path), page_numbers=[page_num]) for page_num in page_numbers}
+
+
+def ocr_page_texts(pdf_path: str, page_numbers: Iterable[int], config: str = '--psm 6') -> Dict[int, str]:
+    """Tesseract text of the given (0-based) pages rendered at 1x
+
+    Returns:
+        Page number -> OCR text
+    """
+    import fitz  # PyMuPDF
+    import pytesseract
+    from PIL import Image
+
+    texts = {}
+    with fitz.open(str(pdf_path)) as doc:
+        for page_num in page_numbers:
+            pix = doc.load_page(page_num).get_pixmap()
+            if pix.n == 3 and not pix.alpha:
+                image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+            else:
+                image = Image.open(BytesIO(pix.tobytes("png")))
+            texts[page_num] = pytesseract.image_to_string(image, config=config)
+    return texts
@@ -0,0 +1,135 @@
+# utils/table_prefilter.py
+"""
+Cheap page prefilter for lattice table extraction.
+
+camelot's lattice flavour only finds tables whose cells are drawn with ruling
+lines, and every ``camelot.read_pdf`` call re-parses the PDF and renders the
+pages through Ghostscript. Most pages of a paper or book have no ruled table.
+``page.get_drawings()`` lists a page's vector paths without rendering
+anything; a page is a candidate only if it has enough long horizontal and
+vertical segments to form a grid, and camelot is given just those pages.
+``read_lattice_tables`` is the camelot call itself, kept in this light module
+so it can run in a deadline-bound child process (see utils/deadline.py).
+"""
+
+import time
+import logging
+from typing import Any, Dict, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Segments thinner than this (in points) are rulings; LaTeX draws \hline as a filled thin rectangle
+RULING_THICKNESS = 2.0
+# Shorter segments are glyph strokes, underlines of single words or tick marks
+MIN_RULING_LENGTH = 15.0
+# Outer frame plus a header rule; a plain figure border (2 + 2) does not qualify
+MIN_HORIZONTAL_RULINGS = 3
+MIN_VERTICAL_RULINGS = 2
+
+
+def _rect_rulings(x0: float, y0: float, x1: float, y1: float, min_length: float) -> Tuple[int, int]:
+    """Horizontal and vertical rulings contributed by an axis-aligned rectangle."""
+    width, height = abs(x1 - x0), abs(y1 - y0)
+    if height <= RULING_THICKNESS:
+        return (1 if width >= min_length else 0), 0
+    if width <= RULING_THICKNESS:
+        return 0, (1 if height >= min_length else 0)
+    # A stroked cell or frame: four edges
+    return (2 if width >= min_length else 0), (2 if height >= min_length else 0)
+
+
+def count_rulings(page, min_length: float = MIN_RULING_LENGTH) -> Tuple[int, int]:
+    """Count long horizontal and vertical line segments drawn on a PyMuPDF page
+
+    Args:
+        page: ``fitz.Page``
+        min_length: Minimum segment length in points
+
+    Returns:
+        tuple: (horizontal, vertical) ruling counts
+    """
+    horizontal = vertical = 0
+    for path in page.get_drawings():
+        for item in path.get('items', ()):
+            kind = item[0]
+            if kind == 'l':
+                p1, p2 = item[1], item[2]
+                dx, dy = abs(p2.x - p1.x), abs(p2.y - p1.y)
+                if dy <= RULING_THICKNESS and dx >= min_length:
+                    horizontal += 1
+                elif dx <= RULING_THICKNESS and dy >= min_length:
+                    vertical += 1
+            elif kind == 're':
+                rect = item[1]
+                h, v = _rect_rulings(rect.x0, rect.y0, rect.x1, rect.y1, min_length)
+                horizontal += h
+                vertical += v
+            elif kind == 'qu':
+                rect = item[1].rect
+                h, v = _rect_rulings(rect.x0, rect.y0, rect.x1, rect.y1, min_length)
+                horizontal += h
+                vertical += v
+    return horizontal, vertical
+
+
+def page_may_contain_table(page, min_horizontal: int = MIN_HORIZONTAL_RULINGS,
+                           min_vertical: int = MIN_VERTICAL_RULINGS) -> bool:
+    """True if the page has enough rulings for a lattice table."""
+    horizontal, vertical = count_rulings(page)
+    return horizontal >= min_horizontal and vertical >= min_vertical
+
+
+def find_table_pages(doc, page_numbers: Iterable[int]) -> Tuple[List[int], Dict[str, Any]]:
+    """Pages of an open PyMuPDF document worth passing to camelot's lattice flavour
+
+    Args:
+        doc: ``fitz.Document``
+        page_numbers: 0-based pages to consider
+
+    Returns:
+        Tuple of (candidate 0-based page numbers, prefilter stats for the metadata)
+    """
+    start = time.perf_counter()
+    page_numbers = list(page_numbers)
+    candidates = []
+    for page_num in page_numbers:
+        try:
+            if page_may_contain_table(doc.load_page(page_num)):
+                candidates.append(page_num)
+        except Exception as e:
+            # Unreadable drawings: let camelot decide
+            logger.debug(f"Ruling scan failed on page {page_num + 1}: {e}")
+            candidates.append(page_num)
+    skipped = len(page_numbers) - len(candidates)
+    stats = {
+        'pages_scanned': len(page_numbers),
+        'candidate_pages': [page_num + 1 for page_num in candidates],
+        'pages_skipped': skipped,
+        'skip_rate': round(skipped / len(page_numbers), 4) if page_numbers else 0.0,
+        'prefilter_seconds': round(time.perf_counter() - start, 4),
+    }
+    return candidates, stats
+
+
+def camelot_pages(page_numbers: Iterable[int]) -> str:
+    """camelot ``pages`` argument (1-based, comma-separated) for 0-based page numbers."""
+    return ','.join(str(page_num + 1) for page_num in page_numbers)
+
+
+def read_lattice_tables(pdf_path: str, pages: str, **camelot_kwargs) -> List[Dict[str, Any]]:
+    """Run camelot's lattice flavour and return the tables in picklable form
+
+    Args:
+        pdf_path: Path to the PDF
+        pages: camelot ``pages`` argument (see ``camelot_pages``)
+        **camelot_kwargs: Extra ``camelot.read_pdf`` arguments
+
+    Returns:
+        List of dicts with the table's page, accuracy, whitespace and DataFrame (``df``)
+    """
+    import camelot
+    tables = camelot.read_pdf(str(pdf_path), pages=pages, flavor='lattice', **camelot_kwargs)
+    return [
+        {'page': table.page, 'accuracy': float(table.accuracy), 'whitespace': float(table.whitespace), 'df': table.df}
+        for table in tables
+    ]
@@ -0,0 +1,179 @@
+# utils/work_journal.py
+"""
+Durable per-file work journal for the batch extractors.
+
+Every state change (queued, running, done, failed) is appended as one JSON
+line to ``<output_dir>/.cache/work_journal_<name>.jsonl`` and flushed to disk,
+so a run that crashes or is killed can be resumed: the next run replays the
+journal and only submits the files that did not finish. A ``run_complete``
+line marks a clean finish, after which the next run starts a fresh journal.
+"""
+
+import os
+import json
+import time
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIR_NAME = '.cache'
+DEFAULT_MAX_ATTEMPTS = 3
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class WorkJournal:
+    """Append-only JSONL journal of per-file extraction state."""
+
+    def __init__(self, output_dir: Union[str, Path], name: str,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, fsync: bool = True):
+        """Open (and replay) the journal for an extractor
+
+        Args:
+            output_dir: Extractor output directory; the journal lives in ``<output_dir>/.cache``
+            name: Journal name, one per extractor (e.g. 'pdf', 'nonpdf')
+            max_attempts: Files that failed this many times are not retried on resume
+            fsync: Force each entry to disk (survives power loss / VM preemption)
+        """
+        self.path = Path(output_dir) / JOURNAL_DIR_NAME / f"work_journal_{name}.jsonl"
+        self.max_attempts = max_attempts
+        self.fsync = fsync
+        self.states: Dict[str, Dict[str, Any]] = {}
+        self.resumed = False
+        self._started: Dict[str, float] = {}
+        self._replay()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, 'a', encoding='utf-8')
+
+    def _replay(self):
+        if not self.path.exists():
+            return
+        complete = False
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Last line of a journal cut off by a crash
+                    continue
+                if entry.get('event') == 'run_complete':
+                    complete = True
+                    continue
+                complete = False
+                if entry.get('event') == 'run_start':
+                    continue
+                state = self.states.setdefault(entry['path'], {'attempts': 0})
+                state.update({k: v for k, v in entry.items() if k not in ('path', 'ts')})
+        if complete:
+            # The previous run finished cleanly; keep it for reference and start over
+            os.replace(self.path, self.path.with_suffix('.jsonl.prev'))
+            self.states = {}
+        else:
+            for state in self.states.values():
+                if state.get('status') == RUNNING:
+                    # The interrupted run died (or was killed) while extracting this file; the attempt counts
+                    state['error'] = 'run stopped while the file was being extracted'
+            self.resumed = bool(self.states)
+            if self.resumed:
+                logger.info(f"Resuming interrupted run from {self.path} ({len(self.states)} files journaled)")
+
+    def _append(self, entry: Dict[str, Any], sync: bool = True):
+        entry['ts'] = datetime.now(timezone.utc).isoformat()
+        self._fh.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._fh.flush()
+        if self.fsync and sync:
+            os.fsync(self._fh.fileno())
+
+    def _set(self, file_path: str, status: str, sync: bool = True, **info):
+        key = os.path.abspath(str(file_path))
+        state = self.states.setdefault(key, {'attempts': 0})
+        state.update(info)
+        state['status'] = status
+        self._append({'path': key, 'status': status, **info}, sync=sync)
+
+    def get(self, file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        return self.states.get(os.path.abspath(str(file_path)))
+
+    def is_done(self, file_path: Union[str, Path]) -> bool:
+        """True if the file finished in an earlier attempt and neither it nor its outputs changed since."""
+        state = self.get(file_path)
+        if not state or state.get('status') != DONE:
+            return False
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        if state.get('size') != stat.st_size or state.get('mtime') != stat.st_mtime:
+            return False
+        return all(Path(p).exists() for p in state.get('outputs', []))
+
+    def is_exhausted(self, file_path: Union[str, Path]) -> bool:
+        """True if the file already used ``max_attempts`` attempts in this run.
+
+        A file still ``running`` when the journal is replayed was being extracted
+        when the run died, so a file that keeps killing the run is not retried forever.
+        """
+        state = self.get(file_path)
+        return bool(state and state.get('status') in (FAILED, RUNNING)
+                    and state.get('attempts', 0) >= self.max_attempts)
+
+    def begin_run(self):
+        """Record the start of a run whose files are admitted one at a time with ``admit``."""
+        self._append({'event': 'run_start', 'resumed': self.resumed}, sync=False)
+
+    def admit(self, file_path: str) -> bool:
+        """Queue a file of the current run unless it is already done or out of attempts
+
+        Returns:
+            bool: True if the file still needs work
+        """
+        if self.is_done(file_path) or self.is_exhausted(file_path):
+            return False
+        state = self.get(file_path)
+        if not state or state.get('status') != QUEUED:
+            self._set(file_path, QUEUED, sync=False)
+        return True
+
+    def mark_running(self, file_path: str):
+        state = self.get(file_path) or {}
+        self._started[os.path.abspath(str(file_path))] = time.time()
+        self._set(file_path, RUNNING, attempts=state.get('attempts', 0) + 1)
+
+    def _duration(self, file_path: str) -> Optional[float]:
+        started = self._started.pop(os.path.abspath(str(file_path)), None)
+        return round(time.time() - started, 3) if started is not None else None
+
+    def mark_done(self, file_path: str, outputs: Iterable[Union[str, Path]] = (), sync: bool = True, **info):
+        """Record a successful extraction together with the source size/mtime and outputs."""
+        try:
+            stat = os.stat(file_path)
+            info.update(size=stat.st_size, mtime=stat.st_mtime)
+        except OSError:
+            pass
+        self._set(file_path, DONE, sync=sync, duration=self._duration(file_path),
+                  outputs=[str(p) for p in outputs], error=None, **info)
+
+    def mark_failed(self, file_path: str, error: str = ''):
+        self._set(file_path, FAILED, duration=self._duration(file_path), error=error)
+
+    def complete(self):
+        """Mark the run as finished so the next run starts a fresh journal."""
+        self._append({'event': 'run_complete'})
+
+    def close(self):
+        if not self._fh.closed:
+            if self.fsync:
+                os.fsync(self._fh.fileno())
+            self._fh.close()
+
+    def __enter__(self) -> "WorkJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,511 @@
+# utils/worker_pool.py
+"""
+Process pool sized to the machine that can recycle workers and kill runaway tasks.
+
+``ProcessPoolExecutor`` cannot stop a single task. A hung or ballooning
+extraction holds its worker and its memory until the pool shuts down, and
+killing that worker breaks the whole pool. ``ManagedProcessPool`` talks to each
+worker over its own pipe, so the parent always knows which task a worker is
+running. That lets it:
+
+- recycle a worker after ``max_tasks_per_worker`` tasks, or when its RSS is
+  above ``max_worker_rss_mb`` after a task. Leaks from OCR, OpenCV or camelot
+  do not pile up.
+- kill a worker whose task runs past ``task_timeout`` seconds or grows past
+  ``task_max_rss_mb`` (counting the processes the task started), then start a
+  replacement. The task is requeued up to
+  ``task_retries`` times before its future fails with ``TaskTimeout`` or
+  ``TaskMemoryExceeded``.
+- record the peak RSS of every worker (``worker_stats``).
+
+``recommended_workers`` sizes a pool from the usable cores and the memory that
+is actually available, given the expected footprint of one worker. The pool is
+a ``concurrent.futures.Executor``: ``submit`` returns a Future.
+"""
+
+import os
+import time
+import atexit
+import pickle
+import logging
+import functools
+import threading
+import traceback
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, Future
+from multiprocessing.connection import wait as wait_connections
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import psutil
+
+from .deadline import kill_process_tree
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+# Memory left to the OS, the parent process and everything else on the machine
+DEFAULT_RESERVE_MB = 1024
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_TASK_RETRIES = 1
+# Seconds a retiring worker gets to exit before it is killed
+RETIRE_GRACE = 5.0
+
+
+class TaskTimeout(Exception):
+    """The task ran past the pool's time budget and its worker was killed."""
+
+
+class TaskMemoryExceeded(Exception):
+    """The task's worker grew past the pool's memory budget and was killed."""
+
+
+class WorkerCrashed(Exception):
+    """The worker process died while running the task."""
+
+
+class RemoteTraceback(Exception):
+    """Traceback of an exception raised in a worker (attached as ``__cause__``)."""
+
+    def __init__(self, tb: str):
+        super().__init__(tb)
+        self.tb = tb
+
+    def __str__(self):
+        return self.tb
+
+
+def usable_cpu_count() -> int:
+    """CPUs this process may run on (affinity-aware where the OS supports it)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def recommended_workers(worker_memory_mb: float, max_workers: Optional[int] = None,
+                        reserve_mb: float = DEFAULT_RESERVE_MB) -> int:
+    """Pool size that fits both the free cores and the available memory
+
+    Args:
+        worker_memory_mb: Expected peak RSS of one worker
+        max_workers: Optional upper bound
+        reserve_mb: Memory kept free for the parent and the rest of the system
+
+    Returns:
+        int: Number of workers (at least 1)
+    """
+    by_cpu = max(1, usable_cpu_count() - 1)  # one core stays with the parent
+    available_mb = psutil.virtual_memory().available / MB
+    by_memory = int(max(0.0, available_mb - reserve_mb) // max(1.0, worker_memory_mb))
+    workers = max(1, min(by_cpu, by_memory))
+    if max_workers:
+        workers = min(workers, max_workers)
+    return workers
+
+
+def task_memory_budget(num_workers: int, worker_memory_mb: float = 0.0,
+                       reserve_mb: float = DEFAULT_RESERVE_MB) -> float:
+    """Per-task RSS cap that lets every worker hit it at once without exhausting memory
+
+    Args:
+        num_workers: Pool size
+        worker_memory_mb: Expected footprint of one worker; the cap never drops below it
+        reserve_mb: Memory kept free for the parent and the rest of the system
+
+    Returns:
+        float: Cap in MB, the available memory less the reserve split across the workers
+    """
+    available_mb = psutil.virtual_memory().available / MB
+    share_mb = max(0.0, available_mb - reserve_mb) / max(1, num_workers)
+    if share_mb < worker_memory_mb:
+        logger.warning(f"{num_workers} workers of {worker_memory_mb:.0f} MB do not fit in "
+                       f"{available_mb:.0f} MB of available memory")
+        return float(worker_memory_mb)
+    return share_mb
+
+
+def _worker_main(conn, initializer: Optional[Callable], initargs: tuple):
+    """Worker loop: run (task_id, fn, args) messages until a None arrives."""
+    if initializer is not None:
+        initializer(*initargs)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        task_id, fn, args = task
+        try:
+            message = (task_id, True, fn(*args))
+        except Exception as e:
+            tb = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
+            message = (task_id, False, (e, tb))
+        try:
+            data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            data = pickle.dumps((task_id, False, (RuntimeError(f"Task result could not be pickled: {e}"), '')))
+        conn.send_bytes(data)
+
+
+class _Task:
+    __slots__ = ('task_id', 'fn', 'args', 'future', 'attempts')
+
+    def __init__(self, task_id: int, fn: Callable, args: tuple, future: Future):
+        self.task_id = task_id
+        self.fn = fn
+        self.args = args
+        self.future = future
+        self.attempts = 0
+
+
+class _Worker:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.ps = psutil.Process(process.pid)
+        self.task: Optional[_Task] = None
+        self.started = 0.0
+        self.tasks_done = 0
+        self.rss = 0
+        self.peak_rss = 0
+
+    def sample_rss(self) -> int:
+        """RSS of the worker plus its descendants (deadline-bound stages, Ghostscript renders)."""
+        try:
+            rss = self.ps.memory_info().rss
+            children = self.ps.children(recursive=True)
+        except psutil.Error:
+            return self.rss
+        for child in children:
+            try:
+                rss += child.memory_info().rss
+            except psutil.Error:
+                # Exited between listing and sampling
+                pass
+        self.rss = rss
+        self.peak_rss = max(self.peak_rss, self.rss)
+        return self.rss
+
+
+class ManagedProcessPool(Executor):
+    """Process pool with worker recycling and per-task time and memory budgets."""
+
+    def __init__(self, max_workers: int, initializer: Optional[Callable] = None, initargs: tuple = (),
+                 max_tasks_per_worker: Optional[int] = None, max_worker_rss_mb: Optional[float] = None,
+                 task_timeout: Optional[float] = None, task_max_rss_mb: Optional[float] = None,
+                 task_retries: int = DEFAULT_TASK_RETRIES, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 mp_context=None):
+        """Start the pool (workers are spawned when the first task arrives)
+
+        Args:
+            max_workers: Number of worker processes
+            initializer: Called with ``initargs`` once in every new worker
+            initargs: Arguments of ``initializer``
+            max_tasks_per_worker: Replace a worker after this many tasks (None: never)
+            max_worker_rss_mb: Replace a worker whose RSS is above this after a task (None: never)
+            task_timeout: Kill a worker whose task runs longer than this many seconds (None: no limit)
+            task_max_rss_mb: Kill a worker whose RSS passes this while running a task (None: no limit)
+            task_retries: Times a killed task is requeued before its future fails
+            poll_interval: Seconds between time and memory checks
+            mp_context: multiprocessing context (defaults to 'spawn', the only start method on Windows)
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.initializer = initializer
+        self.initargs = tuple(initargs)
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_worker_rss_mb = max_worker_rss_mb
+        self.task_timeout = task_timeout
+        self.task_max_rss_mb = task_max_rss_mb
+        self.task_retries = task_retries
+        self.poll_interval = poll_interval
+        self._ctx = mp_context or multiprocessing.get_context('spawn')
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._workers: Dict[int, _Worker] = {}
+        # Stopped or killed worker processes not yet joined: (process, time to kill it if still alive)
+        self._reaping: List[Tuple[Any, float]] = []
+        self._stats: Dict[int, Dict[str, Any]] = {}
+        self._next_id = 0
+        self._shutdown = False
+        self._woken = False
+        self._wakeup_reader, self._wakeup_writer = self._ctx.Pipe(duplex=False)
+        self.killed = {'timeout': 0, 'memory': 0, 'crashed': 0}
+        self.requeued = 0
+        self.recycled = 0
+        atexit.register(self._kill_workers)
+        self._thread = threading.Thread(target=self._manage, name='ManagedProcessPool', daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], defaults: Dict[str, Any],
+                    initializer: Optional[Callable] = None, initargs: tuple = ()) -> "ManagedProcessPool":
+        """Pool configured from processor-config keys, falling back to ``defaults``
+
+        Keys: num_workers (fixed size), worker_memory_mb and max_workers (adaptive size),
+        max_tasks_per_worker, max_worker_rss_mb, task_timeout, task_max_rss_mb, task_retries.
+        Without a task_max_rss_mb the cap is the available memory split across the workers
+        (``task_memory_budget``).
+        """
+        settings = dict(defaults)
+        settings.update({key: value for key, value in (config or {}).items() if value is not None})
+        num_workers = settings.get('num_workers') or recommended_workers(
+            settings.get('worker_memory_mb', 1024), settings.get('max_workers'))
+        task_max_rss_mb = settings.get('task_max_rss_mb') or task_memory_budget(
+            num_workers, settings.get('worker_memory_mb', 0.0))
+        logger.info(f"Starting {num_workers} extraction workers (task memory cap {task_max_rss_mb:.0f} MB)")
+        return cls(
+            num_workers,
+            initializer=initializer,
+            initargs=initargs,
+            max_tasks_per_worker=settings.get('max_tasks_per_worker'),
+            max_worker_rss_mb=settings.get('max_worker_rss_mb'),
+            task_timeout=settings.get('task_timeout'),
+            task_max_rss_mb=task_max_rss_mb,
+            task_retries=settings.get('task_retries', DEFAULT_TASK_RETRIES)
+        )
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        if kwargs:
+            fn = functools.partial(fn, **kwargs)
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            self._pending.append(_Task(self._next_id, fn, args, future))
+            self._next_id += 1
+        self._wake()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while self._pending:
+                    self._pending.popleft().future.cancel()
+        self._wake()
+        if wait:
+            self._thread.join()
+
+    def worker_stats(self) -> List[Dict[str, Any]]:
+        """Tasks run and peak RSS of every worker the pool has started."""
+        stats = dict(self._stats)
+        for pid, worker in list(self._workers.items()):
+            stats[pid] = self._worker_record(worker, 'running')
+        return [dict(pid=pid, **record) for pid, record in sorted(stats.items())]
+
+    def summary(self) -> Dict[str, Any]:
+        """Pool size, kills, requeues, recycles and per-worker stats (for run results)."""
+        workers = self.worker_stats()
+        return {
+            'max_workers': self.max_workers,
+            'workers_started': len(workers),
+            'peak_rss_mb': max((w['peak_rss_mb'] for w in workers), default=0.0),
+            'killed': dict(self.killed),
+            'requeued': self.requeued,
+            'recycled': self.recycled,
+            'workers': workers
+        }
+
+    # --- manager thread ---
+
+    def _wake(self):
+        with self._lock:
+            if self._woken:
+                return
+            self._woken = True
+        self._wakeup_writer.send_bytes(b'.')
+
+    def _manage(self):
+        try:
+            while True:
+                with self._lock:
+                    if self._shutdown and not self._pending and not any(w.task for w in self._workers.values()):
+                        break
+                self._dispatch()
+                waitables = [self._wakeup_reader]
+                for worker in self._workers.values():
+                    waitables.extend((worker.conn, worker.process.sentinel))
+                ready = wait_connections(waitables, timeout=self.poll_interval)
+                if self._wakeup_reader in ready:
+                    with self._lock:
+                        while self._wakeup_reader.poll():
+                            self._wakeup_reader.recv_bytes()
+                        self._woken = False
+                for worker in list(self._workers.values()):
+                    if worker.conn in ready:
+                        self._receive(worker)
+                self._check_workers()
+                self._reap()
+        except Exception as e:
+            logger.exception(f"Worker pool manager failed: {e}")
+            with self._lock:
+                tasks = list(self._pending)
+                self._pending.clear()
+            tasks.extend(w.task for w in self._workers.values() if w.task)
+            for task in tasks:
+                if not task.future.done():
+                    task.future.set_exception(e)
+        finally:
+            self._stop_workers()
+
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(target=_worker_main, args=(child_conn, self.initializer, self.initargs),
+                                    name='ExtractionWorker')
+        process.start()
+        child_conn.close()
+        self._workers[process.pid] = _Worker(process, parent_conn)
+
+    def _dispatch(self):
+        with self._lock:
+            has_work = bool(self._pending)
+        if not has_work:
+            return
+        while len(self._workers) < self.max_workers:
+            self._spawn()
+        for worker in list(self._workers.values()):
+            if worker.task is not None:
+                continue
+            with self._lock:
+                if not self._pending:
+                    return
+                task = self._pending.popleft()
+            if task.attempts == 0 and not task.future.set_running_or_notify_cancel():
+                continue
+            try:
+                worker.conn.send((task.task_id, task.fn, task.args))
+            except Exception as e:
+                task.future.set_exception(e)
+                continue
+            worker.task = task
+            worker.started = time.monotonic()
+
+    def _receive(self, worker: _Worker):
+        try:
+            task_id, ok, payload = pickle.loads(worker.conn.recv_bytes())
+        except (EOFError, OSError):
+            # The worker died; _check_workers deals with its task
+            return
+        except Exception as e:
+            task_id, ok, payload = (worker.task.task_id if worker.task else None), False, (e, '')
+        task, worker.task = worker.task, None
+        worker.tasks_done += 1
+        worker.sample_rss()
+        if task is not None and task.task_id == task_id:
+            if ok:
+                task.future.set_result(payload)
+            else:
+                exc, tb = payload
+                if tb:
+                    exc.__cause__ = RemoteTraceback(tb)
+                task.future.set_exception(exc)
+        if self.max_tasks_per_worker and worker.tasks_done >= self.max_tasks_per_worker:
+            self._retire(worker, 'max_tasks')
+        elif self.max_worker_rss_mb and worker.rss > self.max_worker_rss_mb * MB:
+            logger.info(f"Recycling worker {worker.process.pid} at {worker.rss / MB:.0f} MB RSS")
+            self._retire(worker, 'max_rss')
+
+    def _check_workers(self):
+        now = time.monotonic()
+        for worker in list(self._workers.values()):
+            if not worker.process.is_alive():
+                self._discard(worker, 'crashed')
+                if worker.task is not None:
+                    self.killed['crashed'] += 1
+                    logger.warning(f"Worker {worker.process.pid} died (exit code {worker.process.exitcode}) while running a task")
+                    self._fail_or_requeue(worker.task, WorkerCrashed(
+                        f"Worker exited with code {worker.process.exitcode} while running the task"))
+                continue
+            if worker.task is None:
+                continue
+            worker.sample_rss()
+            elapsed = now - worker.started
+            if self.task_timeout and elapsed > self.task_timeout:
+                self.killed['timeout'] += 1
+                self._kill(worker, 'timeout', TaskTimeout(f"Task exceeded its {self.task_timeout:.0f}s time budget"))
+            elif self.task_max_rss_mb and worker.rss > self.task_max_rss_mb * MB:
+                self.killed['memory'] += 1
+                self._kill(worker, 'memory', TaskMemoryExceeded(
+                    f"Worker reached {worker.rss / MB:.0f} MB RSS (budget {self.task_max_rss_mb:.0f} MB)"))
+
+    def _kill(self, worker: _Worker, reason: str, exc: Exception):
+        logger.warning(f"Killing worker {worker.process.pid}: {exc}")
+        # Take down stage processes and Ghostscript renders the task started, not just the worker
+        kill_process_tree(worker.process.pid, wait=False)
+        self._discard(worker, reason)
+        self._reaping.append((worker.process, time.monotonic()))
+        if worker.task is not None:
+            self._fail_or_requeue(worker.task, exc)
+
+    def _fail_or_requeue(self, task: _Task, exc: Exception):
+        if task.attempts < self.task_retries:
+            task.attempts += 1
+            self.requeued += 1
+            with self._lock:
+                self._pending.appendleft(task)
+        else:
+            task.future.set_exception(exc)
+
+    def _retire(self, worker: _Worker, reason: str):
+        self.recycled += 1
+        try:
+            worker.conn.send(None)
+        except OSError:
+            pass
+        self._discard(worker, reason)
+        self._reaping.append((worker.process, time.monotonic() + RETIRE_GRACE))
+
+    def _reap(self):
+        # Join exited workers without blocking the loop; kill those past their grace period
+        now = time.monotonic()
+        still_running = []
+        for process, kill_at in self._reaping:
+            if not process.is_alive():
+                process.join(0)
+                continue
+            if now >= kill_at:
+                process.kill()
+            still_running.append((process, kill_at))
+        self._reaping = still_running
+
+    @staticmethod
+    def _worker_record(worker: _Worker, end: str) -> Dict[str, Any]:
+        return {'tasks': worker.tasks_done, 'peak_rss_mb': round(worker.peak_rss / MB, 1), 'end': end}
+
+    def _discard(self, worker: _Worker, reason: str):
+        self._workers.pop(worker.process.pid, None)
+        self._stats[worker.process.pid] = self._worker_record(worker, reason)
+        try:
+            worker.conn.close()
+        except OSError:
+            pass
+
+    def _stop_workers(self):
+        for worker in list(self._workers.values()):
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in list(self._workers.values()):
+            worker.process.join(RETIRE_GRACE)
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join(RETIRE_GRACE)
+            self._discard(worker, 'shutdown')
+        for process, _ in self._reaping:
+            process.join(RETIRE_GRACE)
+            if process.is_alive():
+                process.kill()
+                process.join(RETIRE_GRACE)
+        self._reaping = []
+        atexit.unregister(self._kill_workers)
+
+    def _kill_workers(self):
+        # Interpreter exit without shutdown(): do not leave workers blocked on their pipes
+        processes = [worker.process for worker in list(self._workers.values())]
+        processes.extend(process for process, _ in self._reaping)
+        for process in processes:
+            if process.is_alive():
+                process.kill()
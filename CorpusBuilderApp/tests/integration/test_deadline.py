@@ -0,0 +1,128 @@
+# tests/test_deadline.py
+import os
+import sys
+import time
+import subprocess
+
+import psutil
+import pytest
+
+from shared_tools.utils.deadline import run_with_deadline, kill_process_tree, StageTimeout, StageCrashed
+
+
+# Tasks and stages run in other processes, so they live at module level
+
+def sleep_for(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def raise_value_error():
+    raise ValueError("bad input")
+
+
+def crash():
+    os._exit(3)
+
+
+class NotRebuildableError(Exception):
+    # Pickles, but unpickling calls __init__ with the message only (like pytesseract's errors)
+    def __init__(self):
+        super().__init__("tesseract is not installed")
+
+
+def raise_not_rebuildable():
+    raise NotRebuildableError()
+
+
+def start_child_and_sleep(pid_file, seconds):
+    # Stands in for camelot starting Ghostscript
+    child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(120)'])
+    with open(pid_file, 'w') as f:
+        f.write(str(child.pid))
+    time.sleep(seconds)
+    return child.pid
+
+
+def _gone(pid):
+    try:
+        return psutil.Process(pid).status() == psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return True
+
+
+def _read_pid(pid_file, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(pid_file) and open(pid_file).read():
+            return int(open(pid_file).read())
+        time.sleep(0.05)
+    raise AssertionError(f"{pid_file} was not written")
+
+
+class TestRunWithDeadline:
+    """Stage deadlines enforced by killing the stage process tree"""
+
+    def test_returns_result_within_deadline(self):
+        """Test a stage that finishes in time returns its result"""
+        assert run_with_deadline(sleep_for, 0.1, timeout=30, stage='sleep') == 0.1
+
+    def test_stage_missing_deadline_is_killed_with_its_subprocess(self, tmp_path):
+        """Test a stage past its deadline raises StageTimeout and its subprocess is killed"""
+        pid_file = str(tmp_path / 'child.pid')
+        start = time.monotonic()
+        with pytest.raises(StageTimeout) as excinfo:
+            run_with_deadline(start_child_and_sleep, pid_file, 60, timeout=2, stage='tables')
+
+        assert time.monotonic() - start < 15
+        assert excinfo.value.stage == 'tables'
+        assert _gone(_read_pid(pid_file))
+
+    def test_stage_errors_are_reraised(self):
+        """Test an exception raised by the stage reaches the caller"""
+        with pytest.raises(ValueError):
+            run_with_deadline(raise_value_error, timeout=30)
+
+    def test_stage_crash(self):
+        """Test a stage process that dies raises StageCrashed"""
+        with pytest.raises(StageCrashed):
+            run_with_deadline(crash, timeout=30)
+
+    def test_unrebuildable_stage_error(self):
+        """Test an exception that cannot be unpickled reaches the caller as StageCrashed"""
+        with pytest.raises(StageCrashed) as excinfo:
+            run_with_deadline(raise_not_rebuildable, timeout=30)
+
+        assert 'NotRebuildableError: tesseract is not installed' in str(excinfo.value)
+
+    def test_pdfminer_stage_runs_under_deadline(self, tmp_path):
+        """Test the pdfminer fallback stage returns the requested pages from its child process"""
+        fitz = pytest.importorskip("fitz")
+        pytest.importorskip("pdfminer")
+        from shared_tools.utils.pdf_stages import pdfminer_page_texts
+        pdf_path = str(tmp_path / 'sample.pdf')
+        doc = fitz.open()
+        for page_num in range(3):
+            doc.new_page().insert_text((72, 72), f"Page {page_num} volatility", fontsize=12)
+        doc.save(pdf_path)
+        doc.close()
+
+        texts = run_with_deadline(pdfminer_page_texts, pdf_path, [2, 0], timeout=60, stage='pdfminer')
+
+        assert sorted(texts) == [0, 2]
+        assert 'Page 2 volatility' in texts[2]
+
+    def test_kill_process_tree(self):
+        """Test kill_process_tree kills a process and its descendants"""
+        parent = subprocess.Popen([
+            sys.executable, '-c',
+            'import subprocess, sys, time; '
+            'child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(120)"]); '
+            'print(child.pid, flush=True); time.sleep(120)'
+        ], stdout=subprocess.PIPE, text=True)
+        child_pid = int(parent.stdout.readline())
+
+        kill_process_tree(parent.pid)
+        parent.wait(timeout=10)
+
+        assert _gone(child_pid)
@@ -0,0 +1,108 @@
+# tests/test_fred_extraction.py
+import json
+import types
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("pyarrow")
+from shared_tools.collectors.fred_collector import FREDCollector
+from shared_tools.utils.fred_store import SERIES_INDEX_FILENAME, iter_series_documents, is_series_index
+
+SERIES = {
+    'DGS10': {
+        'info': {'id': 'DGS10', 'title': '10-Year Treasury Constant Maturity Rate', 'units': 'Percent',
+                 'frequency': 'Daily', 'last_updated': '2024-01-03 15:18:03-06', 'notes': ''},
+        'observations': [{'date': f'2023-12-{day:02d}', 'value': f'{3.8 + day / 100:.2f}'} for day in range(1, 29)]
+    },
+    'VIXCLS': {
+        'info': {'id': 'VIXCLS', 'title': 'CBOE Volatility Index: VIX', 'units': 'Index',
+                 'frequency': 'Daily', 'last_updated': '2024-01-03 08:36:02-06', 'notes': ''},
+        'observations': [{'date': f'2023-12-{day:02d}', 'value': '.' if day == 25 else f'{12 + day / 10:.2f}'}
+                         for day in range(1, 29)]
+    }
+}
+
+
+class _Config:
+    """Minimal project config: local directories, no shared limiter, cache or download index"""
+
+    def __init__(self, root: Path):
+        self.raw_data_dir = root / 'raw'
+        self.log_dir = root / 'logs'
+        self.domain_configs = {}
+        self.settings = {
+            'collectors.shared_rate_limits': False,
+            'collectors.http_cache': False,
+            'collectors.download_index': False
+        }
+
+    def get(self, key, default=None):
+        return self.settings.get(key, default)
+
+
+def _fake_api_request(self, endpoint, params=None):
+    series = SERIES[params['series_id']]
+    if endpoint == 'series':
+        return {'seriess': [series['info']]}
+    if endpoint == 'series/observations':
+        return {'observations': series['observations']}
+    return None
+
+
+@pytest.fixture
+def fred_dir(tmp_path):
+    """Collect the two test series with the API mocked out"""
+    with patch.object(FREDCollector, 'api_request', _fake_api_request):
+        collector = FREDCollector(_Config(tmp_path), api_key='test_api_key')
+        saved = collector.collect(series_ids=list(SERIES))
+    assert {item['series_id'] for item in saved} == set(SERIES)
+    return collector.fred_dir
+
+
+class TestFredExtraction:
+    """FRED series stored as Parquet reach the non-PDF extractor as one document per series"""
+
+    def test_collected_series_read_back_per_series(self, fred_dir):
+        """Test each series in a domain file becomes one document described by the index"""
+        data_files = sorted(p for p in fred_dir.glob('*.parquet') if not is_series_index(p))
+        assert (fred_dir / SERIES_INDEX_FILENAME).exists()
+        assert {p.stem for p in data_files} == {'risk_management', 'valuation_models'}
+
+        documents = {series_id: (text, info) for path in data_files
+                     for series_id, text, info in iter_series_documents(path)}
+
+        assert set(documents) == set(SERIES)
+        text, info = documents['DGS10']
+        assert text.startswith('FRED series DGS10: 10-Year Treasury Constant Maturity Rate')
+        assert 'Units: Percent' in text
+        assert '2023-12-28,4.08' in text
+        assert info['domain'] == 'valuation_models'
+        assert info['observation_count'] == 28
+        # FRED's '.' missing marker is stored as a missing value
+        assert '2023-12-25,\n' in documents['VIXCLS'][0]
+
+    def test_nonpdf_extractor_writes_one_output_per_series(self, fred_dir, tmp_path, monkeypatch):
+        """Test the batch extractor extracts each series and skips the series index"""
+        extractor = pytest.importorskip("shared_tools.processors.batch_nonpdf_extractor_enhanced")
+        # Worker scratch directories are created relative to the working directory off Windows
+        monkeypatch.chdir(tmp_path)
+        output_dir = tmp_path / 'processed'
+        args = types.SimpleNamespace(
+            output_dir=str(output_dir), verbose=False, auto_normalize=False, lang_conf_threshold=0.70,
+            mixed_lang_ratio=0.30, corruption_thresholds=None, mt_config=None, relevance_threshold=30
+        )
+
+        status = extractor.extract_and_write_nonpdf(str(fred_dir / 'valuation_models.parquet'), args)
+
+        assert status is not None
+        assert status['documents'] == 1
+        txt_path, json_path = (Path(p) for p in status['outputs'])
+        assert txt_path.name == 'FRED_DGS10.txt'
+        assert 'date,value' in txt_path.read_text(encoding='utf-8')
+        metadata = json.loads(json_path.read_text(encoding='utf-8'))
+        assert metadata['domain'] == 'valuation_models'
+        assert metadata['fred_series']['series_id'] == 'DGS10'
+        assert extractor.SUPPORTED_EXTENSIONS['.parquet'] == 'parquet'
+        assert extractor.is_series_index(fred_dir / SERIES_INDEX_FILENAME)
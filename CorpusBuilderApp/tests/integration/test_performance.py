@@ -104,3 +104,24 @@ class TestPerformance:
             assert processing_time < 5.0  # Should complete in reasonable time
             
             os.unlink(tmp_file.name)
+    
+    @pytest.mark.performance
+    def test_batch_minhash_matches_datasketch(self):
+        """Test vectorised MinHash reproduces datasketch signatures and is faster"""
+        pytest.importorskip("datasketch")
+        from shared_tools.utils.batch_minhash import benchmark
+        
+        results = benchmark(num_docs=5, doc_chars=20000)
+        
+        assert results['identical']
+        assert results['batch_seconds'] < results['datasketch_seconds']
+    
+    @pytest.mark.performance
+    def test_domain_classifier_matcher_matches_per_keyword_scan(self):
+        """Test the one-pass keyword matcher reproduces the per-keyword regex scores and is faster"""
+        from shared_tools.processors.domain_classifier import benchmark
+        
+        results = benchmark(num_docs=3, doc_chars=100000)
+        
+        assert results['identical']
+        assert results['matcher_seconds'] < results['per_keyword_seconds']
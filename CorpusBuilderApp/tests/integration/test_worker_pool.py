@@ -0,0 +1,140 @@
+# tests/test_worker_pool.py
+import os
+import sys
+import time
+import subprocess
+
+import psutil
+import pytest
+
+from shared_tools.utils.worker_pool import (
+    ManagedProcessPool, TaskTimeout, TaskMemoryExceeded, WorkerCrashed, RemoteTraceback
+)
+
+MB = 1024 * 1024
+
+
+# Tasks and stages run in other processes, so they live at module level
+
+def get_pid(_=None):
+    return os.getpid()
+
+
+def sleep_for(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def raise_value_error():
+    raise ValueError("bad input")
+
+
+def crash():
+    os._exit(3)
+
+
+def hold_memory(megabytes, seconds):
+    block = bytearray(megabytes * MB)
+    time.sleep(seconds)
+    return len(block)
+
+
+def child_holds_memory(megabytes, seconds):
+    # The memory sits in a subprocess, as with a Ghostscript render
+    child = subprocess.Popen([sys.executable, '-c', f'import time; block = bytearray({megabytes} * {MB}); time.sleep(120)'])
+    time.sleep(seconds)
+    child.kill()
+    return child.pid
+
+
+def start_child_and_sleep(pid_file, seconds):
+    # Stands in for camelot starting Ghostscript
+    child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(120)'])
+    with open(pid_file, 'w') as f:
+        f.write(str(child.pid))
+    time.sleep(seconds)
+    return child.pid
+
+
+def _gone(pid):
+    try:
+        return psutil.Process(pid).status() == psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return True
+
+
+def _read_pid(pid_file, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(pid_file) and open(pid_file).read():
+            return int(open(pid_file).read())
+        time.sleep(0.05)
+    raise AssertionError(f"{pid_file} was not written")
+
+
+class TestManagedProcessPool:
+    """Worker recycling and per-task time and memory budgets"""
+
+    def test_recycles_workers_after_max_tasks(self):
+        """Test a worker is replaced after max_tasks_per_worker tasks"""
+        with ManagedProcessPool(1, max_tasks_per_worker=2, poll_interval=0.1) as pool:
+            pids = [pool.submit(get_pid).result(timeout=60) for _ in range(5)]
+        summary = pool.summary()
+
+        assert len(set(pids)) == 3
+        assert summary['recycled'] >= 2
+        assert summary['workers_started'] == 3
+
+    def test_task_timeout_kills_worker_and_its_children(self, tmp_path):
+        """Test a task past task_timeout fails with TaskTimeout and its subprocesses are killed"""
+        pid_file = str(tmp_path / 'child.pid')
+        with ManagedProcessPool(1, task_timeout=2, task_retries=0, poll_interval=0.1) as pool:
+            start = time.monotonic()
+            future = pool.submit(start_child_and_sleep, pid_file, 60)
+            with pytest.raises(TaskTimeout):
+                future.result(timeout=30)
+            elapsed = time.monotonic() - start
+            # The pool keeps working with a replacement worker
+            assert pool.submit(sleep_for, 0).result(timeout=60) == 0
+        summary = pool.summary()
+
+        assert elapsed < 15
+        assert _gone(_read_pid(pid_file))
+        assert summary['killed']['timeout'] == 1
+
+    def test_killed_task_is_requeued(self):
+        """Test a crashed task is retried task_retries times before WorkerCrashed"""
+        with ManagedProcessPool(1, task_retries=1, poll_interval=0.1) as pool:
+            future = pool.submit(crash)
+            with pytest.raises(WorkerCrashed):
+                future.result(timeout=60)
+        summary = pool.summary()
+
+        assert summary['requeued'] == 1
+        assert summary['killed']['crashed'] == 2
+
+    def test_task_memory_budget(self):
+        """Test a task growing past task_max_rss_mb fails with TaskMemoryExceeded"""
+        with ManagedProcessPool(1, task_max_rss_mb=150, task_retries=0, poll_interval=0.1) as pool:
+            future = pool.submit(hold_memory, 400, 30)
+            with pytest.raises(TaskMemoryExceeded):
+                future.result(timeout=60)
+        assert pool.summary()['killed']['memory'] == 1
+
+    def test_task_memory_budget_counts_subprocesses(self):
+        """Test memory held by a task's subprocesses counts against task_max_rss_mb"""
+        with ManagedProcessPool(1, task_max_rss_mb=150, task_retries=0, poll_interval=0.1) as pool:
+            future = pool.submit(child_holds_memory, 400, 30)
+            with pytest.raises(TaskMemoryExceeded):
+                future.result(timeout=60)
+        assert pool.summary()['killed']['memory'] == 1
+
+    def test_task_exception_carries_remote_traceback(self):
+        """Test an exception raised in a worker reaches the caller with the worker traceback"""
+        with ManagedProcessPool(1, poll_interval=0.1) as pool:
+            future = pool.submit(raise_value_error)
+            with pytest.raises(ValueError) as excinfo:
+                future.result(timeout=60)
+
+        assert isinstance(excinfo.value.__cause__, RemoteTraceback)
+        assert 'raise_value_error' in str(excinfo.value.__cause__)
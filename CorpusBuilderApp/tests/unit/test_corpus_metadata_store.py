@@ -0,0 +1,69 @@
+# File: tests/unit/test_corpus_metadata_store.py
+
+import json
+import sqlite3
+import multiprocessing
+
+from shared_tools.utils.corpus_metadata_store import (
+    CorpusMetadataStore, STORE_RELATIVE_PATH, prepare_store, record_output_metadata
+)
+
+
+def _write_metadata(root, names):
+    # Runs in a separate process, like an extractor worker
+    for name in names:
+        json_path = root / '_extracted' / f"{name}.json"
+        metadata = {'domain': 'risk_management', 'token_count': 100}
+        json_path.write_text(json.dumps(metadata), encoding='utf-8')
+        record_output_metadata(json_path, metadata)
+
+
+def _run_writers(root, workers=4, per_worker=25):
+    ctx = multiprocessing.get_context('spawn')
+    processes = [
+        ctx.Process(target=_write_metadata, args=(root, [f"doc_{w}_{i}" for i in range(per_worker)]))
+        for w in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(120)
+    return workers * per_worker
+
+
+class TestCorpusMetadataStore:
+    """Unit tests for concurrent writes to the corpus metadata table."""
+
+    def test_concurrent_writers_on_prepared_store(self, tmp_path):
+        """Test rows written by several worker processes all reach the table."""
+        (tmp_path / '_extracted').mkdir()
+        prepare_store(tmp_path)
+
+        expected = _run_writers(tmp_path)
+
+        with CorpusMetadataStore(tmp_path, migrate=False) as store:
+            assert len(store.read_dataframe()) == expected
+
+    def test_concurrent_writers_on_fresh_store(self, tmp_path):
+        """Test workers creating the table on a fresh store do not drop each other's rows."""
+        (tmp_path / '_extracted').mkdir()
+
+        expected = _run_writers(tmp_path)
+
+        with CorpusMetadataStore(tmp_path) as store:
+            assert len(store.read_dataframe()) == expected
+
+    def test_outdated_schema_is_rebuilt(self, tmp_path):
+        """Test a table from an older schema version is replaced when the store is prepared."""
+        store_path = tmp_path / STORE_RELATIVE_PATH
+        store_path.parent.mkdir(parents=True)
+        conn = sqlite3.connect(str(store_path))
+        conn.execute("CREATE TABLE documents (file_path TEXT PRIMARY KEY)")
+        conn.commit()
+        conn.close()
+
+        prepare_store(tmp_path)
+
+        with CorpusMetadataStore(tmp_path, migrate=False) as store:
+            columns = [row[1] for row in store.conn.execute("PRAGMA table_info(documents)")]
+        assert 'json_mtime_ns' in columns
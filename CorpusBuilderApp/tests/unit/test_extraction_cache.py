@@ -0,0 +1,68 @@
+# File: tests/unit/test_extraction_cache.py
+
+import os
+
+from shared_tools.utils.extraction_cache import ExtractionCache, reusable
+from shared_tools.utils.extractor_utils import calculate_hash
+
+
+def _extracted(tmp_path, name, content):
+    """An input file plus the outputs a previous run wrote for it."""
+    source = tmp_path / 'in' / name
+    source.parent.mkdir(exist_ok=True)
+    source.write_text(content)
+    outputs = [tmp_path / 'out' / f"{source.stem}.txt", tmp_path / 'out' / f"{source.stem}.json"]
+    outputs[0].parent.mkdir(exist_ok=True)
+    for output in outputs:
+        output.write_text(name)
+    return source, [str(output) for output in outputs]
+
+
+class TestExtractionCache:
+    """Unit tests for reusing extraction outputs across runs."""
+
+    def test_touched_unchanged_file_is_reused_after_worker_hash(self, tmp_path):
+        """Test a file whose mtime changed misses the stat check but is reused once its hash matches."""
+        source, outputs = _extracted(tmp_path, 'paper.txt', 'same content')
+        cache = ExtractionCache(tmp_path / 'out', 'nonpdf', 'fp')
+        cache.record(source, outputs, file_hash=calculate_hash(str(source)))
+        cache.save()
+
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+        cache = ExtractionCache(tmp_path / 'out', 'nonpdf', 'fp')
+        assert cache.lookup(source) is None
+        assert cache.known_hash(source) is None
+        entry = cache.snapshot(source)
+        # What the worker does before extracting
+        assert reusable(entry, calculate_hash(str(source)))
+        assert entry['outputs'] == outputs
+
+        source.write_text('edited content')
+        assert not reusable(entry, calculate_hash(str(source)))
+
+    def test_duplicate_content_keeps_outputs_per_path(self, tmp_path):
+        """Test two files with the same content each hit with their own outputs."""
+        first, first_outputs = _extracted(tmp_path, 'a.txt', 'duplicate')
+        second, second_outputs = _extracted(tmp_path, 'b.txt', 'duplicate')
+        cache = ExtractionCache(tmp_path / 'out', 'nonpdf', 'fp')
+        cache.record(first, first_outputs, file_hash=calculate_hash(str(first)), hit=False)
+        cache.record(second, second_outputs, file_hash=calculate_hash(str(second)), hit=False)
+        cache.save()
+
+        cache = ExtractionCache(tmp_path / 'out', 'nonpdf', 'fp')
+        assert cache.lookup(first)['outputs'] == first_outputs
+        assert cache.lookup(second)['outputs'] == second_outputs
+        assert cache.stats() == {'hits': 2, 'misses': 0}
+
+    def test_changed_fingerprint_misses(self, tmp_path):
+        """Test entries written under another config or code version are not reused."""
+        source, outputs = _extracted(tmp_path, 'paper.txt', 'content')
+        cache = ExtractionCache(tmp_path / 'out', 'nonpdf', 'old')
+        cache.record(source, outputs, file_hash=calculate_hash(str(source)))
+        cache.save()
+
+        cache = ExtractionCache(tmp_path / 'out', 'nonpdf', 'new')
+        assert cache.lookup(source) is None
+        assert cache.snapshot(source) is None
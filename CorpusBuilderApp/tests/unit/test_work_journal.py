@@ -0,0 +1,47 @@
+# File: tests/unit/test_work_journal.py
+
+from shared_tools.utils.work_journal import WorkJournal
+
+
+class TestWorkJournal:
+    """Unit tests for resuming interrupted runs from the work journal."""
+
+    def _interrupted_run(self, output_dir, file_path):
+        """A run that dies while extracting file_path (no mark_done/complete)."""
+        journal = WorkJournal(output_dir, 'pdf', max_attempts=2)
+        journal.begin_run()
+        admitted = journal.admit(file_path)
+        if admitted:
+            journal.mark_running(file_path)
+        journal.close()
+        return admitted
+
+    def test_file_left_running_is_retried_up_to_max_attempts(self, tmp_path):
+        """Test a file that keeps killing the run stops being admitted after max_attempts."""
+        source = tmp_path / 'killer.pdf'
+        source.write_bytes(b'%PDF-1.4')
+
+        assert self._interrupted_run(tmp_path, str(source))
+        assert self._interrupted_run(tmp_path, str(source))
+        assert not self._interrupted_run(tmp_path, str(source))
+
+        state = WorkJournal(tmp_path, 'pdf', max_attempts=2).get(str(source))
+        assert state['attempts'] == 2
+        assert state['error'] == 'run stopped while the file was being extracted'
+
+    def test_done_file_is_not_readmitted(self, tmp_path):
+        """Test a file finished before the interruption is skipped on resume."""
+        source = tmp_path / 'paper.pdf'
+        source.write_bytes(b'%PDF-1.4')
+        output = tmp_path / 'paper.txt'
+        output.write_text('text')
+        journal = WorkJournal(tmp_path, 'pdf')
+        journal.begin_run()
+        journal.admit(str(source))
+        journal.mark_running(str(source))
+        journal.mark_done(str(source), [output])
+        journal.close()
+
+        resumed = WorkJournal(tmp_path, 'pdf')
+        assert resumed.resumed
+        assert not resumed.admit(str(source))